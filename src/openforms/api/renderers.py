@@ -0,0 +1,85 @@
+"""
+JSON renderer with support for pre-serialized JSON fragments.
+
+Parts of a response that are identical for every user (such as the configuration of
+most form definitions) can be serialized once and cached. Embedding them in the
+response data as :class:`RawJSON` makes the renderer splice in the cached bytes as-is,
+skipping the (expensive) camelization and encoding of these parts.
+"""
+import json
+import secrets
+from functools import partial
+
+from djangorestframework_camel_case.render import CamelCaseJSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+__all__ = ["RawJSON", "JSONRenderer"]
+
+
+class RawJSON:
+    """
+    A pre-serialized (and camelized) JSON document.
+
+    Produce the payload with :meth:`JSONRenderer.render` so that it is encoded the
+    same way as the rest of the response.
+    """
+
+    __slots__ = ("payload",)
+
+    def __init__(self, payload: bytes):
+        self.payload = payload
+
+    def __repr__(self):
+        return f"RawJSON({self.payload!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, RawJSON):
+            return NotImplemented
+        return self.payload == other.payload
+
+    def loads(self):
+        return json.loads(self.payload)
+
+
+class RawJSONEncoder(JSONEncoder):
+    def __init__(self, *args, fragments: dict, placeholder_prefix: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fragments = fragments
+        self.placeholder_prefix = placeholder_prefix
+
+    def default(self, obj):
+        if isinstance(obj, RawJSON):
+            placeholder = f"{self.placeholder_prefix}{len(self.fragments)}"
+            self.fragments[placeholder] = obj.payload
+            return placeholder
+        return super().default(obj)
+
+
+class JSONRenderer(CamelCaseJSONRenderer):
+    """
+    Camel-casing JSON renderer which embeds :class:`RawJSON` fragments verbatim.
+
+    :class:`RawJSON` instances are not dicts or iterables, so they are left alone by
+    the camelization. During encoding they are replaced by a unique placeholder
+    string, which is substituted with the fragment bytes afterwards.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        fragments = {}
+        # the prefix is unique per render, so it can't clash with actual data
+        placeholder_prefix = f"__raw_json_{secrets.token_hex(16)}_"
+        self.encoder_class = partial(
+            RawJSONEncoder, fragments=fragments, placeholder_prefix=placeholder_prefix
+        )
+        try:
+            ret = super().render(
+                data,
+                accepted_media_type=accepted_media_type,
+                renderer_context=renderer_context,
+            )
+        finally:
+            del self.encoder_class
+
+        for placeholder, payload in fragments.items():
+            ret = ret.replace(f'"{placeholder}"'.encode(), payload, 1)
+        return ret
@@ -0,0 +1,28 @@
+import json
+
+from django.test import SimpleTestCase
+
+from ..renderers import JSONRenderer, RawJSON
+
+
+class JSONRendererTests(SimpleTestCase):
+    def test_raw_json_is_embedded(self):
+        fragment = RawJSON(JSONRenderer().render({"some_key": ["a", "\u2028"]}))
+
+        rendered = JSONRenderer().render({"first_key": fragment, "other": [fragment]})
+
+        self.assertEqual(
+            json.loads(rendered),
+            {
+                "firstKey": {"someKey": ["a", "\u2028"]},
+                "other": [{"someKey": ["a", "\u2028"]}],
+            },
+        )
+        self.assertNotIn(b"__raw_json_", rendered)
+
+    def test_raw_json_fragment_is_not_camelized(self):
+        fragment = RawJSON(b'{"some_key":1}')
+
+        rendered = JSONRenderer().render({"fragment": fragment})
+
+        self.assertEqual(rendered, b'{"fragment":{"some_key":1}}')
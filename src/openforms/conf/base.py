@@ -289,7 +289,7 @@ SENDFILE_URL = PRIVATE_MEDIA_URL
 #
 # Sending EMAIL
 #
-EMAIL_BACKEND = "django_yubin.smtp_queue.EmailBackend"
+EMAIL_BACKEND = "openforms.emails.backends.QueuedEmailBackend"
 EMAIL_HOST = config("EMAIL_HOST", default="localhost")
 EMAIL_PORT = config(
     "EMAIL_PORT", default=25
@@ -298,6 +298,13 @@ EMAIL_HOST_USER = config("EMAIL_HOST_USER", default="")
 EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD", default="")
 EMAIL_USE_TLS = config("EMAIL_USE_TLS", default=False)
 EMAIL_TIMEOUT = 10
+# Number of Celery workers sending the queued e-mails in parallel
+EMAIL_QUEUE_WORKERS = config("EMAIL_QUEUE_WORKERS", default=2)
+# Number of queued e-mails a worker claims and sends over a single SMTP connection
+EMAIL_QUEUE_BATCH_SIZE = config("EMAIL_QUEUE_BATCH_SIZE", default=50)
+# Attachments larger than this size (in KB) are kept in the private media storage
+# rather than in the e-mail queue. Use 0 to store all attachments in the queue.
+EMAIL_QUEUE_OFFLOAD_SIZE = config("EMAIL_QUEUE_OFFLOAD_SIZE", default=256)
 
 DEFAULT_FROM_EMAIL = config("DEFAULT_FROM_EMAIL", "openforms@example.com")
 
@@ -474,6 +481,15 @@ SUBMISSION_REPORT_URL_TOKEN_TIMEOUT_DAYS = config(
 TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS = config(
     "TEMPORARY_UPLOADS_REMOVED_AFTER_DAYS", default=2
 )
+# Submission exports of more submissions are prepared in the background
+SUBMISSION_EXPORT_BACKGROUND_THRESHOLD = config(
+    "SUBMISSION_EXPORT_BACKGROUND_THRESHOLD", default=1000
+)
+# Maximum time (in seconds) the submission status endpoint waits for the processing
+SUBMISSION_STATUS_MAX_WAIT = config("SUBMISSION_STATUS_MAX_WAIT", default=5)
+# Maximum number of submission status requests waiting concurrently, each of them
+# occupies a web server worker
+SUBMISSION_STATUS_MAX_WAITERS = config("SUBMISSION_STATUS_MAX_WAITERS", default=2)
 
 ##############################
 #                            #
@@ -569,10 +585,6 @@ CELERY_BEAT_SCHEDULE = {
         "task": "openforms.submissions.tasks.cleanup_unclaimed_temporary_files",
         "schedule": crontab(minute=30, hour=3),
     },
-    "cleanup_on_completion_results": {
-        "task": "openforms.submissions.tasks.cleanup_on_completion_results",
-        "schedule": crontab(minute=45, hour=4),
-    },
 }
 
 CELERY_BEAT_RESEND_SUBMISSIONS_TIME_LIMIT = config(
@@ -591,6 +603,24 @@ CELERY_WORKER_PREFETCH_MULTIPLIER = 1
 
 # Timeout for the initial registration attempt
 SUBMISSION_REGISTRATION_TIMEOUT = config("SUBMISSION_REGISTRATION_TIMEOUT", default=10)
+# Maximum number of documents uploaded concurrently per ZGW/Objects API registration
+REGISTRATION_MAX_WORKERS = config("REGISTRATION_MAX_WORKERS", default=4)
+# Maximum total size (in MB) of the uploads attached to the registration e-mail. Larger
+# uploads are linked instead. Use 0 for no limit.
+EMAIL_REGISTRATION_MAX_ATTACHMENT_SIZE = config(
+    "EMAIL_REGISTRATION_MAX_ATTACHMENT_SIZE", default=10
+)
+
+# Maximum number of prefill plugin calls executed concurrently per process
+PREFILL_MAX_WORKERS = config("PREFILL_MAX_WORKERS", default=8)
+# Time (in seconds) a form step render waits for a prefill plugin. Plugins not
+# responding in time provide no values.
+PREFILL_PLUGIN_TIMEOUT = config("PREFILL_PLUGIN_TIMEOUT", default=5.0)
+
+# Maximum number of keep-alive connections per host, per StUF service and process
+STUF_POOL_MAXSIZE = config("STUF_POOL_MAXSIZE", default=10)
+# Maximum number of attachments uploaded concurrently per StUF-ZDS registration
+STUF_ZDS_MAX_WORKERS = config("STUF_ZDS_MAX_WORKERS", default=4)
 
 #
 # DJANGO-HIJACK
@@ -679,7 +709,7 @@ REST_FRAMEWORK = {
         "rest_framework.authentication.SessionAuthentication",
     ],
     "DEFAULT_RENDERER_CLASSES": [
-        "djangorestframework_camel_case.render.CamelCaseJSONRenderer",
+        "openforms.api.renderers.JSONRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
         "djangorestframework_camel_case.parser.CamelCaseJSONParser",
@@ -760,7 +790,7 @@ SPECTACULAR_SETTINGS = {
 #
 # ZGW Consumers
 #
-ZGW_CONSUMERS_CLIENT_CLASS = "zgw_consumers.client.ZGWClient"
+ZGW_CONSUMERS_CLIENT_CLASS = "openforms.contrib.clients.ZGWClient"
 ZGW_CONSUMERS_TEST_SCHEMA_DIRS = [
     os.path.join(BASE_DIR, "src/openforms/registrations/contrib/zgw_apis/tests/files"),
     os.path.join(
@@ -1,5 +1,6 @@
 from zds_client import ClientError
 
+from ..clients import get_client
 from .models import BAGConfig
 
 
@@ -7,7 +8,7 @@ class BAGClient:
     @staticmethod
     def get_address(postcode, house_number):
         config = BAGConfig.get_solo()
-        client = config.bag_service.build_client()
+        client = get_client(config.bag_service)
         data = {"huisnummer": house_number, "postcode": postcode.replace(" ", "")}
 
         try:
@@ -5,6 +5,7 @@ from django.utils.translation import gettext_lazy as _
 from solo.models import SingletonModel
 from zgw_consumers.constants import APITypes
 
+from ..clients import get_client
 from ..hal_client import HalClient
 
 
@@ -35,10 +36,4 @@ class BRPConfig(SingletonModel):
         if not self.brp_service:
             raise RuntimeError("You must configure a BRP service!")
 
-        default_client = self.brp_service.build_client()
-        hal_client = HalClient(
-            service=default_client.service,
-            base_path=default_client.base_path,
-        )
-        hal_client.auth_value = default_client.auth_header
-        return hal_client
+        return get_client(self.brp_service, client_class=HalClient)
@@ -0,0 +1,176 @@
+"""
+Re-use the API clients of the configured services.
+
+Building a client for a :class:`zgw_consumers.models.Service` is not free: the client
+configuration is (re-)registered, and every new client sends its requests over new
+connections. Rather than building a client for every operation, call sites obtain the
+client of a service from a process-wide registry:
+
+* clients keep the connections to the API alive in a :class:`requests.Session`,
+* the OAS of an API is parsed only once per process (by the ``schema_fetcher`` of
+  ``zds_client``), and clients look it up rather than holding a copy,
+* a client is built again when the configuration of the service changed.
+"""
+import copy
+import threading
+from typing import Dict, Optional, Tuple, Type
+from urllib.parse import urljoin
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from zds_client import ClientError
+from zds_client.oas import schema_fetcher
+from zds_client.schema import get_headers
+from zgw_consumers.client import ZGWClient as _ZGWClient
+from zgw_consumers.models import Service
+
+__all__ = ["ZGWClient", "get_client", "get_client_for_url", "clear_clients"]
+
+
+class ZGWClient(_ZGWClient):
+    """
+    API client sending its requests over a pool of keep-alive connections.
+
+    Configured as ``ZGW_CONSUMERS_CLIENT_CLASS``, so :meth:`Service.build_client`
+    builds instances of this class.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.session = requests.Session()
+
+    @property
+    def schema(self):
+        if self._schema is not None:
+            return self._schema
+        url = self.schema_url or urljoin(self.base_url, "schema/openapi.yaml")
+        return schema_fetcher.fetch(url, {"v": "3"})
+
+    def request(
+        self,
+        path: str,
+        operation: str,
+        method="GET",
+        expected_status=200,
+        request_kwargs: Optional[dict] = None,
+        **kwargs,
+    ):
+        # :meth:`zds_client.Client.request` (gemma-zds-client 1.0.1) sends the request
+        # with :func:`requests.request`, there is no hook to pass a session. This is
+        # the same implementation, except that the request is sent over the session of
+        # the client - keep it in sync when zds_client is upgraded.
+        url = urljoin(self.base_url, path)
+
+        if request_kwargs:
+            kwargs.update(request_kwargs)
+
+        headers = CaseInsensitiveDict(kwargs.pop("headers", {}))
+        headers.setdefault("Accept", "application/json")
+        headers.setdefault("Content-Type", "application/json")
+        schema_headers = get_headers(self.schema, operation)
+        for header, value in schema_headers.items():
+            headers.setdefault(header, value)
+        if self.auth:
+            headers.update(self.auth.credentials())
+
+        kwargs["headers"] = headers
+
+        pre_id = self.pre_request(method, url, **kwargs)
+
+        response = self.session.request(method, url, **kwargs)
+
+        try:
+            response_json = response.json()
+        except Exception:
+            response_json = None
+
+        self.post_response(pre_id, response_json)
+
+        self._log.add(
+            self.service,
+            url,
+            method,
+            dict(headers),
+            copy.deepcopy(kwargs.get("data", kwargs.get("json", None))),
+            response.status_code,
+            dict(response.headers),
+            response_json,
+            params=kwargs.get("params"),
+        )
+
+        try:
+            response.raise_for_status()
+        except requests.HTTPError as exc:
+            if response.status_code >= 500:
+                raise
+            raise ClientError(response_json) from exc
+
+        assert response.status_code == expected_status, response_json
+        return response_json
+
+
+_clients: Dict[Tuple[int, type], Tuple[tuple, ZGWClient]] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_fingerprint(service: Service) -> tuple:
+    # the service model has no modification timestamp, the configuration itself is
+    # compared instead
+    return tuple(
+        field.value_from_object(service) for field in service._meta.concrete_fields
+    )
+
+
+def _build_client(service: Service, client_class: Optional[Type[ZGWClient]]):
+    client = service.build_client()
+    if client_class is None:
+        return client
+
+    # re-use the configuration of the default client
+    custom_client = client_class(service=client.service, base_path=client.base_path)
+    custom_client.auth = client.auth
+    custom_client.auth_value = client.auth_value
+    return custom_client
+
+
+def get_client(
+    service: Service, client_class: Optional[Type[ZGWClient]] = None
+) -> ZGWClient:
+    """
+    Return the (shared) client for the service.
+
+    :param client_class: a subclass of :class:`ZGWClient` to use instead of the
+      default client class.
+    """
+    key = (service.pk, client_class)
+    fingerprint = _get_fingerprint(service)
+
+    with _clients_lock:
+        existing = _clients.get(key)
+        if existing is not None and existing[0] == fingerprint:
+            return existing[1]
+
+        client = _build_client(service, client_class)
+        _clients[key] = (fingerprint, client)
+
+    if existing is not None:
+        existing[1].session.close()
+    return client
+
+
+def get_client_for_url(url: str) -> Optional[ZGWClient]:
+    """
+    Return the (shared) client for the service the URL belongs to.
+    """
+    service = Service.get_service(url)
+    if service is None:
+        return None
+    return get_client(service)
+
+
+def clear_clients() -> None:
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for _, client in clients:
+        client.session.close()
@@ -1,5 +1,6 @@
 from zds_client.schema import get_operation_url
-from zgw_consumers.client import ZGWClient
+
+from .clients import ZGWClient
 
 
 class HalClient(ZGWClient):
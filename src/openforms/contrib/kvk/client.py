@@ -3,6 +3,7 @@ import logging
 from requests import RequestException
 from zds_client import ClientError
 
+from openforms.contrib.clients import get_client
 from openforms.contrib.kvk.models import KVKConfig
 
 logger = logging.getLogger(__name__)
@@ -25,7 +26,7 @@ class KVKClient:
             logger.warning("no service defined for KvK client")
             raise KVKClientError("no service defined")
 
-        client = config.service.build_client()
+        client = get_client(config.service)
 
         try:
             results = client.operation(
@@ -0,0 +1,106 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+import requests
+import requests_mock
+import zds_client
+from zds_client.oas import schema_fetcher
+from zgw_consumers.test import generate_oas_component
+from zgw_consumers.test.schema_mock import mock_service_oas_get
+
+from openforms.registrations.contrib.zgw_apis.tests.factories import ServiceFactory
+
+from ..clients import ZGWClient, clear_clients, get_client, get_client_for_url
+from ..hal_client import HalClient
+
+
+class ClientRegistryTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.service = ServiceFactory.create(
+            api_root="https://zaken.nl/api/v1/",
+            oas="https://zaken.nl/api/v1/schema/openapi.yaml",
+        )
+
+        clear_clients()
+        self.addCleanup(clear_clients)
+        schema_fetcher.cache.clear()
+        self.addCleanup(schema_fetcher.cache.clear)
+
+    def test_client_is_reused(self):
+        client = get_client(self.service)
+
+        self.assertIsInstance(client, ZGWClient)
+        self.assertIs(get_client(self.service), client)
+
+    def test_client_is_rebuilt_when_service_changes(self):
+        client = get_client(self.service)
+
+        self.service.secret = "changed"
+        self.service.save()
+
+        self.assertIsNot(get_client(self.service), client)
+
+    def test_custom_client_class(self):
+        client = get_client(self.service, client_class=HalClient)
+
+        self.assertIsInstance(client, HalClient)
+        self.assertIsNot(get_client(self.service), client)
+        self.assertIs(get_client(self.service, client_class=HalClient), client)
+
+    def test_client_for_url(self):
+        client = get_client_for_url("https://zaken.nl/api/v1/zaken/1")
+
+        self.assertIs(client, get_client(self.service))
+        self.assertIsNone(get_client_for_url("https://example.com/api/v1/zaken/1"))
+
+    @requests_mock.Mocker()
+    def test_schema_fetched_once(self, m):
+        mock_service_oas_get(m, "https://zaken.nl/api/v1/", "zaken")
+        m.get(
+            "https://zaken.nl/api/v1/zaken/1",
+            json=generate_oas_component(
+                "zaken", "schemas/Zaak", url="https://zaken.nl/api/v1/zaken/1"
+            ),
+        )
+
+        client = get_client(self.service)
+        client.retrieve("zaak", url="https://zaken.nl/api/v1/zaken/1")
+        client.retrieve("zaak", url="https://zaken.nl/api/v1/zaken/1")
+
+        self.assertEqual(
+            [request.url for request in m.request_history],
+            [
+                "https://zaken.nl/api/v1/schema/openapi.yaml?v=3",
+                "https://zaken.nl/api/v1/zaken/1",
+                "https://zaken.nl/api/v1/zaken/1",
+            ],
+        )
+
+    @requests_mock.Mocker()
+    def test_requests_sent_over_client_session(self, m):
+        mock_service_oas_get(m, "https://zaken.nl/api/v1/", "zaken")
+        m.get(
+            "https://zaken.nl/api/v1/zaken/1",
+            json=generate_oas_component(
+                "zaken", "schemas/Zaak", url="https://zaken.nl/api/v1/zaken/1"
+            ),
+        )
+        client = get_client(self.service)
+
+        with patch.object(
+            client.session, "request", wraps=client.session.request
+        ) as mock_session_request, patch(
+            "requests.request", wraps=requests.request
+        ) as mock_request:
+            client.retrieve("zaak", url="https://zaken.nl/api/v1/zaken/1")
+
+        mock_session_request.assert_called_once()
+        mock_request.assert_not_called()
+
+    def test_zds_client_version(self):
+        # ZGWClient.request is a copy of zds_client.Client.request using the session
+        # of the client, compare it with the new implementation when upgrading
+        self.assertEqual(zds_client.__version__, "1.0.1")
@@ -1,3 +1,5 @@
 """
 App to handle e-mail interactions from Open Forms, such as confirmation e-mails.
 """
+
+default_app_config = "openforms.emails.apps.EmailsConfig"
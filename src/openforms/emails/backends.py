@@ -0,0 +1,18 @@
+from django_yubin.smtp_queue import EmailBackend
+
+from .queue import queue_email_message
+
+
+class QueuedEmailBackend(EmailBackend):
+    """
+    Add the e-mails to the django-yubin queue, with the large attachments offloaded.
+
+    See :mod:`openforms.emails.queue`.
+    """
+
+    def send_messages(self, email_messages):
+        if not email_messages:
+            return
+        return sum(
+            1 for email_message in email_messages if queue_email_message(email_message)
+        )
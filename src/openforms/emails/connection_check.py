@@ -3,6 +3,7 @@ from typing import Any, List, Optional, Sequence, Union
 
 from django.conf import settings
 from django.core.mail import send_mail
+from django.utils.module_loading import import_string
 from django.utils.translation import gettext as _
 
 
@@ -39,7 +40,12 @@ def check_email_backend(recipients: Sequence[str]) -> MailCheckResult:
         success=False,
         backend=settings.EMAIL_BACKEND,
     )
-    uses_yubin = "yubin" in result.backend
+    try:
+        from django_yubin.smtp_queue import EmailBackend as QueuedEmailBackend
+    except ImportError:
+        uses_yubin = False
+    else:
+        uses_yubin = issubclass(import_string(result.backend), QueuedEmailBackend)
 
     if uses_yubin:
         try:
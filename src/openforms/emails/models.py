@@ -11,6 +11,7 @@ from django.utils.translation import gettext_lazy as _
 from openforms.appointments.models import AppointmentInfo
 from openforms.submissions.models import Submission
 
+from ..utils.templates import get_template_from_string
 from ..utils.urls import build_absolute_uri
 from .utils import sanitize_content
 
@@ -73,7 +74,10 @@ class ConfirmationEmailTemplate(models.Model):
         context = self.get_context_data(submission)
 
         # render the e-mail body - the template from this model.
-        rendered_content = Template(self.content).render(Context(context))
+        template = get_template_from_string(
+            self.content, scope=("confirmation_email_template", self.form_id)
+        )
+        rendered_content = template.render(Context(context))
 
         sanitized = sanitize_content(rendered_content)
 
@@ -0,0 +1,305 @@
+"""
+Send the e-mails queued by django-yubin with parallel workers.
+
+The ``send_mail`` management command of django-yubin sends the queued messages one by
+one, in a single process guarded by a lock file. Instead, the e-mail queue is drained
+by multiple Celery workers (see :func:`openforms.emails.tasks.drain_email_queue`):
+
+* every worker claims the messages with ``SELECT ... FOR UPDATE SKIP LOCKED``, so
+  workers never send the same message and don't wait for each other,
+* every message is sent and marked as sent in a transaction of its own, while the
+  messages of a batch are sent over a single SMTP connection,
+* messages are claimed in order of priority, so that the confirmation e-mails (high
+  priority) overtake the registration e-mails (low priority) that are already queued.
+
+Large attachments are not stored in the queue (as part of the encoded message), but in
+the private media storage. The queued message contains a signed reference instead,
+which is replaced by the attachment when the message is sent. Every queued message
+(one per recipient) has its own copy of the attachment, which is deleted together with
+the message.
+"""
+import copy
+import logging
+import re
+import smtplib
+import uuid
+from email.mime.base import MIMEBase
+from typing import Iterable, List, Optional
+
+from django.conf import settings
+from django.core import signing
+from django.core.files.base import ContentFile
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils.encoding import force_bytes
+from django.utils.timezone import now
+
+from django_yubin import (
+    constants,
+    models,
+    queue_email_message as yubin_queue_email_message,
+    set_message_test_mode,
+)
+from privates.storages import private_media_storage
+
+from openforms.utils.email import make_attachment
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "offload_attachments",
+    "get_offloaded_attachments",
+    "queue_email_message",
+    "send_queued_messages",
+]
+
+# sent immediately by django-yubin, rather than by the workers draining the queue
+UNQUEUED_PRIORITIES = (constants.PRIORITY_NOW_NOT_QUEUED, constants.PRIORITY_NOW)
+
+OFFLOADED_ATTACHMENT_PREFIX = "open-forms-offloaded-attachment:"
+OFFLOADED_ATTACHMENT_RE = re.compile(
+    r"^" + re.escape(OFFLOADED_ATTACHMENT_PREFIX) + r"(\S+)$", re.MULTILINE
+)
+OFFLOADED_ATTACHMENTS_DIR = "email_attachments"
+SIGNING_SALT = "openforms.emails.queue.offloaded-attachment"
+
+
+def _offload_payload(payload: str) -> str:
+    name = private_media_storage.save(
+        f"{OFFLOADED_ATTACHMENTS_DIR}/{uuid.uuid4().hex}.b64",
+        ContentFile(payload.encode("ascii")),
+    )
+    # the reference is signed, so that a (user provided) e-mail body can't reference
+    # other files in the private media storage
+    reference = signing.Signer(salt=SIGNING_SALT).sign(name)
+    return f"{OFFLOADED_ATTACHMENT_PREFIX}{reference}\n"
+
+
+def offload_attachments(email_message: EmailMessage) -> EmailMessage:
+    """
+    Return a copy of the e-mail message with the large attachments offloaded.
+
+    The (base64 encoded) content of every attachment exceeding
+    ``EMAIL_QUEUE_OFFLOAD_SIZE`` is saved in the private media storage and replaced by
+    a reference to it.
+    """
+    max_size = settings.EMAIL_QUEUE_OFFLOAD_SIZE * 1024
+    if not max_size or not email_message.attachments:
+        return email_message
+
+    attachments = []
+    for attachment in email_message.attachments:
+        if not isinstance(attachment, MIMEBase):
+            filename, content, mime_type = attachment
+            if len(content) <= max_size:
+                attachments.append(attachment)
+                continue
+            attachment = make_attachment(
+                filename, ContentFile(force_bytes(content)), mime_type
+            )
+
+        payload = attachment.get_payload()
+        if (
+            attachment.is_multipart()
+            or attachment["Content-Transfer-Encoding"] != "base64"
+            or len(payload) <= max_size
+        ):
+            attachments.append(attachment)
+            continue
+
+        attachment = copy.copy(attachment)
+        attachment.set_payload(_offload_payload(payload))
+        attachments.append(attachment)
+
+    email_message = copy.copy(email_message)
+    email_message.attachments = attachments
+    return email_message
+
+
+def get_offloaded_attachments(encoded_message: str) -> List[str]:
+    """
+    Return the names of the attachments the encoded message refers to.
+    """
+    signer = signing.Signer(salt=SIGNING_SALT)
+    names = []
+    for reference in OFFLOADED_ATTACHMENT_RE.findall(encoded_message):
+        try:
+            names.append(signer.unsign(reference))
+        except signing.BadSignature:
+            continue
+    return names
+
+
+def _load_offloaded_attachments(encoded_message: str) -> str:
+    signer = signing.Signer(salt=SIGNING_SALT)
+
+    def replace(match) -> str:
+        try:
+            name = signer.unsign(match.group(1))
+        except signing.BadSignature:
+            return match.group(0)
+        with private_media_storage.open(name, "rb") as attachment:
+            return attachment.read().decode("ascii").rstrip("\n")
+
+    return OFFLOADED_ATTACHMENT_RE.sub(replace, encoded_message)
+
+
+def queue_email_message(email_message: EmailMessage) -> int:
+    """
+    Add a message to the queue for every recipient of the e-mail message.
+
+    Equivalent to :func:`django_yubin.queue_email_message`, except that the large
+    attachments are offloaded for every queued message separately.
+
+    :return: the number of queued messages.
+    """
+    extra_headers = email_message.extra_headers.copy()
+    priority = extra_headers.pop(constants.PRIORITY_HEADER, None)
+    if priority:
+        priority = constants.PRIORITIES.get(priority.lower())
+    if priority in UNQUEUED_PRIORITIES:
+        # the message is sent as is, without loading offloaded attachments
+        return yubin_queue_email_message(email_message)
+
+    email_message = copy.copy(email_message)
+    email_message.extra_headers = extra_headers
+    test_email = getattr(settings, "MAILER_TEST_EMAIL", "")
+    if getattr(settings, "MAILER_TEST_MODE", False) and test_email:
+        email_message = set_message_test_mode(email_message, test_email)
+
+    count = 0
+    for recipient in email_message.recipients():
+        encoded_message = offload_attachments(email_message).message().as_string()
+        message = models.Message.objects.create(
+            to_address=recipient,
+            from_address=email_message.from_email,
+            subject=email_message.subject,
+            encoded_message=encoded_message,
+        )
+        queued_message = models.QueuedMessage(message=message)
+        if priority:
+            queued_message.priority = priority
+        queued_message.save()
+        count += 1
+    return count
+
+
+def _claim_message() -> Optional[models.QueuedMessage]:
+    queryset = (
+        models.QueuedMessage.objects.non_deferred()
+        .select_related("message")
+        .select_for_update(skip_locked=True, of=("self",))
+        .order_by("priority", "date_queued")
+    )
+    return queryset.first()
+
+
+def _send_queued_message(
+    queued_message: models.QueuedMessage, connection, blacklist: Iterable[str]
+) -> int:
+    # equivalent to :func:`django_yubin.engine.send_queued_message`, with the
+    # offloaded attachments loaded before sending
+    message = queued_message.message
+    log_message = ""
+
+    if message.to_address in blacklist:
+        logger.info("Not sending to blacklisted email: %s", message.to_address)
+        queued_message.delete()
+        result = constants.RESULT_SKIPPED
+    # read at call time - the settings of django-yubin are read once, on import
+    elif getattr(settings, "MAILER_PAUSE_SEND", False):
+        logger.info("Sending is paused, deferring email.")
+        queued_message.defer()
+        result = constants.RESULT_SKIPPED
+    else:
+        try:
+            encoded_message = _load_offloaded_attachments(message.encoded_message)
+        except FileNotFoundError as exc:
+            # retrying won't bring the attachment back, remove the message from the
+            # queue instead of deferring it
+            logger.error(
+                "Message to %s not sent, attachment is missing: %s",
+                message.to_address,
+                exc,
+            )
+            queued_message.delete()
+            models.Log.objects.create(
+                message=message, result=constants.RESULT_FAILED, log_message=str(exc)
+            )
+            return constants.RESULT_FAILED
+
+        try:
+            logger.info(
+                "Sending message to %s: %s", message.to_address, message.subject
+            )
+            connection.open()
+            connection.connection.sendmail(
+                message.from_address,
+                [message.to_address],
+                encoded_message.encode("utf-8"),
+            )
+        except (
+            OSError,
+            smtplib.SMTPException,
+            UnicodeDecodeError,
+            UnicodeEncodeError,
+        ) as exc:
+            queued_message.defer()
+            logger.warning(
+                "Message to %s deferred due to failure: %s", message.to_address, exc
+            )
+            log_message = str(exc)
+            result = constants.RESULT_FAILED
+            # the connection may be broken, open a new one for the next message
+            connection.close()
+        else:
+            message.date_sent = now()
+            message.save()
+            queued_message.delete()
+            result = constants.RESULT_SENT
+
+    models.Log.objects.create(message=message, result=result, log_message=log_message)
+    return result
+
+
+def send_queued_messages(batch_size: int) -> int:
+    """
+    Claim and send a batch of queued messages.
+
+    Every message is claimed and sent in a transaction of its own, so the messages
+    that were sent are marked as such, even if sending the rest of the batch fails.
+
+    :return: the number of claimed messages - zero when there are no messages left to
+      send.
+    """
+    blacklist = set(models.Blacklist.objects.values_list("email", flat=True))
+    connection = get_connection(
+        backend=getattr(
+            settings,
+            "MAILER_USE_BACKEND",
+            "django.core.mail.backends.smtp.EmailBackend",
+        )
+    )
+    results = []
+    try:
+        while len(results) < batch_size:
+            # the claimed message stays locked until it's sent (and removed from the
+            # queue) or deferred
+            with transaction.atomic():
+                queued_message = _claim_message()
+                if queued_message is None:
+                    break
+                results.append(
+                    _send_queued_message(queued_message, connection, blacklist)
+                )
+    finally:
+        connection.close()
+
+    if results:
+        logger.info(
+            "%d sent, %d deferred, %d skipped.",
+            results.count(constants.RESULT_SENT),
+            results.count(constants.RESULT_FAILED),
+            results.count(constants.RESULT_SKIPPED),
+        )
+    return len(results)
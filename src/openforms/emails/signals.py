@@ -0,0 +1,22 @@
+import logging
+
+from django.db.models.base import ModelBase
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from django_yubin.models import Message
+from privates.storages import private_media_storage
+
+from .queue import get_offloaded_attachments
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_delete, sender=Message)
+def delete_offloaded_attachments(
+    sender: ModelBase, instance: Message, **kwargs
+) -> None:
+    # every queued message has its own copy of the offloaded attachments
+    for name in get_offloaded_attachments(instance.encoded_message):
+        logger.debug("Deleting file %r", name)
+        private_media_storage.delete(name)
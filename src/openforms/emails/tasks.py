@@ -0,0 +1,23 @@
+import logging
+
+from django.conf import settings
+
+from celery_once import QueueOnce
+
+from ..celery import app
+from .queue import send_queued_messages
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(base=QueueOnce, once={"graceful": True}, ignore_result=True)
+def drain_email_queue(worker: int) -> None:
+    """
+    Send queued e-mails until the queue is empty.
+
+    Multiple workers drain the queue in parallel, the ``worker`` argument only
+    distinguishes them for the ``QueueOnce`` lock.
+    """
+    logger.debug("Worker %d processing e-mail queue", worker)
+    while send_queued_messages(settings.EMAIL_QUEUE_BATCH_SIZE):
+        pass
@@ -109,6 +109,18 @@ class ConfirmationEmailTests(TestCase):
         self.assertNotIn("google.com", rendered)
         self.assertNotIn("allowed.com", rendered)
 
+    def test_allowlist_changes_are_applied(self):
+        config = GlobalConfiguration.get_solo()
+        email = ConfirmationEmailTemplate(content="test https://allowed.com test")
+        rendered = email.render(SubmissionFactory.build())
+        self.assertNotIn("allowed.com", rendered)
+
+        config.email_template_netloc_allowlist = ["allowed.com"]
+        config.save()
+        rendered = email.render(SubmissionFactory.build())
+
+        self.assertIn("https://allowed.com", rendered)
+
     def test_cant_delete_model_instances(self):
         form_step = FormStepFactory.create()
         subm_step = SubmissionStepFactory.create(
@@ -0,0 +1,204 @@
+import email
+import smtplib
+from unittest.mock import patch
+
+from django.core.files.base import ContentFile
+from django.core.mail import EmailMessage
+from django.test import TestCase, override_settings
+
+from django_yubin import constants
+from django_yubin.models import Log, Message, QueuedMessage
+from privates.storages import private_media_storage
+from privates.test import temp_private_root
+
+from openforms.utils.email import make_attachment
+from openforms.utils.tasks import send_emails
+
+from ..queue import (
+    OFFLOADED_ATTACHMENT_PREFIX,
+    _load_offloaded_attachments,
+    get_offloaded_attachments,
+    offload_attachments,
+    send_queued_messages,
+)
+
+CONTENT = bytes(range(256)) * 8
+
+
+def get_attachment_contents(encoded_message: str) -> list:
+    message = email.message_from_string(encoded_message)
+    return [
+        part.get_payload(decode=True)
+        for part in message.walk()
+        if part.get_content_disposition() == "attachment"
+    ]
+
+
+def make_email_message(to=("to@example.com",), **kwargs) -> EmailMessage:
+    email_message = EmailMessage(
+        subject="Subject",
+        body="Body",
+        from_email="from@example.com",
+        to=list(to),
+        **kwargs,
+    )
+    email_message.attach(
+        make_attachment("large.bin", ContentFile(CONTENT), "application/foo")
+    )
+    email_message.attach("small.txt", "content", "text/plain")
+    return email_message
+
+
+@temp_private_root()
+@override_settings(EMAIL_QUEUE_OFFLOAD_SIZE=1)
+class OffloadAttachmentsTests(TestCase):
+    def test_large_attachments_are_offloaded(self):
+        email_message = make_email_message()
+
+        offloaded = offload_attachments(email_message)
+
+        encoded_message = offloaded.message().as_string()
+        self.assertIn(OFFLOADED_ATTACHMENT_PREFIX, encoded_message)
+        (name,) = get_offloaded_attachments(encoded_message)
+        self.assertTrue(private_media_storage.exists(name))
+        self.assertEqual(
+            get_attachment_contents(_load_offloaded_attachments(encoded_message)),
+            [CONTENT, b"content"],
+        )
+        # the original message is not modified
+        self.assertNotIn(
+            OFFLOADED_ATTACHMENT_PREFIX, email_message.message().as_string()
+        )
+
+    @override_settings(EMAIL_QUEUE_OFFLOAD_SIZE=0)
+    def test_offloading_disabled(self):
+        email_message = make_email_message()
+
+        offloaded = offload_attachments(email_message)
+
+        self.assertIs(offloaded, email_message)
+
+    def test_forged_reference_is_ignored(self):
+        private_media_storage.save("secret.txt", ContentFile(b"secret"))
+        encoded_message = f"{OFFLOADED_ATTACHMENT_PREFIX}secret.txt:forged\n"
+
+        self.assertEqual(get_offloaded_attachments(encoded_message), [])
+        self.assertEqual(_load_offloaded_attachments(encoded_message), encoded_message)
+
+    def test_file_deleted_with_message(self):
+        email_message = make_email_message(to=["one@example.com", "two@example.com"])
+
+        with override_settings(
+            EMAIL_BACKEND="openforms.emails.backends.QueuedEmailBackend"
+        ):
+            email_message.send()
+
+        first, second = Message.objects.order_by("pk")
+        (first_name,) = get_offloaded_attachments(first.encoded_message)
+        (second_name,) = get_offloaded_attachments(second.encoded_message)
+        # every queued message has its own copy
+        self.assertNotEqual(first_name, second_name)
+
+        first.delete()
+        self.assertFalse(private_media_storage.exists(first_name))
+        self.assertTrue(private_media_storage.exists(second_name))
+
+
+@temp_private_root()
+@override_settings(
+    EMAIL_BACKEND="openforms.emails.backends.QueuedEmailBackend",
+    EMAIL_QUEUE_OFFLOAD_SIZE=1,
+)
+@patch("openforms.emails.queue.get_connection")
+class SendQueuedMessagesTests(TestCase):
+    def test_messages_sent_in_order_of_priority(self, mock_get_connection):
+        make_email_message(
+            to=["registration@example.com"],
+            headers={constants.PRIORITY_HEADER: "low"},
+        ).send()
+        make_email_message(
+            to=["confirmation@example.com"],
+            headers={constants.PRIORITY_HEADER: "high"},
+        ).send()
+        sendmail = mock_get_connection.return_value.connection.sendmail
+
+        processed = send_queued_messages(batch_size=10)
+
+        self.assertEqual(processed, 2)
+        self.assertFalse(QueuedMessage.objects.exists())
+        # a single connection is used for the batch
+        mock_get_connection.assert_called_once()
+        self.assertEqual(
+            [call[0][1] for call in sendmail.call_args_list],
+            [["confirmation@example.com"], ["registration@example.com"]],
+        )
+        sent_message = sendmail.call_args_list[0][0][2].decode("utf-8")
+        self.assertEqual(get_attachment_contents(sent_message), [CONTENT, b"content"])
+        self.assertEqual(send_queued_messages(batch_size=10), 0)
+
+    def test_batch_size(self, mock_get_connection):
+        make_email_message(to=["one@example.com", "two@example.com"]).send()
+
+        processed = send_queued_messages(batch_size=1)
+
+        self.assertEqual(processed, 1)
+        self.assertEqual(QueuedMessage.objects.count(), 1)
+
+    def test_messages_committed_one_by_one(self, mock_get_connection):
+        make_email_message(to=["one@example.com", "two@example.com"]).send()
+        sendmail = mock_get_connection.return_value.connection.sendmail
+        sendmail.side_effect = [None, RuntimeError("crash")]
+
+        with self.assertRaises(RuntimeError):
+            send_queued_messages(batch_size=10)
+
+        # the message sent before the crash is not sent again
+        queued_message = QueuedMessage.objects.get()
+        self.assertEqual(queued_message.message.to_address, "two@example.com")
+        self.assertEqual(Message.objects.filter(date_sent__isnull=False).count(), 1)
+        mock_get_connection.return_value.close.assert_called_once()
+
+    def test_pause_send_read_when_sending(self, mock_get_connection):
+        make_email_message().send()
+
+        with override_settings(MAILER_PAUSE_SEND=True):
+            send_queued_messages(batch_size=10)
+
+        mock_get_connection.return_value.connection.sendmail.assert_not_called()
+        self.assertIsNotNone(QueuedMessage.objects.get().deferred)
+        self.assertEqual(Log.objects.get().result, constants.RESULT_SKIPPED)
+
+    def test_message_with_missing_attachment_is_not_deferred(self, mock_get_connection):
+        make_email_message().send()
+        (name,) = get_offloaded_attachments(Message.objects.get().encoded_message)
+        private_media_storage.delete(name)
+
+        send_queued_messages(batch_size=10)
+
+        mock_get_connection.return_value.connection.sendmail.assert_not_called()
+        self.assertFalse(QueuedMessage.objects.exists())
+        self.assertEqual(Log.objects.get().result, constants.RESULT_FAILED)
+
+    def test_failed_message_is_deferred(self, mock_get_connection):
+        make_email_message().send()
+        sendmail = mock_get_connection.return_value.connection.sendmail
+        sendmail.side_effect = smtplib.SMTPRecipientsRefused({})
+
+        send_queued_messages(batch_size=10)
+
+        queued_message = QueuedMessage.objects.get()
+        self.assertIsNotNone(queued_message.deferred)
+        self.assertEqual(Log.objects.get().result, constants.RESULT_FAILED)
+        # deferred messages are not claimed again
+        self.assertEqual(send_queued_messages(batch_size=10), 0)
+
+
+@override_settings(EMAIL_QUEUE_WORKERS=3)
+class SendEmailsTaskTests(TestCase):
+    @patch("openforms.emails.tasks.drain_email_queue.delay")
+    def test_workers_started(self, mock_delay):
+        send_emails()
+
+        self.assertEqual(
+            [call[0] for call in mock_delay.call_args_list], [(0,), (1,), (2,)]
+        )
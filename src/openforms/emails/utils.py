@@ -1,7 +1,6 @@
 import logging
-import re
-from functools import partial
-from typing import List
+from functools import lru_cache, partial
+from typing import Callable, Collection, Tuple
 from urllib.parse import urlparse, urlsplit
 
 from django.conf import settings
@@ -13,7 +12,7 @@ from .constants import URL_REGEX
 logger = logging.getLogger(__name__)
 
 
-def sanitize_urls(allowlist: List[str], match) -> str:
+def sanitize_urls(allowlist: Collection[str], match) -> str:
     parsed = urlparse(match.group())
     if parsed.netloc in allowlist:
         return match.group()
@@ -42,7 +41,12 @@ def sanitize_content(content: str) -> str:
 
     # strip out any hyperlinks that are not in the configured allowlist
     allowlist = get_system_netloc_allowlist() + config.email_template_netloc_allowlist
-    replace_urls = partial(sanitize_urls, allowlist)
-    stripped = re.sub(URL_REGEX, replace_urls, content)
+    sanitize = _get_url_sanitizer(tuple(allowlist))
+    return sanitize(content)
 
-    return stripped
+
+@lru_cache(maxsize=16)
+def _get_url_sanitizer(allowlist: Tuple[str, ...]) -> Callable[[str], str]:
+    # the sanitizer only changes when the configured allowlist changes
+    replace_urls = partial(sanitize_urls, frozenset(allowlist))
+    return partial(URL_REGEX.sub, replace_urls)
@@ -0,0 +1,75 @@
+"""
+Cache the rendered configuration of form definitions that are not personalized.
+
+The configuration served to the SDK is rewritten for every submission step: custom
+field types are resolved, prefill values are filled in and the form logic modifies
+component properties and values. Most form definitions use none of these, making the
+output identical for every user. For those, the rendered JSON is cached, keyed by the
+hash of the configuration and the active language.
+"""
+from typing import Optional
+
+from django.core.cache import caches
+from django.utils.translation import get_language
+
+from openforms.api.renderers import JSONRenderer, RawJSON
+
+from ..component_index import get_configuration_hash
+from ..constants import LogicActionTypes
+from ..custom_field_types import REGISTRY
+from ..logic import get_form_logic
+from ..models import Form, FormDefinition
+
+__all__ = ["is_personalized", "get_rendered_configuration"]
+
+CACHE_ALIAS = "default"
+KEY_PREFIX = "form-definition-configuration"
+# the key changes with the configuration, so this only bounds the memory usage
+CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def is_personalized(
+    form_definition: FormDefinition, form: Optional[Form] = None
+) -> bool:
+    """
+    Determine whether the rendered configuration depends on the submission.
+
+    If the ``form`` is given, the definition is personalized as soon as a logic rule
+    of the form modifies one of its components - the logic is evaluated in place on
+    the configuration, with the submission data.
+    """
+    component_index = form_definition.component_index
+    if component_index.components_with("prefill.plugin"):
+        return True
+    if any(
+        component.get("type") in REGISTRY
+        for component in component_index.top_level_components
+    ):
+        return True
+    if form is None:
+        return False
+    return any(
+        component_index.get_component(action.component) is not None
+        for rule in get_form_logic(form).rules
+        for action in rule.actions
+        if action.type in (LogicActionTypes.value, LogicActionTypes.property)
+    )
+
+
+def get_rendered_configuration(form_definition: FormDefinition) -> RawJSON:
+    """
+    Return the (cached) rendered configuration of a non-personalized definition.
+    """
+    cache = caches[CACHE_ALIAS]
+    # the configuration hash is computed on the current configuration rather than
+    # the (possibly stale) hash cached on the instance, in case it was modified
+    configuration_hash = get_configuration_hash(form_definition.configuration)
+    cache_key = f"{KEY_PREFIX}:{configuration_hash}:{get_language()}"
+
+    payload = cache.get(cache_key)
+    if payload is None:
+        # equivalent to ``handle_custom_types`` without any custom types
+        configuration = {"components": form_definition.configuration["components"]}
+        payload = JSONRenderer().render(configuration)
+        cache.set(cache_key, payload, timeout=CACHE_TIMEOUT)
+    return RawJSON(payload)
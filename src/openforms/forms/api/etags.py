@@ -0,0 +1,146 @@
+"""
+Conditional GET support for the (public) form endpoints.
+
+The SDK re-fetches the form and its steps on every navigation. The responses only
+change when the forms are edited, so they are served with a strong ``ETag`` derived
+from the state of the models involved. Clients (and reverse proxies) revalidate with
+``If-None-Match`` and receive a ``304 Not Modified`` without the serializers running.
+"""
+import hashlib
+from typing import Any, Callable, Iterable
+
+from django.db import models
+from django.db.models import Prefetch, prefetch_related_objects
+from django.utils.cache import get_conditional_response, patch_cache_control, quote_etag
+from django.utils.translation import get_language
+
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from openforms.config.models import GlobalConfiguration
+
+from ..models import Form, FormDefinition, FormStep
+
+__all__ = [
+    "ConditionalGetMixin",
+    "conditional_response",
+    "get_etag",
+    "get_form_definition_state",
+    "get_form_step_state",
+    "get_form_state",
+]
+
+
+def _get_instance_state(instance: models.Model, exclude: Iterable[str] = ()) -> list:
+    return [
+        (field.attname, field.value_from_object(instance))
+        for field in instance._meta.concrete_fields
+        if field.name not in exclude
+    ]
+
+
+def get_form_definition_state(form_definition: FormDefinition) -> tuple:
+    # the configuration is represented by its hash, which is cheaper to compare
+    return (
+        _get_instance_state(form_definition, exclude=("configuration",)),
+        form_definition.get_hash(),
+    )
+
+
+def get_form_step_state(form_step: FormStep) -> tuple:
+    return (
+        _get_instance_state(form_step),
+        get_form_definition_state(form_step.form_definition),
+    )
+
+
+def get_form_state(form: Form) -> tuple:
+    # a no-op if the steps are already prefetched - the serializer then re-uses the
+    # same form definition instances, with their configuration hash
+    prefetch_related_objects(
+        [form],
+        Prefetch(
+            "formstep_set",
+            queryset=FormStep.objects.select_related("form_definition").order_by(
+                "order"
+            ),
+        ),
+    )
+    # the payment requirement depends on the price of the product
+    product_state = _get_instance_state(form.product) if form.product_id else None
+    return (
+        _get_instance_state(form),
+        product_state,
+        [get_form_step_state(form_step) for form_step in form.formstep_set.all()],
+    )
+
+
+def get_etag(request: Request, state: Any) -> str:
+    """
+    Return a strong ETag for the state of the resource(s) in a response.
+
+    Besides the state of the resource, the output depends on the host (hyperlinks),
+    the language and the defaults in the global configuration (literals).
+    """
+    config = GlobalConfiguration.get_solo()
+    context = (
+        request.build_absolute_uri("/"),
+        get_language(),
+        _get_instance_state(config),
+    )
+    digest = hashlib.md5(repr((context, state)).encode("utf-8")).hexdigest()
+    return quote_etag(digest)
+
+
+def conditional_response(
+    request: Request, state: Any, get_data: Callable[[], Any]
+) -> Response:
+    """
+    Return a ``304 Not Modified`` if the client has the current representation.
+
+    ``get_data`` is only called to build the full response when needed.
+    """
+    etag = get_etag(request, state)
+
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        response = Response(get_data())
+
+    response["ETag"] = etag
+    # shared caches may store the response, but must always revalidate it
+    if request.user.is_authenticated:
+        patch_cache_control(response, private=True, no_cache=True)
+    else:
+        patch_cache_control(response, public=True, no_cache=True)
+    return response
+
+
+class ConditionalGetMixin:
+    """
+    Handle ``If-None-Match`` for the retrieve and (unpaginated) list actions.
+
+    Viewsets implement :meth:`get_etag_state`, which must cover everything the
+    serialized output depends on without running the serializer.
+    """
+
+    def get_etag_state(self, instance: models.Model) -> Any:
+        raise NotImplementedError
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        return conditional_response(
+            request,
+            self.get_etag_state(instance),
+            lambda: self.get_serializer(instance).data,
+        )
+
+    def list(self, request, *args, **kwargs):
+        if self.paginator is not None:
+            return super().list(request, *args, **kwargs)
+
+        instances = list(self.filter_queryset(self.get_queryset()))
+        return conditional_response(
+            request,
+            [self.get_etag_state(instance) for instance in instances],
+            lambda: self.get_serializer(instances, many=True).data,
+        )
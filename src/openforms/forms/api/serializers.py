@@ -4,6 +4,7 @@ from drf_polymorphic.serializers import PolymorphicSerializer
 from rest_framework import serializers
 from rest_framework_nested.relations import NestedHyperlinkedRelatedField
 
+from openforms.api.renderers import JSONRenderer
 from openforms.prefill import apply_prefill
 from openforms.products.models import Product
 from openforms.utils.json_logic import JsonLogicTest
@@ -17,6 +18,7 @@ from ..constants import LogicActionTypes, PropertyTypes
 from ..custom_field_types import handle_custom_types
 from ..models import Form, FormDefinition, FormStep, FormVersion
 from ..models.form import FormLogic
+from .cache import get_rendered_configuration, is_personalized
 from .validators import JsonLogicValidator
 
 
@@ -199,15 +201,27 @@ class FormDefinitionSerializer(serializers.HyperlinkedModelSerializer):
         representation = super().to_representation(instance=instance)
 
         _handle_custom_types = self.context.get("handle_custom_types", True)
-        if _handle_custom_types:
+        if not _handle_custom_types:
+            return representation
+
+        # the output for non-personalized definitions is the same for every user,
+        # serve it pre-rendered if the response is rendered as JSON
+        request = self.context["request"]
+        renders_raw_json = isinstance(
+            getattr(request, "accepted_renderer", None), JSONRenderer
+        )
+        submission = self.context["submission"]
+        if renders_raw_json and not is_personalized(instance, form=submission.form):
+            representation["configuration"] = get_rendered_configuration(instance)
+        else:
             representation["configuration"] = handle_custom_types(
                 representation["configuration"],
-                request=self.context["request"],
-                submission=self.context["submission"],
+                request=request,
+                submission=submission,
             )
             representation["configuration"] = apply_prefill(
                 representation["configuration"],
-                submission=self.context["submission"],
+                submission=submission,
             )
         return representation
 
@@ -21,6 +21,13 @@ from openforms.utils.patches.rest_framework_nested.viewsets import NestedViewSet
 
 from ..models import Form, FormDefinition, FormLogic, FormStep, FormVersion
 from ..utils import export_form, form_to_json, import_form
+from .etags import (
+    ConditionalGetMixin,
+    conditional_response,
+    get_form_definition_state,
+    get_form_state,
+    get_form_step_state,
+)
 from .filters import FormLogicFilter
 from .parsers import IgnoreConfigurationFieldCamelCaseJSONParser
 from .permissions import IsStaffOrReadOnly
@@ -54,11 +61,12 @@ from .serializers import (
     destroy=extend_schema(summary=_("Delete a form step")),
 )
 class FormStepViewSet(
+    ConditionalGetMixin,
     NestedViewSetMixin,
     viewsets.ModelViewSet,
 ):
     serializer_class = FormStepSerializer
-    queryset = FormStep.objects.all().order_by("order")
+    queryset = FormStep.objects.select_related("form_definition").order_by("order")
     permission_classes = [IsStaffOrReadOnly]
     lookup_field = "uuid"
 
@@ -67,6 +75,9 @@ class FormStepViewSet(
         context["form"] = get_object_or_404(Form, uuid=self.kwargs["form_uuid_or_slug"])
         return context
 
+    def get_etag_state(self, instance: FormStep):
+        return get_form_step_state(instance)
+
 
 @extend_schema_view(
     list=extend_schema(summary=_("List logic rules")),
@@ -147,7 +158,11 @@ class FormDefinitionViewSet(viewsets.ModelViewSet):
         may be custom field types in play.
         """
         definition = self.get_object()
-        return Response(data=definition.configuration, status=status.HTTP_200_OK)
+        return conditional_response(
+            request,
+            get_form_definition_state(definition),
+            lambda: definition.configuration,
+        )
 
 
 UUID_OR_SLUG_PARAMETER = OpenApiParameter(
@@ -188,7 +203,7 @@ UUID_OR_SLUG_PARAMETER = OpenApiParameter(
         parameters=[UUID_OR_SLUG_PARAMETER],
     ),
 )
-class FormViewSet(viewsets.ModelViewSet):
+class FormViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     """
     Manage forms.
 
@@ -198,7 +213,7 @@ class FormViewSet(viewsets.ModelViewSet):
     re-used among different forms.
     """
 
-    queryset = Form.objects.all().prefetch_related(
+    queryset = Form.objects.select_related("product").prefetch_related(
         Prefetch(
             "formstep_set",
             queryset=FormStep.objects.select_related("form_definition").order_by(
@@ -236,6 +251,9 @@ class FormViewSet(viewsets.ModelViewSet):
 
         return request
 
+    def get_etag_state(self, instance: Form):
+        return get_form_state(instance)
+
     @extend_schema(
         summary=_("Copy form"),
         tags=["forms"],
@@ -0,0 +1,217 @@
+"""
+Flattened, precomputed index of the components in a Form.io configuration.
+
+Looking up components in a form definition requires walking the nested Form.io
+configuration. Rather than doing this on every call, the configuration is indexed once
+and the resulting :class:`ComponentIndex` is cached in-process, keyed by the hash of
+the configuration (see :meth:`openforms.forms.models.FormDefinition.get_hash`). Any
+change to the configuration results in a different hash, which makes stale entries
+unreachable - they are eventually evicted by the LRU policy.
+
+The index holds a private copy of the components, as the same index is shared by
+every form definition (instance) with an identical configuration. Callers must treat
+the indexed components as read-only. To modify the components of a particular
+configuration, use :meth:`ComponentIndex.locate`.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict, defaultdict
+from copy import copy, deepcopy
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from glom import glom
+
+__all__ = [
+    "ComponentIndex",
+    "get_component_index",
+    "get_configuration_hash",
+    "patch_configuration",
+]
+
+JSONObject = Dict[str, Any]
+JSONPath = Tuple[Union[str, int], ...]
+
+# the number of component indexes kept in memory per process
+CACHE_SIZE = 256
+
+# component attributes indexed upfront, others are indexed on first use
+FLAG_ATTRIBUTES = (
+    "showInEmail",
+    "confirmationRecipient",
+    "isSensitiveData",
+)
+
+
+def get_configuration_hash(configuration: JSONObject) -> str:
+    return hashlib.md5(
+        json.dumps(configuration, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+
+
+@dataclass(frozen=True)
+class ComponentIndex:
+    # all components, depth-first in the order they are defined
+    components: Tuple[JSONObject, ...]
+    top_level_components: Tuple[JSONObject, ...]
+    # the first component with a given key
+    by_key: Dict[str, JSONObject]
+    # the path(s) of the component(s) with a given key in the configuration
+    paths: Dict[str, Tuple[JSONPath, ...]]
+    # the keys of the components of a given type
+    keys_by_type: Dict[str, Tuple[str, ...]]
+    # the path of every (indexed) component, by object ID
+    _paths_by_id: Dict[int, JSONPath] = field(repr=False, compare=False)
+    _by_attribute: Dict[str, Tuple[JSONObject, ...]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    @classmethod
+    def from_configuration(cls, configuration: JSONObject) -> "ComponentIndex":
+        configuration = deepcopy(configuration)
+
+        components = []
+        top_level_components = []
+        by_key = {}
+        paths = defaultdict(list)
+        keys_by_type = defaultdict(list)
+        paths_by_id = {}
+
+        def walk(node: JSONObject, path: JSONPath) -> None:
+            for index, component in enumerate(node.get("components") or ()):
+                component_path = path + ("components", index)
+                components.append(component)
+                paths_by_id[id(component)] = component_path
+                if not path:
+                    top_level_components.append(component)
+
+                if key := component.get("key"):
+                    by_key.setdefault(key, component)
+                    paths[key].append(component_path)
+                    if component_type := component.get("type"):
+                        keys_by_type[component_type].append(key)
+
+                walk(component, component_path)
+
+        walk(configuration, ())
+
+        component_index = cls(
+            components=tuple(components),
+            top_level_components=tuple(top_level_components),
+            by_key=by_key,
+            paths={key: tuple(key_paths) for key, key_paths in paths.items()},
+            keys_by_type={
+                component_type: tuple(keys)
+                for component_type, keys in keys_by_type.items()
+            },
+            _paths_by_id=paths_by_id,
+        )
+        for attribute in FLAG_ATTRIBUTES:
+            component_index.components_with(attribute)
+        return component_index
+
+    def get_component(self, key: str) -> Optional[JSONObject]:
+        return self.by_key.get(key)
+
+    def components_with(self, attribute: str) -> Tuple[JSONObject, ...]:
+        """
+        Return the components with a truthy value for the (dotted path) attribute.
+        """
+        if attribute not in self._by_attribute:
+            self._by_attribute[attribute] = tuple(
+                component
+                for component in self.components
+                if glom(component, attribute, default=None)
+            )
+        return self._by_attribute[attribute]
+
+    def keys_with(self, attribute: str) -> Tuple[str, ...]:
+        """
+        Return the keys of the components with a truthy value for the attribute.
+        """
+        return tuple(
+            component["key"]
+            for component in self.components_with(attribute)
+            if component.get("key")
+        )
+
+    def get_path(self, component: JSONObject) -> JSONPath:
+        """
+        Return the path of an indexed component in the configuration.
+        """
+        return self._paths_by_id[id(component)]
+
+    def locate(self, configuration: JSONObject, key: str) -> Iterator[JSONObject]:
+        """
+        Yield the component(s) with the given key in ``configuration``.
+
+        The configuration must have the same structure as the indexed configuration,
+        but may have different component property values.
+        """
+        for path in self.paths.get(key, ()):
+            node = configuration
+            for bit in path:
+                node = node[bit]
+            yield node
+
+
+def patch_configuration(
+    configuration: JSONObject, patches: Iterable[Tuple[JSONPath, JSONObject]]
+) -> JSONObject:
+    """
+    Return a copy of the configuration with the properties of components updated.
+
+    Rather than copying the whole configuration, only the containers on the path from
+    the root to a patched component are copied - everything else is shared with the
+    original configuration, which is left untouched.
+
+    :param patches: pairs of component path (see :meth:`ComponentIndex.get_path`) and
+      the component properties to set.
+    """
+    result = copy(configuration)
+    copies = {(): result}
+
+    for path, properties in patches:
+        node = result
+        for depth, bit in enumerate(path, start=1):
+            subpath = path[:depth]
+            if subpath not in copies:
+                node[bit] = copy(node[bit])
+                copies[subpath] = node[bit]
+            node = copies[subpath]
+        node.update(properties)
+
+    return result
+
+
+_cache: "OrderedDict[str, ComponentIndex]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def get_component_index(
+    configuration: JSONObject, configuration_hash: str = ""
+) -> ComponentIndex:
+    """
+    Return the (cached) component index of the Form.io configuration.
+    """
+    if not configuration_hash:
+        configuration_hash = get_configuration_hash(configuration)
+
+    with _cache_lock:
+        if (component_index := _cache.get(configuration_hash)) is not None:
+            _cache.move_to_end(configuration_hash)
+            return component_index
+
+    # build outside of the lock - worst case, an index is built more than once
+    component_index = ComponentIndex.from_configuration(configuration)
+    with _cache_lock:
+        _cache[configuration_hash] = component_index
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return component_index
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
@@ -0,0 +1,216 @@
+"""
+Compiled representation of the logic rules of a form.
+
+The :class:`openforms.forms.models.FormLogic` rules of a form are evaluated on every
+logic check of a submission step. Rather than querying the rules and interpreting the
+raw JsonLogic expressions every time, the rules are compiled once into Python
+callables with pre-resolved actions.
+
+The compiled rules are cached in-process, keyed by the form ID and the logic version
+of the form. The version is bumped whenever a logic rule of the form is saved or
+deleted (see :mod:`openforms.forms.signals`), which makes stale entries unreachable.
+
+Every compiled rule knows which data keys it reads (its dependencies) and which
+component properties, data keys or step states it writes (its targets). This allows
+re-evaluating only the rules affected by a change in the submission data.
+"""
+from collections import defaultdict
+from copy import deepcopy
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, NamedTuple, Optional, Tuple
+
+from openforms.utils.json_logic import (
+    CompiledExpression,
+    compile_expression,
+    extract_variables,
+)
+
+from .constants import LogicActionTypes
+from .models import Form, FormLogic
+
+__all__ = [
+    "LogicAction",
+    "LogicRule",
+    "LogicTarget",
+    "CompiledFormLogic",
+    "get_form_logic",
+]
+
+# the number of compiled rule sets kept in memory per process
+CACHE_SIZE = 256
+
+
+class LogicTarget(NamedTuple):
+    """
+    The piece of state modified by a logic action.
+
+    ``key`` is the component key for component properties, or the form step URL for
+    step applicability. ``attribute`` is the component property or step attribute.
+    """
+
+    key: str
+    attribute: str
+
+
+CAN_SUBMIT = LogicTarget(key="", attribute="can_submit")
+
+
+@dataclass(frozen=True)
+class LogicAction:
+    type: str
+    component: str = ""
+    form_step: str = ""
+    property_name: str = ""
+    state: Any = None
+    value: Optional[CompiledExpression] = None
+    # the data keys read by the value expression, ``None`` if not statically known
+    dependencies: Optional[FrozenSet[str]] = frozenset()
+
+    @classmethod
+    def from_action(cls, action: Dict[str, Any]) -> "LogicAction":
+        action_details = action["action"]
+        action_type = action_details["type"]
+
+        extra = {}
+        if action_type == LogicActionTypes.value:
+            extra["value"] = compile_expression(action_details["value"])
+            extra["dependencies"] = extract_variables(action_details["value"])
+        elif action_type == LogicActionTypes.property:
+            extra["property_name"] = action_details["property"]["value"]
+            extra["state"] = action_details["state"]
+
+        return cls(
+            type=action_type,
+            component=action.get("component") or "",
+            form_step=action.get("form_step") or "",
+            **extra,
+        )
+
+    @property
+    def target(self) -> LogicTarget:
+        if self.type == LogicActionTypes.value:
+            return LogicTarget(key=self.component, attribute="value")
+        if self.type == LogicActionTypes.property:
+            return LogicTarget(key=self.component, attribute=self.property_name)
+        if self.type == LogicActionTypes.step_not_applicable:
+            return LogicTarget(key=self.form_step, attribute="is_applicable")
+        return CAN_SUBMIT
+
+    def get_state(self) -> Any:
+        # the compiled action is shared between requests - never hand out the
+        # (possibly mutable) state itself
+        return deepcopy(self.state)
+
+
+@dataclass(frozen=True)
+class LogicRule:
+    trigger: CompiledExpression
+    actions: Tuple[LogicAction, ...]
+    # the data keys read by the trigger, ``None`` if not statically known
+    trigger_dependencies: Optional[FrozenSet[str]] = frozenset()
+    action_types: frozenset = field(init=False)
+    dependencies: Optional[FrozenSet[str]] = field(init=False)
+    targets: FrozenSet[LogicTarget] = field(init=False)
+    # the (top-level) data keys written by value actions
+    outputs: FrozenSet[str] = field(init=False)
+
+    def __post_init__(self):
+        dependencies = self.trigger_dependencies
+        for action in self.actions:
+            if dependencies is None or action.dependencies is None:
+                dependencies = None
+                break
+            dependencies = dependencies | action.dependencies
+
+        computed = {
+            "action_types": frozenset(action.type for action in self.actions),
+            "dependencies": dependencies,
+            "targets": frozenset(action.target for action in self.actions),
+            "outputs": frozenset(
+                action.component.split(".")[0]
+                for action in self.actions
+                if action.type == LogicActionTypes.value
+            ),
+        }
+        # frozen dataclass - bypass the generated __setattr__
+        for attr, value in computed.items():
+            object.__setattr__(self, attr, value)
+
+    @classmethod
+    def from_model(cls, rule: FormLogic) -> "LogicRule":
+        return cls(
+            trigger=compile_expression(rule.json_logic_trigger),
+            actions=tuple(LogicAction.from_action(action) for action in rule.actions),
+            trigger_dependencies=extract_variables(rule.json_logic_trigger),
+        )
+
+    def is_triggered(self, data: Dict[str, Any]) -> bool:
+        return bool(self.trigger(data))
+
+
+@dataclass(frozen=True)
+class CompiledFormLogic:
+    rules: Tuple[LogicRule, ...]
+
+    def __post_init__(self):
+        # index the rules (by position) on the data keys they read and the state
+        # they write, so that affected rules are found without scanning every rule
+        dependents = defaultdict(set)
+        writers = defaultdict(set)
+        always_evaluated = set()
+        for index, rule in enumerate(self.rules):
+            if rule.dependencies is None:
+                always_evaluated.add(index)
+            else:
+                for key in rule.dependencies:
+                    dependents[key].add(index)
+            for target in rule.targets:
+                writers[target].add(index)
+
+        object.__setattr__(self, "_dependents", dict(dependents))
+        object.__setattr__(self, "_writers", dict(writers))
+        object.__setattr__(self, "_always_evaluated", frozenset(always_evaluated))
+
+    def get_rules_with_action(self, action_type: str) -> Tuple[LogicRule, ...]:
+        return tuple(rule for rule in self.rules if action_type in rule.action_types)
+
+    def get_affected_rules(self, changed_keys: Iterable[str]) -> Tuple[LogicRule, ...]:
+        """
+        Determine the rules to evaluate after the data of ``changed_keys`` changed.
+
+        Rules reading any of the changed keys are affected, and so are (transitively)
+        the rules reading the data keys those rules write to. Finally, every rule
+        writing to the same state as an affected rule is included, as the outcome for
+        that state depends on all of them - the last triggered rule wins.
+
+        The rules are returned in their evaluation order.
+        """
+        affected = set(self._always_evaluated)
+        seen_keys = set()
+        pending_keys = {key.split(".")[0] for key in changed_keys}
+        while pending_keys:
+            key = pending_keys.pop()
+            seen_keys.add(key)
+            for index in self._dependents.get(key, ()):
+                if index in affected:
+                    continue
+                affected.add(index)
+                pending_keys.update(self.rules[index].outputs - seen_keys)
+
+        targets = {target for index in affected for target in self.rules[index].targets}
+        to_evaluate = {index for target in targets for index in self._writers[target]}
+        return tuple(self.rules[index] for index in sorted(to_evaluate))
+
+
+def get_form_logic(form: Form) -> CompiledFormLogic:
+    """
+    Return the compiled logic rules of the form, compiling them if needed.
+    """
+    return _compile_form_logic(form.pk, form.logic_version)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile_form_logic(form_id: int, logic_version: int) -> CompiledFormLogic:
+    rules = FormLogic.objects.filter(form_id=form_id).order_by("pk")
+    return CompiledFormLogic(rules=tuple(LogicRule.from_model(rule) for rule in rules))
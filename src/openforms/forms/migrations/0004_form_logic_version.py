@@ -0,0 +1,20 @@
+# Generated by Django 2.2.24 on 2021-10-05 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("forms", "0003_auto_20210930_1156"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="form",
+            name="logic_version",
+            field=models.PositiveIntegerField(
+                default=0, editable=False, verbose_name="logic version"
+            ),
+        ),
+    ]
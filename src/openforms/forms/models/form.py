@@ -140,6 +140,11 @@ class Form(models.Model):
     )
     _is_deleted = models.BooleanField(default=False)
 
+    # bumped whenever a logic rule of the form changes, see openforms.forms.logic
+    logic_version = models.PositiveIntegerField(
+        _("logic version"), default=0, editable=False
+    )
+
     # Data removal
     successful_submissions_removal_limit = models.PositiveIntegerField(
         _("successful submission removal limit"),
@@ -223,6 +228,22 @@ class Form(models.Model):
         verbose_name = _("form")
         verbose_name_plural = _("forms")
 
+    def save(self, *args, **kwargs):
+        # the logic version is only ever bumped in the database (see
+        # openforms.forms.signals), saving a stale instance must not overwrite it
+        if (
+            self.pk is not None
+            and not self._state.adding
+            and not kwargs.get("force_insert")
+            and kwargs.get("update_fields") is None
+        ):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "logic_version"
+            ]
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.admin_name
 
@@ -325,6 +346,14 @@ class Form(models.Model):
         for form_step in self.formstep_set.select_related("form_definition"):
             yield from form_step.iter_components(recursive=recursive)
 
+    def iter_components_with(self, attribute: str):
+        """
+        Yield the components with a truthy value for the (dotted path) attribute.
+        """
+        for form_step in self.formstep_set.select_related("form_definition"):
+            component_index = form_step.form_definition.component_index
+            yield from component_index.components_with(attribute)
+
     @transaction.atomic
     def restore_old_version(self, form_version_uuid: str) -> None:
         from ..utils import import_form_data
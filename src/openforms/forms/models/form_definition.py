@@ -1,5 +1,3 @@
-import hashlib
-import json
 import uuid
 from copy import deepcopy
 from functools import partial
@@ -17,6 +15,11 @@ from autoslug import AutoSlugField
 
 from openforms.utils.fields import StringUUIDField
 
+from ..component_index import (
+    ComponentIndex,
+    get_component_index,
+    get_configuration_hash,
+)
 from ..models import Form
 from ..tasks import detect_formiojs_configuration_snake_case
 
@@ -56,7 +59,15 @@ class FormDefinition(models.Model):
     def __str__(self):
         return self.admin_name
 
+    def __setattr__(self, name, value):
+        # the configuration hash is cached, assigning a new configuration resets it
+        if name == "configuration":
+            self.__dict__.pop("configuration_hash", None)
+        super().__setattr__(name, value)
+
     def save(self, *args, **kwargs):
+        # the configuration may have been modified in place
+        self.__dict__.pop("configuration_hash", None)
         super().save(*args, **kwargs)
 
         self._check_configuration_integrity()
@@ -106,10 +117,26 @@ class FormDefinition(models.Model):
             .order_by("name")
         )
 
+    @cached_property
+    def configuration_hash(self) -> str:
+        return get_configuration_hash(self.configuration)
+
     def get_hash(self):
-        return hashlib.md5(
-            json.dumps(self.configuration, sort_keys=True).encode("utf-8")
-        ).hexdigest()
+        """
+        Return the hash of the configuration.
+
+        The hash is computed once per instance and reset when a configuration is
+        assigned or the form definition is saved. In-place modifications of the
+        configuration are only picked up after saving.
+        """
+        return self.configuration_hash
+
+    @property
+    def component_index(self) -> ComponentIndex:
+        """
+        The (cached) index of the components in the configuration.
+        """
+        return get_component_index(self.configuration, self.get_hash())
 
     def delete(self, using=None, keep_parents=False):
         if Form.objects.filter(formstep__form_definition=self).exists():
@@ -123,7 +150,13 @@ class FormDefinition(models.Model):
 
     def iter_components(self, configuration=None, recursive=True):
         if configuration is None:
-            configuration = self.configuration
+            component_index = self.component_index
+            yield from (
+                component_index.components
+                if recursive
+                else component_index.top_level_components
+            )
+            return
 
         components = configuration.get("components")
         if components:
@@ -136,33 +169,18 @@ class FormDefinition(models.Model):
 
     def get_keys_for_email_summary(self) -> List[Tuple[str, str]]:
         """Return the key and the label of fields to include in the email summary"""
-        keys_for_email_summary = []
-
-        for component in self.iter_components(recursive=True):
-            if component.get("showInEmail"):
-                keys_for_email_summary.append((component["key"], component["label"]))
-
-        return keys_for_email_summary
+        return [
+            (component["key"], component["label"])
+            for component in self.component_index.components_with("showInEmail")
+        ]
 
-    def get_keys_for_email_confirmation(self) -> List[Tuple[str, str]]:
-        """Return the key and the label of fields to include in the confirmation email"""
-        keys_for_email_confirmation = []
-
-        for component in self.iter_components(recursive=True):
-            if component.get("confirmationRecipient"):
-                keys_for_email_confirmation.append(component["key"])
-
-        return keys_for_email_confirmation
+    def get_keys_for_email_confirmation(self) -> List[str]:
+        """Return the keys of fields to include in the confirmation email"""
+        return list(self.component_index.keys_with("confirmationRecipient"))
 
     @cached_property
     def sensitive_fields(self):
-        sensitive_fields = []
-
-        for component in self.iter_components(recursive=True):
-            if component.get("isSensitiveData"):
-                sensitive_fields.append(component["key"])
-
-        return sensitive_fields
+        return list(self.component_index.keys_with("isSensitiveData"))
 
     @property
     def admin_name(self):
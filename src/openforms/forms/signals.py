@@ -0,0 +1,37 @@
+import logging
+
+from django.db.models import F
+from django.db.models.base import ModelBase
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Form, FormLogic
+
+logger = logging.getLogger(__name__)
+
+
+def _bump_logic_version(form_id: int) -> None:
+    logger.debug("Bumping the logic version of form %s", form_id)
+    Form.objects.filter(pk=form_id).update(logic_version=F("logic_version") + 1)
+
+
+@receiver(pre_save, sender=FormLogic)
+def invalidate_previous_form_logic(
+    sender: ModelBase, instance: FormLogic, **kwargs
+) -> None:
+    # a rule moved to another form must invalidate the logic of the old form too
+    if not instance.pk or kwargs.get("raw"):
+        return
+
+    previous_form_id = (
+        FormLogic.objects.filter(pk=instance.pk)
+        .values_list("form_id", flat=True)
+        .first()
+    )
+    if previous_form_id and previous_form_id != instance.form_id:
+        _bump_logic_version(previous_form_id)
+
+
+@receiver([post_save, post_delete], sender=FormLogic)
+def invalidate_form_logic(sender: ModelBase, instance: FormLogic, **kwargs) -> None:
+    _bump_logic_version(instance.form_id)
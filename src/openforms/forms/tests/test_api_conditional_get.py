@@ -0,0 +1,150 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from openforms.tests.utils import NOOP_CACHES
+
+from ..api.etags import get_form_state
+from ..component_index import get_configuration_hash
+from ..models import Form
+from .factories import FormFactory, FormStepFactory
+
+
+@override_settings(CACHES=NOOP_CACHES)
+class ConditionalGetTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.step = FormStepFactory.create(
+            form_definition__configuration={
+                "components": [{"key": "foo", "type": "textfield"}]
+            }
+        )
+        cls.form = cls.step.form
+        cls.definition = cls.step.form_definition
+
+    def _get_urls(self):
+        return {
+            "form": reverse("api:form-detail", kwargs={"uuid_or_slug": self.form.uuid}),
+            "forms": reverse("api:form-list"),
+            "step": reverse(
+                "api:form-steps-detail",
+                kwargs={"form_uuid_or_slug": self.form.uuid, "uuid": self.step.uuid},
+            ),
+            "steps": reverse(
+                "api:form-steps-list",
+                kwargs={"form_uuid_or_slug": self.form.uuid},
+            ),
+            "configuration": reverse(
+                "api:formdefinition-configuration",
+                kwargs={"uuid": self.definition.uuid},
+            ),
+        }
+
+    def test_not_modified(self):
+        for name, url in self._get_urls().items():
+            with self.subTest(endpoint=name):
+                response = self.client.get(url)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertIn("ETag", response)
+                self.assertEqual(response["Cache-Control"], "public, no-cache")
+
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+                self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+                self.assertEqual(response.content, b"")
+                self.assertIn("ETag", response)
+
+    @patch("openforms.forms.api.serializers.FormSerializer.to_representation")
+    def test_serializer_not_used_for_not_modified(self, mock_to_representation):
+        url = self._get_urls()["form"]
+        etag = self.client.get(url)["ETag"]
+        mock_to_representation.reset_mock()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        mock_to_representation.assert_not_called()
+
+    def test_etag_changes_with_modifications(self):
+        urls = self._get_urls()
+        etags = {name: self.client.get(url)["ETag"] for name, url in urls.items()}
+
+        self.definition.configuration["components"][0]["label"] = "Foo"
+        self.definition.save()
+
+        for name, url in urls.items():
+            with self.subTest(endpoint=name):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etags[name])
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertNotEqual(response["ETag"], etags[name])
+
+    def test_etag_changes_with_form_steps(self):
+        url = self._get_urls()["form"]
+        etag = self.client.get(url)["ETag"]
+
+        FormStepFactory.create(form=self.form)
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.json()["steps"]), 2)
+
+    def test_etag_changes_with_product_price(self):
+        form = FormFactory.create(product__price=Decimal("0"), payment_backend="demo")
+        url = reverse("api:form-detail", kwargs={"uuid_or_slug": form.uuid})
+        response = self.client.get(url)
+        self.assertFalse(response.json()["paymentRequired"])
+
+        form.product.price = Decimal("10")
+        form.product.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.json()["paymentRequired"])
+
+    def test_inactive_form_not_served_as_not_modified(self):
+        form = FormFactory.create()
+        url = reverse("api:form-detail", kwargs={"uuid_or_slug": form.uuid})
+        etag = self.client.get(url)["ETag"]
+
+        form.active = False
+        form.save()
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class FormStateTests(TestCase):
+    def test_steps_loaded_in_one_query(self):
+        form = FormFactory.create()
+        FormStepFactory.create_batch(3, form=form)
+        form = Form.objects.select_related("product").get(pk=form.pk)
+
+        with self.assertNumQueries(1):
+            get_form_state(form)
+
+    @override_settings(CACHES=NOOP_CACHES)
+    def test_configuration_hashed_once_per_request(self):
+        form = FormFactory.create()
+        FormStepFactory.create_batch(2, form=form)
+        url = reverse("api:form-detail", kwargs={"uuid_or_slug": form.uuid})
+
+        with patch(
+            "openforms.forms.models.form_definition.get_configuration_hash",
+            wraps=get_configuration_hash,
+        ) as mock_get_configuration_hash:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_get_configuration_hash.call_count, 2)
@@ -0,0 +1,194 @@
+from copy import deepcopy
+from unittest.mock import patch
+
+from django.test import SimpleTestCase, TestCase
+
+from openforms.submissions.form_logic import set_property_value
+
+from ..component_index import ComponentIndex, get_component_index, patch_configuration
+from .factories import FormDefinitionFactory
+
+CONFIGURATION = {
+    "display": "form",
+    "components": [
+        {
+            "key": "fieldset",
+            "type": "fieldset",
+            "components": [
+                {
+                    "key": "name",
+                    "type": "textfield",
+                    "label": "Name",
+                    "showInEmail": True,
+                },
+                {
+                    "key": "email",
+                    "type": "email",
+                    "label": "Email",
+                    "confirmationRecipient": True,
+                    "registration": {"attribute": "email"},
+                },
+            ],
+        },
+        {
+            "key": "bsn",
+            "type": "textfield",
+            "label": "BSN",
+            "isSensitiveData": True,
+        },
+    ],
+}
+
+
+class ComponentIndexTests(SimpleTestCase):
+    def test_components_are_indexed(self):
+        component_index = ComponentIndex.from_configuration(CONFIGURATION)
+
+        self.assertEqual(
+            [component["key"] for component in component_index.components],
+            ["fieldset", "name", "email", "bsn"],
+        )
+        self.assertEqual(
+            [component["key"] for component in component_index.top_level_components],
+            ["fieldset", "bsn"],
+        )
+        self.assertEqual(component_index.get_component("email")["label"], "Email")
+        self.assertIsNone(component_index.get_component("unknown"))
+        self.assertEqual(
+            component_index.paths["email"], (("components", 0, "components", 1),)
+        )
+        self.assertEqual(component_index.keys_by_type["textfield"], ("name", "bsn"))
+
+    def test_components_with_attribute(self):
+        component_index = ComponentIndex.from_configuration(CONFIGURATION)
+
+        self.assertEqual(component_index.keys_with("showInEmail"), ("name",))
+        self.assertEqual(component_index.keys_with("isSensitiveData"), ("bsn",))
+        self.assertEqual(
+            component_index.keys_with("registration.attribute"), ("email",)
+        )
+        self.assertEqual(component_index.keys_with("prefill.plugin"), ())
+
+    def test_index_is_cached_by_configuration_hash(self):
+        configuration = {"components": [{"key": "foo", "type": "textfield"}]}
+
+        component_index = get_component_index(configuration)
+
+        self.assertIs(get_component_index({**configuration}), component_index)
+        configuration["components"][0]["hidden"] = True
+        self.assertIsNot(get_component_index(configuration), component_index)
+
+    def test_index_is_isolated_from_configuration(self):
+        configuration = {"components": [{"key": "foo", "type": "textfield"}]}
+
+        component_index = ComponentIndex.from_configuration(configuration)
+        configuration["components"][0]["label"] = "Foo"
+
+        self.assertNotIn("label", component_index.get_component("foo"))
+
+    def test_locate_components_in_configuration(self):
+        configuration = {
+            "components": [
+                {"key": "foo", "components": [{"key": "bar"}]},
+                {"key": "bar"},
+            ]
+        }
+        component_index = ComponentIndex.from_configuration(configuration)
+
+        located = list(component_index.locate(configuration, "bar"))
+
+        self.assertEqual(len(located), 2)
+        self.assertIs(located[0], configuration["components"][0]["components"][0])
+        self.assertIs(located[1], configuration["components"][1])
+
+    def test_patch_configuration(self):
+        configuration = {
+            "components": [
+                {"key": "foo", "components": [{"key": "bar"}, {"key": "baz"}]},
+                {"key": "qux"},
+            ]
+        }
+        original = deepcopy(configuration)
+        component_index = ComponentIndex.from_configuration(configuration)
+        bar = component_index.get_component("bar")
+
+        patched = patch_configuration(
+            configuration, [(component_index.get_path(bar), {"hidden": True})]
+        )
+
+        self.assertEqual(configuration, original)
+        self.assertEqual(
+            patched,
+            {
+                "components": [
+                    {
+                        "key": "foo",
+                        "components": [{"key": "bar", "hidden": True}, {"key": "baz"}],
+                    },
+                    {"key": "qux"},
+                ]
+            },
+        )
+        # untouched components are shared
+        self.assertIs(
+            patched["components"][0]["components"][1],
+            configuration["components"][0]["components"][1],
+        )
+        self.assertIs(patched["components"][1], configuration["components"][1])
+
+    def test_set_property_value_nested(self):
+        configuration = {
+            "components": [
+                {"key": "foo", "components": [{"key": "bar"}]},
+                {"key": "baz"},
+            ]
+        }
+
+        set_property_value(configuration, "bar", "hidden", True)
+
+        self.assertEqual(
+            configuration,
+            {
+                "components": [
+                    {"key": "foo", "components": [{"key": "bar", "hidden": True}]},
+                    {"key": "baz"},
+                ]
+            },
+        )
+
+
+class FormDefinitionComponentIndexTests(TestCase):
+    def test_component_index_reflects_configuration_changes(self):
+        form_definition = FormDefinitionFactory.create(
+            configuration={"components": [{"key": "foo", "type": "textfield"}]}
+        )
+        self.assertEqual(form_definition.component_index.keys_with("hidden"), ())
+
+        form_definition.configuration["components"][0]["hidden"] = True
+        form_definition.save()
+
+        self.assertEqual(form_definition.component_index.keys_with("hidden"), ("foo",))
+        self.assertEqual(
+            list(form_definition.iter_components()),
+            [{"key": "foo", "type": "textfield", "hidden": True}],
+        )
+
+        form_definition.configuration = {"components": [{"key": "bar"}]}
+
+        self.assertEqual(
+            [component["key"] for component in form_definition.iter_components()],
+            ["bar"],
+        )
+
+    @patch("openforms.forms.models.form_definition.get_configuration_hash")
+    def test_configuration_hashed_once(self, mock_get_configuration_hash):
+        mock_get_configuration_hash.return_value = "some-hash"
+        form_definition = FormDefinitionFactory.build(
+            configuration={"components": [{"key": "foo", "type": "textfield"}]}
+        )
+
+        form_definition.component_index
+        form_definition.component_index
+        form_definition.get_hash()
+
+        mock_get_configuration_hash.assert_called_once()
@@ -27,14 +27,20 @@ So, to recap:
    form field default values.
 """
 import logging
-from copy import deepcopy
+import threading
+from concurrent import futures
 from itertools import groupby
-from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
-from zgw_consumers.concurrent import parallel
+from django.conf import settings
 
+from zgw_consumers.concurrent import wrap_fn
+
+from openforms.forms.component_index import get_component_index, patch_configuration
 from openforms.logging import logevent
 
+from .cache import get_cached_values, set_cached_values
+
 if TYPE_CHECKING:
     from openforms.submissions.models import Submission
 
@@ -46,15 +52,23 @@ JSONPrimitive = Union[str, int, None, float]
 JSONValue = Union[JSONPrimitive, "JSONObject", List["JSONValue"]]
 JSONObject = Dict[str, JSONValue]
 
+_DEFAULT = object()
+
+_executor: Optional[futures.ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
 
 def apply_prefill(configuration: JSONObject, submission: "Submission", register=None):
     """
     Takes a Formiojs definition and invokes all the pre-fill plugins.
 
     The entire form definition is parsed, plugins and their attributes are extracted
-    and each plugin is invoked with the list of attributes (in parallel). If a default
-    value was specified for a component, and the prefill plugin returns a value as well,
-    the prefill value overrides the default.
+    and each plugin is invoked with the list of attributes (in parallel). Plugins that
+    fail or time out provide no values, the other values are still applied. Values that
+    were already retrieved for the submission are taken from the cache (see
+    :mod:`openforms.prefill.cache`). If a default value was specified for a component,
+    and the prefill plugin returns a value as well, the prefill value overrides the
+    default.
 
     :param configuration: The formiojs form configuration, including all the components.
       This must adhere to the formiojs proprietary JSON schema.
@@ -65,42 +79,130 @@ def apply_prefill(configuration: JSONObject, submission: "Submission", register=
     :param register: A :class:`openforms.prefill.registry.Registry` instance, holding
       the registered plugins. Defaults to the default registry, but can be specified for
       dependency injection purposes in tests.
-    :return: Returns a mutated copy of the configuration, where components
+    :return: Returns a modified copy of the configuration, where components
       ``defaultValue`` is set to the value from prefill plugins where possible. If the
       ``defaultValue`` was set through the form builder, it may be overridden by the
-      prefill plugin value (if it's not ``None``).
+      prefill plugin value (if it's not ``None``). Only the modified components (and
+      their parents) are copied, the rest is shared with ``configuration``.
     """
-    from .registry import register as default_register
-
-    register = register or default_register
+    component_index = get_component_index(configuration)
+    components = component_index.components_with("prefill.plugin")
+    if not components:
+        return configuration
 
-    fields = _extract_prefill_fields(configuration)
+    fields = [component["prefill"] for component in components]
     grouped_fields = _group_prefills_by_plugin(fields)
+    # process the pre-fill results and fill them out
+    prefilled_values = _fetch_prefill_values(submission, grouped_fields, register)
 
-    def invoke_plugin(item: Tuple[str, List[str]]) -> Tuple[str, Dict[str, Any]]:
-        plugin_id, fields = item
-        plugin = register[plugin_id]
+    # finally, ensure the ``defaultValue`` is set based on prefill results
+    patches = [
+        (component_index.get_path(component), {"defaultValue": value})
+        for component in components
+        if (value := _get_default_value(component, prefilled_values)) is not None
+    ]
+    return patch_configuration(configuration, patches)
 
-        try:
-            values = plugin.get_prefill_values(submission, fields)
-        except Exception as e:
-            logevent.prefill_retrieve_failure(submission, plugin, e)
-            raise
-        else:
-            logevent.prefill_retrieve_success(submission, plugin, fields)
 
-        return (plugin_id, values)
+def prefill_form(submission: "Submission", register=None) -> None:
+    """
+    Retrieve the prefill values for all the steps of the form of the submission.
 
-    with parallel() as executor:
-        results = executor.map(invoke_plugin, grouped_fields.items())
+    The prefill attributes of all form steps are collected and each plugin is invoked
+    once, with all the attributes it needs to provide. The values are stored in the
+    prefill cache, so rendering the form steps later on does not need to wait for the
+    plugins.
+    """
+    fields = []
+    for form_step in submission.form.formstep_set.select_related("form_definition"):
+        fields += _extract_prefill_fields(form_step.form_definition.configuration)
 
-    # process the pre-fill results and fill them out
-    prefilled_values: Dict[str, Dict[str, Any]] = dict(results)
+    grouped_fields = _group_prefills_by_plugin(fields)
+    if grouped_fields:
+        # running in the background - no need to give up on slow plugins
+        _fetch_prefill_values(submission, grouped_fields, register, timeout=None)
 
-    # finally, ensure the ``defaultValue`` is set based on prefill results
-    config_copy = deepcopy(configuration)
-    _set_default_values(config_copy, prefilled_values)
-    return config_copy
+
+def _fetch_prefill_values(
+    submission: "Submission",
+    grouped_fields: Dict[str, List[str]],
+    register=None,
+    timeout: Optional[float] = _DEFAULT,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Invoke the plugins (in parallel) and return their values, keyed by plugin ID.
+
+    Plugins that fail or don't respond within ``timeout`` seconds provide no values,
+    the failure is logged for the submission. By default, the ``PREFILL_PLUGIN_TIMEOUT``
+    setting applies. Pass ``None`` to wait for all the plugins.
+    """
+    from .registry import register as default_register
+
+    register = register or default_register
+    if timeout is _DEFAULT:
+        timeout = settings.PREFILL_PLUGIN_TIMEOUT
+
+    def invoke_plugin(plugin, fields: List[str]) -> Dict[str, Any]:
+        # only retrieve the values that were not retrieved earlier in this session
+        values = get_cached_values(submission, plugin.identifier)
+        missing_fields = [
+            field for field in dict.fromkeys(fields) if field not in values
+        ]
+        if missing_fields:
+            try:
+                retrieved = plugin.get_prefill_values(submission, missing_fields)
+            except Exception as e:
+                logger.warning(
+                    "Prefill plugin %s failed", plugin.identifier, exc_info=True
+                )
+                logevent.prefill_retrieve_failure(submission, plugin, e)
+                return {}
+            else:
+                logevent.prefill_retrieve_success(submission, plugin, missing_fields)
+
+            values.update({field: retrieved.get(field) for field in missing_fields})
+            set_cached_values(submission, plugin.identifier, values)
+
+        return {field: values[field] for field in fields}
+
+    executor = _get_executor()
+    plugins = {plugin_id: register[plugin_id] for plugin_id in grouped_fields}
+    pending = {
+        executor.submit(wrap_fn(invoke_plugin), plugins[plugin_id], fields): plugin_id
+        for plugin_id, fields in grouped_fields.items()
+    }
+    done, not_done = futures.wait(pending, timeout=timeout)
+
+    for future in not_done:
+        # the plugin may still complete in the background and populate the cache
+        future.cancel()
+        plugin = plugins[pending[future]]
+        logger.warning(
+            "Prefill plugin %s did not respond within %s seconds",
+            plugin.identifier,
+            timeout,
+        )
+        logevent.prefill_retrieve_failure(
+            submission,
+            plugin,
+            futures.TimeoutError(f"No response within {timeout} seconds"),
+        )
+
+    return {pending[future]: future.result() for future in done}
+
+
+def _get_executor() -> futures.ThreadPoolExecutor:
+    """
+    Return the process-wide, bounded thread pool to invoke prefill plugins in.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = futures.ThreadPoolExecutor(
+                max_workers=settings.PREFILL_MAX_WORKERS,
+                thread_name_prefix="prefill",
+            )
+    return _executor
 
 
 def _extract_prefill_fields(configuration: JSONObject) -> List[Dict[str, str]]:
@@ -130,40 +232,32 @@ def _group_prefills_by_plugin(fields: List[JSONObject]) -> Dict[str, list]:
     return grouper
 
 
-def _set_default_values(
-    configuration: JSONObject, prefilled_values: Dict[str, Dict[str, Any]]
-) -> None:
+def _get_default_value(
+    component: JSONObject, prefilled_values: Dict[str, Dict[str, Any]]
+) -> Any:
     """
-    Mutates each component found in configuration according to the prefilled values.
+    Determine the ``defaultValue`` of a component according to the prefilled values.
 
-    :param configuration: The Formiojs JSON schema describing an entire form or an
-      individual component within the form.
+    :param component: The Formiojs JSON schema of a component with prefill
+      configuration.
     :param prefilled_values: A dict keyed by plugin ID, with values a dict keyed by the
       attribute ID. The value of each attribute key is the prefill value as retrieved.
-
-    This function recurses to deal with the nested component structure. Each component
-    is inspected for prefill configuration, which is then looked up in
-    ``prefilled_values`` to set the component ``defaultValue``.
+    :return: the prefill value, or ``None`` if there is none and the component should
+      be left untouched.
     """
-    if "prefill" in configuration:
-        default_value = configuration.get("defaultValue")
-        prefill_value = prefilled_values.get(
-            configuration["prefill"]["plugin"], {}
-        ).get(configuration["prefill"]["attribute"])
-
-        if prefill_value is None:
-            logger.debug(
-                "Prefill value for component %s is None, skipping.", configuration["id"]
-            )
-            return
-
-        if prefill_value != default_value and default_value is not None:
-            logger.info(
-                "Overwriting non-null default value for component %s",
-                configuration["id"],
-            )
-        configuration["defaultValue"] = prefill_value
-
-    if components := configuration.get("components"):
-        for component in components:
-            _set_default_values(component, prefilled_values)
+    default_value = component.get("defaultValue")
+    prefill_value = prefilled_values.get(component["prefill"]["plugin"], {}).get(
+        component["prefill"]["attribute"]
+    )
+
+    if prefill_value is None:
+        logger.debug(
+            "Prefill value for component %s is None, skipping.", component.get("id")
+        )
+        return None
+
+    if prefill_value != default_value and default_value is not None:
+        logger.info(
+            "Overwriting non-null default value for component %s", component.get("id")
+        )
+    return prefill_value
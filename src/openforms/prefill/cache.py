@@ -0,0 +1,84 @@
+"""
+Cache the values retrieved by prefill plugins for a form session.
+
+Every (re-)render of a form step applies the prefill plugins. The retrieved values only
+depend on the submission (and the identifying details obtained after authentication),
+so they are cached per submission and plugin, for the duration of the form session.
+
+Prefill values typically contain personal data, so they are stored encrypted in the
+cache backend.
+"""
+import base64
+import hashlib
+import json
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Dict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+
+from cryptography.fernet import Fernet, InvalidToken
+
+if TYPE_CHECKING:
+    from openforms.submissions.models import Submission
+
+__all__ = ["get_cached_values", "set_cached_values"]
+
+CACHE_ALIAS = "default"
+KEY_PREFIX = "prefill"
+
+
+def _get_fernet() -> Fernet:
+    key = hashlib.sha256(f"openforms.prefill:{settings.SECRET_KEY}".encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+def _get_timeout() -> int:
+    from openforms.config.models import GlobalConfiguration
+
+    config = GlobalConfiguration.get_solo()
+    return int(timedelta(minutes=config.form_session_timeout).total_seconds())
+
+
+def _get_cache_key(submission: "Submission", plugin_id: str) -> str:
+    # the authentication details are part of the key, so that values are never
+    # served for a different BSN/KvK number than they were retrieved for
+    identity = hashlib.sha256(
+        f"{submission.uuid}:{submission.bsn}:{submission.kvk}".encode()
+    ).hexdigest()
+    return f"{KEY_PREFIX}:{identity}:{plugin_id}"
+
+
+def get_cached_values(submission: "Submission", plugin_id: str) -> Dict[str, Any]:
+    """
+    Return the cached prefill values of the plugin, keyed by attribute.
+
+    Attributes that were retrieved without a value are present with value ``None``.
+    """
+    if not submission.pk:
+        return {}
+
+    token = caches[CACHE_ALIAS].get(_get_cache_key(submission, plugin_id))
+    if token is None:
+        return {}
+
+    try:
+        payload = _get_fernet().decrypt(token, ttl=_get_timeout())
+    except InvalidToken:
+        return {}
+    return json.loads(payload)
+
+
+def set_cached_values(
+    submission: "Submission", plugin_id: str, values: Dict[str, Any]
+) -> None:
+    if not submission.pk:
+        return
+
+    payload = json.dumps(values, cls=DjangoJSONEncoder).encode("utf-8")
+    caches[CACHE_ALIAS].set(
+        _get_cache_key(submission, plugin_id),
+        _get_fernet().encrypt(payload),
+        timeout=_get_timeout(),
+    )
@@ -8,6 +8,7 @@ from requests import RequestException
 from zds_client import ClientError
 
 from openforms.authentication.constants import AuthAttribute
+from openforms.contrib.clients import get_client
 from openforms.submissions.models import Submission
 
 from ...base import BasePlugin
@@ -39,7 +40,7 @@ class HaalCentraalPrefill(BasePlugin):
             logger.warning("no service defined for Haal Centraal prefill")
             return {}
 
-        client = config.service.build_client()
+        client = get_client(config.service)
 
         try:
             data = client.retrieve(
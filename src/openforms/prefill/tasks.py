@@ -0,0 +1,28 @@
+import logging
+
+from openforms.celery import app
+from openforms.submissions.models import Submission
+
+from . import prefill_form
+
+__all__ = ["warm_up_prefill"]
+
+logger = logging.getLogger(__name__)
+
+
+@app.task(ignore_result=True)
+def warm_up_prefill(submission_id: int) -> None:
+    """
+    Retrieve the prefill values for the whole form ahead of the step renders.
+    """
+    submission = Submission.objects.select_related("form").get(id=submission_id)
+    try:
+        prefill_form(submission)
+    except Exception:
+        # the failure is logged for the submission - the values are retrieved again
+        # when the form steps are rendered
+        logger.warning(
+            "Warming up the prefill values of submission %s failed",
+            submission.uuid,
+            exc_info=True,
+        )
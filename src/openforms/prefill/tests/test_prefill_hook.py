@@ -1,12 +1,16 @@
+import threading
 from copy import deepcopy
+from unittest.mock import patch
 
-from django.test import TestCase
+from django.core.cache import caches
+from django.test import TestCase, override_settings
 
 from openforms.forms.tests.factories import FormStepFactory
 from openforms.submissions.tests.factories import SubmissionFactory
 
-from .. import apply_prefill
+from .. import apply_prefill, prefill_form
 from ..base import BasePlugin
+from ..cache import _get_cache_key, get_cached_values
 from ..contrib.demo.plugin import DemoPrefill
 from ..registry import Registry
 
@@ -135,6 +139,30 @@ class PrefillHookTests(TestCase):
         self.assertIsNotNone(field["defaultValue"])
         self.assertIsInstance(field["defaultValue"], str)
 
+    def test_configuration_is_not_modified(self):
+        configuration = {
+            "display": "form",
+            "components": [
+                {"id": "e1a2cv9", "key": "other", "type": "textfield"},
+                deepcopy(CONFIGURATION["components"][0]),
+            ],
+        }
+        original = deepcopy(configuration)
+        form_step = FormStepFactory.create(form_definition__configuration=configuration)
+        submission = SubmissionFactory.create(form=form_step.form)
+
+        new_configuration = apply_prefill(
+            configuration=configuration,
+            submission=submission,
+            register=register,
+        )
+
+        self.assertEqual(configuration, original)
+        self.assertIsNotNone(new_configuration["components"][1]["defaultValue"])
+        self.assertIs(
+            new_configuration["components"][0], configuration["components"][0]
+        )
+
     def test_prefill_no_result_and_default_value_set(self):
         config = deepcopy(CONFIGURATION)
         config["components"][0]["defaultValue"] = "some-default"
@@ -173,3 +201,184 @@ class PrefillHookTests(TestCase):
             )
         except Exception:
             self.fail("Pre-fill can't handle empty/no plugins")
+
+
+class PrefillCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.register = Registry()
+        self.calls = calls = []
+
+        @self.register("demo")
+        class Counting(DemoPrefill):
+            @staticmethod
+            def get_prefill_values(submission, attributes):
+                calls.append(attributes)
+                return {attr: f"value-{attr}" for attr in attributes}
+
+        self.addCleanup(caches["default"].clear)
+
+    def test_values_are_retrieved_once_per_submission(self):
+        form_step = FormStepFactory.create(form_definition__configuration=CONFIGURATION)
+        submission = SubmissionFactory.create(form=form_step.form)
+
+        for _ in range(2):
+            new_configuration = apply_prefill(
+                configuration=form_step.form_definition.configuration,
+                submission=submission,
+                register=self.register,
+            )
+
+        self.assertEqual(self.calls, [["random_string"]])
+        self.assertEqual(
+            new_configuration["components"][0]["defaultValue"], "value-random_string"
+        )
+
+    def test_only_missing_attributes_are_retrieved(self):
+        config = deepcopy(CONFIGURATION)
+        other_component = deepcopy(config["components"][0])
+        other_component.update(
+            {
+                "key": "other",
+                "prefill": {"plugin": "demo", "attribute": "random_number"},
+            }
+        )
+        config["components"].append(other_component)
+        form_step = FormStepFactory.create(form_definition__configuration=CONFIGURATION)
+        submission = SubmissionFactory.create(form=form_step.form)
+        apply_prefill(
+            configuration=CONFIGURATION, submission=submission, register=self.register
+        )
+
+        apply_prefill(
+            configuration=config, submission=submission, register=self.register
+        )
+
+        self.assertEqual(self.calls, [["random_string"], ["random_number"]])
+
+    def test_values_are_not_shared_between_submissions(self):
+        form_step = FormStepFactory.create(form_definition__configuration=CONFIGURATION)
+        submission1, submission2 = SubmissionFactory.create_batch(
+            2, form=form_step.form
+        )
+
+        for submission in (submission1, submission2):
+            apply_prefill(
+                configuration=CONFIGURATION,
+                submission=submission,
+                register=self.register,
+            )
+
+        self.assertEqual(len(self.calls), 2)
+
+    def test_values_are_stored_encrypted(self):
+        form_step = FormStepFactory.create(form_definition__configuration=CONFIGURATION)
+        submission = SubmissionFactory.create(form=form_step.form)
+
+        apply_prefill(
+            configuration=CONFIGURATION, submission=submission, register=self.register
+        )
+
+        cache_key = _get_cache_key(submission, "demo")
+        stored = caches["default"].get(cache_key)
+        self.assertIsNotNone(stored)
+        self.assertNotIn(b"value-random_string", stored)
+        self.assertEqual(
+            get_cached_values(submission, "demo"),
+            {"random_string": "value-random_string"},
+        )
+
+    def test_prefill_whole_form(self):
+        config = deepcopy(CONFIGURATION)
+        config["components"][0]["prefill"]["attribute"] = "random_number"
+        form_step1 = FormStepFactory.create(
+            form_definition__configuration=CONFIGURATION
+        )
+        form_step2 = FormStepFactory.create(
+            form=form_step1.form, form_definition__configuration=config
+        )
+        submission = SubmissionFactory.create(form=form_step1.form)
+
+        prefill_form(submission, register=self.register)
+
+        self.assertEqual(len(self.calls), 1)
+        self.assertEqual(set(self.calls[0]), {"random_string", "random_number"})
+
+        # rendering the steps uses the retrieved values
+        for form_step in (form_step1, form_step2):
+            apply_prefill(
+                configuration=form_step.form_definition.configuration,
+                submission=submission,
+                register=self.register,
+            )
+        self.assertEqual(len(self.calls), 1)
+
+
+class PrefillFailureTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(caches["default"].clear)
+
+        config = deepcopy(CONFIGURATION)
+        other_component = deepcopy(config["components"][0])
+        other_component.update(
+            {"key": "other", "prefill": {"plugin": "other", "attribute": "foo"}}
+        )
+        config["components"].append(other_component)
+        form_step = FormStepFactory.create(form_definition__configuration=config)
+        self.configuration = form_step.form_definition.configuration
+        self.submission = SubmissionFactory.create(form=form_step.form)
+
+    def _get_register(self, other_plugin_callback):
+        register = Registry()
+        register("demo")(DemoPrefill)
+
+        @register("other")
+        class Other(DemoPrefill):
+            @staticmethod
+            def get_prefill_values(submission, attributes):
+                return other_plugin_callback(attributes)
+
+        return register
+
+    def test_failing_plugin_provides_no_values(self):
+        def fail(attributes):
+            raise Exception("Service unavailable")
+
+        register = self._get_register(fail)
+
+        with patch("openforms.prefill.logevent.prefill_retrieve_failure") as mock_log:
+            new_configuration = apply_prefill(
+                configuration=self.configuration,
+                submission=self.submission,
+                register=register,
+            )
+
+        demo_field, other_field = new_configuration["components"]
+        self.assertIsInstance(demo_field["defaultValue"], str)
+        self.assertIsNone(other_field["defaultValue"])
+        mock_log.assert_called_once()
+
+    @override_settings(PREFILL_PLUGIN_TIMEOUT=0.1)
+    def test_slow_plugin_provides_no_values(self):
+        responded = threading.Event()
+        self.addCleanup(responded.set)
+
+        def hang(attributes):
+            responded.wait(timeout=5)
+            return {"foo": "too late"}
+
+        register = self._get_register(hang)
+
+        with patch("openforms.prefill.logevent.prefill_retrieve_failure") as mock_log:
+            new_configuration = apply_prefill(
+                configuration=self.configuration,
+                submission=self.submission,
+                register=register,
+            )
+
+        demo_field, other_field = new_configuration["components"]
+        self.assertIsInstance(demo_field["defaultValue"], str)
+        self.assertIsNone(other_field["defaultValue"])
+        mock_log.assert_called_once()
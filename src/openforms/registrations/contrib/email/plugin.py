@@ -1,17 +1,21 @@
 from mimetypes import types_map
-from typing import NoReturn
+from typing import List, NoReturn, Tuple
+from urllib.parse import urljoin
 
 from django.conf import settings
 from django.template import Context, Template
 from django.template.loader import get_template
+from django.urls import reverse
 from django.utils.safestring import mark_safe
 from django.utils.translation import ugettext_lazy as _
 
+from django_yubin.constants import PRIORITY_HEADER
+
 from openforms.emails.utils import sanitize_content
 from openforms.submissions.exports import create_submission_export
-from openforms.submissions.models import Submission
+from openforms.submissions.models import Submission, SubmissionFileAttachment
 from openforms.submissions.tasks.registration import set_submission_reference
-from openforms.utils.email import send_mail_plus
+from openforms.utils.email import make_attachment, send_mail_plus
 
 from ...base import BasePlugin
 from ...exceptions import NoSubmissionReference
@@ -20,6 +24,14 @@ from .config import EmailOptionsSerializer
 from .constants import AttachmentFormat
 
 
+def get_attachment_link(attachment: SubmissionFileAttachment) -> Tuple[str, str]:
+    path = reverse(
+        "admin:submissions_submissionfileattachment_content",
+        kwargs={"pk": attachment.pk},
+    )
+    return (attachment.get_display_name(), urljoin(settings.BASE_URL, path))
+
+
 @register("email")
 class EmailRegistration(BasePlugin):
     verbose_name = _("Email registration")
@@ -48,17 +60,34 @@ class EmailRegistration(BasePlugin):
             {% endfor %}
         """
 
+        attachments, attachment_links = self.get_attachments(submission)
+        if attachment_links:
+            template += str(
+                _(
+                    "The attachments are too large to send by e-mail, they can be "
+                    "downloaded from:"
+                )
+            )
+            template += """
+                {% for name, url in attachment_links %}
+                    {{ name }}: {{ url }}
+                {% endfor %}
+            """
+
         # render the e-mail body - the template from this model.
         rendered_content = Template(template).render(
-            Context({"submitted_data": submitted_data})
+            Context(
+                {
+                    "submitted_data": submitted_data,
+                    "attachment_links": attachment_links,
+                }
+            )
         )
         sanitized = sanitize_content(rendered_content)
 
         default_template = get_template("confirmation_mail.html")
         content = default_template.render({"body": mark_safe(sanitized)})
 
-        attachments = submission.attachments.as_mail_tuples()
-
         attachment_formats = options.get("attachment_formats", [])
         extra_attachments = []
         for attachment_format in attachment_formats:
@@ -74,10 +103,8 @@ class EmailRegistration(BasePlugin):
                     mime_type,
                 )
             elif attachment_format == AttachmentFormat.pdf:
-                attachment = (
-                    submission.report.title,
-                    submission.report.content.read(),
-                    mime_type,
+                attachment = make_attachment(
+                    submission.report.title, submission.report.content, mime_type
                 )
 
             extra_attachments.append(attachment)
@@ -90,8 +117,28 @@ class EmailRegistration(BasePlugin):
             fail_silently=False,
             html_message=content,
             attachments=attachments + extra_attachments,
+            headers={PRIORITY_HEADER: "low"},
         )
 
+    @staticmethod
+    def get_attachments(submission: Submission) -> Tuple[list, List[Tuple[str, str]]]:
+        """
+        Return the uploaded files to attach, or the links to them if too large.
+        """
+        uploads = list(submission.attachments.order_by("pk"))
+
+        max_size = settings.EMAIL_REGISTRATION_MAX_ATTACHMENT_SIZE * 1024 * 1024
+        if max_size and sum(upload.content.size for upload in uploads) > max_size:
+            return [], [get_attachment_link(upload) for upload in uploads]
+
+        attachments = [
+            make_attachment(
+                upload.get_display_name(), upload.content, upload.content_type
+            )
+            for upload in uploads
+        ]
+        return attachments, []
+
     def get_reference_from_result(self, result: None) -> NoReturn:
         raise NoSubmissionReference("Email plugin does not emit a reference")
 
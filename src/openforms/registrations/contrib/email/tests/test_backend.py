@@ -1,8 +1,10 @@
 from datetime import datetime
 from decimal import Decimal
+from unittest.mock import patch
 
 from django.core import mail
 from django.test import TestCase, override_settings
+from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import ugettext_lazy as _
 
@@ -22,12 +24,17 @@ from openforms.submissions.tests.factories import (
     SubmissionReportFactory,
     SubmissionStepFactory,
 )
+from openforms.utils.email import make_attachment
 
 from ....service import NoSubmissionReference, extract_submission_reference
 from ..constants import AttachmentFormat
 from ..plugin import EmailRegistration
 
 
+def get_attachment(part) -> tuple:
+    return part.get_filename(), part.get_payload(decode=True), part.get_content_type()
+
+
 @override_settings(DEFAULT_FROM_EMAIL="info@open-forms.nl")
 class EmailBackendTests(TestCase):
     @classmethod
@@ -91,14 +98,9 @@ class EmailBackendTests(TestCase):
         self.assertIn("some_list: value1, value2", message.body)
 
         self.assertEqual(len(message.attachments), 2)
-        file1, file2 = message.attachments
-        self.assertEqual(file1[0], "my-foo.bin")
-        self.assertEqual(file1[1], b"content")  # still bytes
-        self.assertEqual(file1[2], "application/foo")
-
-        self.assertEqual(file2[0], "my-bar.txt")
-        self.assertEqual(file2[1], "content")  # this is text now
-        self.assertEqual(file2[2], "text/bar")
+        file1, file2 = [get_attachment(part) for part in message.attachments]
+        self.assertEqual(file1, ("my-foo.bin", b"content", "application/foo"))
+        self.assertEqual(file2, ("my-bar.txt", b"content", "text/bar"))
 
     def test_submission_with_email_backend_strip_out_urls(self):
         email_form_options = dict(
@@ -290,13 +292,10 @@ class EmailBackendTests(TestCase):
         self.assertEqual(len(message.attachments), 4)
 
         file1, file2, csv_export, xlsx_export = message.attachments
-        self.assertEqual(file1[0], "my-foo.bin")
-        self.assertEqual(file1[1], b"content")  # still bytes
-        self.assertEqual(file1[2], "application/foo")
-
-        self.assertEqual(file2[0], "my-bar.txt")
-        self.assertEqual(file2[1], "content")  # this is text now
-        self.assertEqual(file2[2], "text/bar")
+        self.assertEqual(
+            get_attachment(file1), ("my-foo.bin", b"content", "application/foo")
+        )
+        self.assertEqual(get_attachment(file2), ("my-bar.txt", b"content", "text/bar"))
 
         qs = Submission.objects.filter(pk=submission.pk)
         self.assertEqual(
@@ -374,15 +373,73 @@ class EmailBackendTests(TestCase):
         self.assertEqual(len(message.attachments), 3)
 
         file1, file2, pdf_export = message.attachments
-        self.assertEqual(file1[0], "my-foo.bin")
-        self.assertEqual(file1[1], b"content")  # still bytes
-        self.assertEqual(file1[2], "application/foo")
+        self.assertEqual(
+            get_attachment(file1), ("my-foo.bin", b"content", "application/foo")
+        )
+        self.assertEqual(get_attachment(file2), ("my-bar.txt", b"content", "text/bar"))
 
-        self.assertEqual(file2[0], "my-bar.txt")
-        self.assertEqual(file2[1], "content")  # this is text now
-        self.assertEqual(file2[2], "text/bar")
+        report.content.seek(0)
+        self.assertEqual(
+            get_attachment(pdf_export),
+            (report.title, report.content.read(), "application/pdf"),
+        )
 
-        qs = Submission.objects.filter(pk=submission.pk)
-        self.assertEqual(pdf_export[0], report.title)
-        self.assertEqual(pdf_export[1], report.content.read())
-        self.assertEqual(pdf_export[2], "application/pdf")
+    @override_settings(
+        BASE_URL="https://forms.example.com", EMAIL_REGISTRATION_MAX_ATTACHMENT_SIZE=1
+    )
+    def test_large_attachments_are_linked(self):
+        submission = SubmissionFactory.create(form=self.form)
+        submission_step = SubmissionStepFactory.create(
+            submission=submission, form_step=self.fs, data={"foo": "bar"}
+        )
+        submission.completed_on = timezone.make_aware(datetime(2021, 1, 1, 12, 0, 0))
+        submission.save()
+        small = SubmissionFileAttachmentFactory.create(
+            submission_step=submission_step, file_name="small.txt"
+        )
+        large = SubmissionFileAttachmentFactory.create(
+            submission_step=submission_step,
+            file_name="large.bin",
+            content__data=b"x" * 1024 * 1024,
+        )
+
+        email_submission = EmailRegistration("email")
+        email_submission.register_submission(submission, {"to_emails": ["foo@bar.nl"]})
+
+        message = mail.outbox[0]
+        self.assertEqual(message.attachments, [])
+        for attachment in (small, large):
+            with self.subTest(attachment=attachment.file_name):
+                url = reverse(
+                    "admin:submissions_submissionfileattachment_content",
+                    kwargs={"pk": attachment.pk},
+                )
+                self.assertIn(
+                    f"{attachment.file_name}: https://forms.example.com{url}",
+                    message.body,
+                )
+
+    def test_attachment_encoded_in_chunks(self):
+        content = bytes(range(256)) * 1000
+        attachment = SubmissionFileAttachmentFactory.create(
+            file_name="data.bin", content__data=content
+        )
+
+        with patch("openforms.utils.email.ATTACHMENT_CHUNK_SIZE", 57 * 10 + 1):
+            part = make_attachment("data.bin", attachment.content, "application/foo")
+
+        self.assertEqual(part.get_payload(decode=True), content)
+        lines = part.get_payload().splitlines()
+        self.assertTrue(all(len(line) == 76 for line in lines[:-1]))
+
+    def test_encoded_attachment_spooled_to_disk(self):
+        content = bytes(range(256)) * 1000
+        attachment = SubmissionFileAttachmentFactory.create(
+            file_name="data.bin", content__data=content
+        )
+
+        with patch("openforms.utils.email.ATTACHMENT_SPOOL_SIZE", 1024):
+            part = make_attachment("data.bin", attachment.content, "application/foo")
+
+        self.assertIsInstance(part.get_payload(), str)
+        self.assertEqual(part.get_payload(decode=True), content)
@@ -1,30 +1,35 @@
 from copy import deepcopy
 from datetime import date
-from typing import Any, Dict, NoReturn
+from typing import Any, Dict, NoReturn, Union
 
+from django.conf import settings
 from django.utils.translation import ugettext_lazy as _
 
-from zgw_consumers.models import Service
+from openforms.contrib.clients import get_client
 
 # "Borrow" the functions from another plugin.
 from openforms.registrations.contrib.zgw_apis.service import (
     create_attachment,
     create_document,
 )
-from openforms.submissions.models import Submission, SubmissionReport
+from openforms.submissions.models import (
+    Submission,
+    SubmissionFileAttachment,
+    SubmissionReport,
+)
 
 from ...base import BasePlugin
 from ...exceptions import NoSubmissionReference
+from ...progress import (
+    get_registration_progress,
+    process_concurrently,
+    save_registration_progress,
+)
 from ...registry import register
 from .config import ObjectsAPIOptionsSerializer
 from .models import ObjectsAPIConfig
 
 
-def get_drc() -> Service:
-    config = ObjectsAPIConfig.get_solo()
-    return config.drc_service
-
-
 @register("objects_api")
 class ObjectsAPIRegistration(BasePlugin):
     verbose_name = _("Objects API registration")
@@ -36,33 +41,66 @@ class ObjectsAPIRegistration(BasePlugin):
         config = ObjectsAPIConfig.get_solo()
         config.apply_defaults_to(options)
 
-        submission_report = SubmissionReport.objects.get(submission=submission)
+        # the progress of a previous (failed) attempt, so retries don't upload the
+        # documents again
+        progress = get_registration_progress(submission, self.identifier)
+        progress.setdefault("attachments", {})
+
         submission_report_options = deepcopy(options)
         submission_report_options["informatieobjecttype"] = options[
             "informatieobjecttype_submission_report"
         ]
-        document = create_document(
-            submission.form.admin_name,
-            submission_report,
-            submission_report_options,
-            get_drc=get_drc,
-        )
-
         attachment_options = deepcopy(options)
         attachment_options["informatieobjecttype"] = options[
             "informatieobjecttype_attachment"
         ]
-        attachments = []
-        for attachment in submission.attachments:
-            attachment_document = create_attachment(
-                submission.form.admin_name,
-                attachment,
-                attachment_options,
-                get_drc=get_drc,
-            )
-            attachments.append(attachment_document["url"])
-
-        objects_client = config.objects_service.build_client()
+
+        # upload the report and attachments concurrently
+        name = submission.form.admin_name
+        drc = config.drc_service
+        uploads = []
+        if "document" not in progress:
+            uploads.append(SubmissionReport.objects.get(submission=submission))
+        submission_attachments = list(submission.attachments.order_by("pk"))
+        uploads += [
+            attachment
+            for attachment in submission_attachments
+            if str(attachment.pk) not in progress["attachments"]
+        ]
+
+        def upload(obj: Union[SubmissionReport, SubmissionFileAttachment]) -> dict:
+            if isinstance(obj, SubmissionReport):
+                return create_document(
+                    name, obj, submission_report_options, get_drc=lambda: drc
+                )
+            return create_attachment(name, obj, attachment_options, get_drc=lambda: drc)
+
+        def on_uploaded(obj, document: dict):
+            if isinstance(obj, SubmissionReport):
+                progress["document"] = document
+            else:
+                progress["attachments"][str(obj.pk)] = document
+            save_registration_progress(submission, self.identifier, progress)
+
+        process_concurrently(
+            upload,
+            uploads,
+            on_success=on_uploaded,
+            max_workers=settings.REGISTRATION_MAX_WORKERS,
+            describe=lambda obj: (
+                obj.title
+                if isinstance(obj, SubmissionReport)
+                else obj.get_display_name()
+            ),
+        )
+
+        document = progress["document"]
+        attachments = [
+            progress["attachments"][str(attachment.pk)]["url"]
+            for attachment in submission_attachments
+        ]
+
+        objects_client = get_client(config.objects_service)
 
         object_data = {
             "data": submission.get_merged_data(),
@@ -1,6 +1,6 @@
 from datetime import date
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 import requests_mock
 from zds_client.oas import schema_fetcher
@@ -19,6 +19,9 @@ from .factories import ObjectsAPIConfigFactory
 
 
 @requests_mock.Mocker()
+# upload the documents one after the other to keep the request_history order
+# consistent
+@override_settings(REGISTRATION_MAX_WORKERS=1)
 class ObjectsAPIBackendTests(TestCase):
     maxDiff = None
 
@@ -818,6 +821,67 @@ class ObjectsAPIBackendTests(TestCase):
         self.assertEqual(object_create.url, "https://objecten.nl/api/v1/objects")
         self.assertDictEqual(object_create_body, expected_object_body)
 
+    def test_retry_resumes_previous_attempt(self, m):
+        submission = SubmissionFactory.from_data({"voornaam": "Foo"})
+        attachment1, attachment2 = SubmissionFileAttachmentFactory.create_batch(
+            2, submission_step__submission=submission
+        )
+        submission.registration_result = {
+            "progress": {
+                "objects_api": {
+                    "document": {
+                        "url": "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/1"
+                    },
+                    "attachments": {
+                        str(attachment1.pk): {
+                            "url": "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/2"
+                        }
+                    },
+                }
+            },
+            "traceback": "...",
+        }
+        submission.save()
+
+        mock_service_oas_get(m, "https://objecten.nl/api/v1/", "objecten")
+        mock_service_oas_get(m, "https://documenten.nl/api/v1/", "documenten")
+        m.post(
+            "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten",
+            status_code=201,
+            json=generate_oas_component(
+                "documenten",
+                "schemas/EnkelvoudigInformatieObject",
+                url="https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/3",
+            ),
+        )
+        m.post(
+            "https://objecten.nl/api/v1/objects",
+            status_code=201,
+            json={"url": "https://objecten.nl/api/v1/objects/1"},
+        )
+
+        plugin = ObjectsAPIRegistration("objects_api")
+        plugin.register_submission(submission, {})
+
+        # only the missing attachment is uploaded
+        created = [request for request in m.request_history if request.method == "POST"]
+        self.assertEqual(len(created), 2)
+        self.assertEqual(
+            created[0].json()["bestandsnaam"], attachment2.get_display_name()
+        )
+        object_data = created[1].json()["record"]["data"]
+        self.assertEqual(
+            object_data["pdf_url"],
+            "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/1",
+        )
+        self.assertEqual(
+            object_data["attachments"],
+            [
+                "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/2",
+                "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/3",
+            ],
+        )
+
     def test_no_reference_can_be_extracted(self, m):
         submission = SubmissionFactory.create(
             form__registration_backend="objects_api",
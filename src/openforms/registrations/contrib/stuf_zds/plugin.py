@@ -2,6 +2,7 @@ import re
 from dataclasses import dataclass
 from typing import Dict, Optional
 
+from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
@@ -11,13 +12,22 @@ from openforms.registrations.constants import (
     REGISTRATION_ATTRIBUTE,
     RegistrationAttribute,
 )
+from openforms.registrations.progress import (
+    get_registration_progress,
+    process_concurrently,
+    save_registration_progress,
+)
 from openforms.registrations.registry import register
 from openforms.submissions.mapping import (
     FieldConf,
     apply_data_mapping,
     get_unmapped_data,
 )
-from openforms.submissions.models import Submission, SubmissionReport
+from openforms.submissions.models import (
+    Submission,
+    SubmissionFileAttachment,
+    SubmissionReport,
+)
 from openforms.utils.mixins import JsonSchemaSerializerMixin
 from stuf.stuf_zds.models import StufZDSConfig
 
@@ -123,30 +133,55 @@ class StufZDSRegistration(BasePlugin):
 
         client = config.get_client(options)
 
-        zaak_id = client.create_zaak_identificatie()
+        # the progress of a previous (failed) attempt, so retries don't create the
+        # zaak and documents again
+        result = get_registration_progress(submission, self.identifier)
+        result.setdefault("attachments", {})
 
-        zaak_data = apply_data_mapping(
-            submission, self.zaak_mapping, REGISTRATION_ATTRIBUTE
-        )
-        extra_data = get_unmapped_data(
-            submission, self.zaak_mapping, REGISTRATION_ATTRIBUTE
-        )
+        zaak_id = result.get("zaak")
+        if zaak_id is None:
+            zaak_id = client.create_zaak_identificatie()
 
-        client.create_zaak(zaak_id, zaak_data, extra_data)
+            zaak_data = apply_data_mapping(
+                submission, self.zaak_mapping, REGISTRATION_ATTRIBUTE
+            )
+            extra_data = get_unmapped_data(
+                submission, self.zaak_mapping, REGISTRATION_ATTRIBUTE
+            )
 
-        doc_id = client.create_document_identificatie()
+            client.create_zaak(zaak_id, zaak_data, extra_data)
+            result["zaak"] = zaak_id
+            save_registration_progress(submission, self.identifier, result)
 
-        submission_report = SubmissionReport.objects.get(submission=submission)
-        client.create_zaak_document(zaak_id, doc_id, submission_report)
+        if "document" not in result:
+            doc_id = client.create_document_identificatie()
 
-        for attachment in submission.attachments:
+            submission_report = SubmissionReport.objects.get(submission=submission)
+            client.create_zaak_document(zaak_id, doc_id, submission_report)
+            result["document"] = doc_id
+            save_registration_progress(submission, self.identifier, result)
+
+        def upload(attachment: SubmissionFileAttachment) -> str:
             attachment_doc_id = client.create_document_identificatie()
             client.create_zaak_attachment(zaak_id, attachment_doc_id, attachment)
+            return attachment_doc_id
+
+        def on_uploaded(attachment: SubmissionFileAttachment, attachment_doc_id: str):
+            result["attachments"][str(attachment.pk)] = attachment_doc_id
+            save_registration_progress(submission, self.identifier, result)
+
+        process_concurrently(
+            upload,
+            [
+                attachment
+                for attachment in submission.attachments.order_by("pk")
+                if str(attachment.pk) not in result["attachments"]
+            ],
+            on_success=on_uploaded,
+            max_workers=settings.STUF_ZDS_MAX_WORKERS,
+            describe=lambda attachment: attachment.get_display_name(),
+        )
 
-        result = {
-            "zaak": zaak_id,
-            "document": doc_id,
-        }
         return result
 
     def get_reference_from_result(self, result: Dict[str, str]) -> str:
@@ -1,8 +1,10 @@
 import dataclasses
+import itertools
+import threading
 from unittest.mock import patch
 
 from django.template import loader
-from django.test import TestCase
+from django.test import TestCase, TransactionTestCase, override_settings
 
 import requests_mock
 from lxml import etree
@@ -10,11 +12,13 @@ from lxml.etree import ElementTree
 from privates.test import temp_private_root
 
 from openforms.logging.models import TimelineLogProxy
+from openforms.registrations.exceptions import RegistrationFailed
 from openforms.submissions.tests.factories import (
     SubmissionFactory,
     SubmissionFileAttachmentFactory,
 )
-from stuf.stuf_zds.client import nsmap
+from openforms.tests.utils import NOOP_CACHES
+from stuf.stuf_zds.client import StreamingSOAPBody, nsmap
 from stuf.stuf_zds.models import StufZDSConfig
 from stuf.tests.factories import StufServiceFactory
 
@@ -29,17 +33,24 @@ def load_mock(name, context=None):
     ).encode("utf8")
 
 
+def get_request_text(request) -> str:
+    # documents are sent as a streamed request body
+    if isinstance(request.body, StreamingSOAPBody):
+        return b"".join(request.body).decode("utf8")
+    return request.text or ""
+
+
 def match_text(text):
     # requests_mock matcher for SOAP requests
     def _matcher(request):
-        return text in (request.text or "")
+        return text in get_request_text(request)
 
     return _matcher
 
 
 def xml_from_request_history(m, index) -> ElementTree:
     request = m.request_history[index]
-    xml = etree.fromstring(bytes(request.text, encoding="utf8"))
+    xml = etree.fromstring(bytes(get_request_text(request), encoding="utf8"))
     return xml
 
 
@@ -303,6 +314,7 @@ class StufZDSPluginTests(StufTestBase):
             {
                 "zaak": "foo-zaak",
                 "document": "bar-document",
+                "attachments": {str(attachment.pk): "bar-document"},
             },
         )
 
@@ -395,6 +407,65 @@ class StufZDSPluginTests(StufTestBase):
             6,
         )
 
+    def test_plugin_resumes_previous_attempt(self, m):
+        submission = SubmissionFactory.from_components(
+            [{"key": "voornaam"}],
+            submitted_data={"voornaam": "Foo"},
+        )
+        uploaded, pending = SubmissionFileAttachmentFactory.create_batch(
+            2, submission_step=submission.steps[0]
+        )
+        submission.registration_result = {
+            "progress": {
+                "stuf": {
+                    "zaak": "foo-zaak",
+                    "document": "bar-document",
+                    "attachments": {str(uploaded.pk): "uploaded-document"},
+                }
+            },
+            "traceback": "...",
+        }
+        submission.save()
+
+        m.post(
+            self.service.soap_service.url,
+            content=load_mock(
+                "genereerDocumentIdentificatie.xml",
+                {"document_identificatie": "pending-document"},
+            ),
+            additional_matcher=match_text("genereerDocumentIdentificatie_Di02"),
+        )
+        m.post(
+            self.service.soap_service.url,
+            content=load_mock("voegZaakdocumentToe.xml"),
+            additional_matcher=match_text("edcLk01"),
+        )
+
+        plugin = StufZDSRegistration("stuf")
+        result = plugin.register_submission(submission, {})
+
+        self.assertEqual(
+            result,
+            {
+                "zaak": "foo-zaak",
+                "document": "bar-document",
+                "attachments": {
+                    str(uploaded.pk): "uploaded-document",
+                    str(pending.pk): "pending-document",
+                },
+            },
+        )
+        # only the missing attachment is added to the existing zaak
+        self.assertEqual(len(m.request_history), 2)
+        xml_doc = xml_from_request_history(m, 1)
+        self.assertXPathEqualDict(
+            xml_doc,
+            {
+                "//zkn:object/zkn:inhoud/@stuf:bestandsnaam": pending.file_name,
+                "//zkn:object/zkn:isRelevantVoor/zkn:gerelateerde/zkn:identificatie": "foo-zaak",
+            },
+        )
+
     def test_reference_can_be_extracted(self, m):
         submission = SubmissionFactory.create(
             form__registration_backend="stuf-zds-create-zaak",
@@ -406,3 +477,143 @@ class StufZDSPluginTests(StufTestBase):
         reference = extract_submission_reference(submission)
 
         self.assertEqual("abcd1234", reference)
+
+
+class StubStufZDSClient:
+    """
+    Thread-safe stand-in for the StUF-ZDS client, recording the uploads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._document_numbers = itertools.count(1)
+        self.uploads = []
+
+    def create_zaak_identificatie(self):
+        return "foo-zaak"
+
+    def create_zaak(self, zaak_id, zaak_data, extra_data):
+        pass
+
+    def create_document_identificatie(self):
+        with self._lock:
+            return f"document-{next(self._document_numbers)}"
+
+    def create_zaak_document(self, zaak_id, doc_id, submission_report):
+        pass
+
+    def create_zaak_attachment(self, zaak_id, doc_id, attachment):
+        if attachment.file_name.startswith("broken-"):
+            raise RegistrationFailed("error while making backend request")
+        with self._lock:
+            self.uploads.append((zaak_id, doc_id, attachment.pk))
+
+
+@temp_private_root()
+@override_settings(CACHES=NOOP_CACHES, STUF_ZDS_MAX_WORKERS=3)
+class StufZDSConcurrentAttachmentTests(TransactionTestCase):
+    # the attachments are uploaded from other threads, which use their own database
+    # connections
+
+    def setUp(self):
+        super().setUp()
+
+        self.submission = SubmissionFactory.from_components(
+            [{"key": "voornaam"}],
+            submitted_data={"voornaam": "Foo"},
+        )
+        self.attachments = [
+            SubmissionFileAttachmentFactory.create(
+                submission_step=self.submission.steps[0], file_name=file_name
+            )
+            for file_name in (
+                "one.pdf",
+                "broken-two.pdf",
+                "three.pdf",
+                "broken-four.pdf",
+            )
+        ]
+
+        # the HTTP layer is not involved, the uploads only meet in the stub client
+        self.stuf_client = StubStufZDSClient()
+        patcher = patch.object(
+            StufZDSConfig, "get_client", return_value=self.stuf_client
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_all_attachments_uploaded(self):
+        for attachment in self.attachments:
+            attachment.file_name = attachment.file_name.replace("broken-", "")
+            attachment.save()
+
+        result = StufZDSRegistration("stuf").register_submission(self.submission, {})
+
+        self.assertEqual(len(self.stuf_client.uploads), len(self.attachments))
+        self.assertEqual(
+            result["attachments"],
+            {
+                str(attachment_pk): doc_id
+                for _, doc_id, attachment_pk in self.stuf_client.uploads
+            },
+        )
+        self.assertEqual(
+            set(result["attachments"]),
+            {str(attachment.pk) for attachment in self.attachments},
+        )
+        # the report is the first document, every attachment gets its own document
+        self.assertEqual(result["document"], "document-1")
+        self.assertEqual(
+            len(set(result["attachments"].values())), len(self.attachments)
+        )
+
+    def test_failures_are_aggregated_and_progress_is_kept(self):
+        one, two, three, four = self.attachments
+
+        with self.assertRaises(RegistrationFailed) as cm:
+            StufZDSRegistration("stuf").register_submission(self.submission, {})
+
+        message = str(cm.exception)
+        self.assertIn("2 of 4 uploads failed", message)
+        self.assertLess(
+            message.index("broken-two.pdf"), message.index("broken-four.pdf")
+        )
+        self.assertIsInstance(cm.exception.__cause__, RegistrationFailed)
+
+        uploaded = {
+            str(attachment_pk): doc_id
+            for _, doc_id, attachment_pk in self.stuf_client.uploads
+        }
+        self.assertEqual(set(uploaded), {str(one.pk), str(three.pk)})
+        self.submission.refresh_from_db()
+        self.assertEqual(
+            self.submission.registration_result,
+            {
+                "progress": {
+                    "stuf": {
+                        "zaak": "foo-zaak",
+                        "document": "document-1",
+                        "attachments": uploaded,
+                    }
+                }
+            },
+        )
+
+    def test_progress_of_other_backend_is_ignored(self):
+        for attachment in self.attachments:
+            attachment.delete()
+        zgw_progress = {"zaak": {"url": "https://zaken.nl/api/v1/zaken/1"}}
+        self.submission.registration_result = {
+            "progress": {"zgw": zgw_progress},
+            "traceback": "...",
+        }
+        self.submission.save()
+
+        result = StufZDSRegistration("stuf").register_submission(self.submission, {})
+
+        self.assertEqual(result["zaak"], "foo-zaak")
+        self.submission.refresh_from_db()
+        self.assertEqual(
+            self.submission.registration_result["progress"],
+            {"zgw": zgw_progress, "stuf": result},
+        )
@@ -1,8 +1,11 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.http import HttpResponseRedirect
+from django.utils.translation import gettext_lazy as _
 
 from solo.admin import SingletonModelAdmin
 from zgw_consumers.admin import ListZaaktypenMixin
 
+from .catalogi import invalidate_catalogi_cache
 from .models import ZgwConfig
 
 
@@ -12,3 +15,14 @@ class ZgwConfigAdmin(ListZaaktypenMixin, SingletonModelAdmin):
         "zaaktype",
     ]
     # TODO implement informatieobjecttype suggestions similar to zaaktype
+
+    def response_change(self, request, obj):
+        if "_clear_catalogi_cache" in request.POST and obj.ztc_service:
+            invalidate_catalogi_cache(obj.ztc_service)
+            self.message_user(
+                request,
+                _("The cached Catalogi API resources were cleared."),
+                messages.SUCCESS,
+            )
+            return HttpResponseRedirect(request.path)
+        return super().response_change(request, obj)
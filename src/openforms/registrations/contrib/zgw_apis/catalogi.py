@@ -0,0 +1,93 @@
+"""
+Cache the resources looked up in the Catalogi API.
+
+Registering a submission looks up the ROLTYPE and STATUSTYPE of the zaaktype - the
+only Catalogi API lookups of the ZGW registration. These catalogue resources rarely
+change, so the responses are cached per Catalogi API service and query, for the
+timeout configured in the :class:`ZgwConfig`.
+
+The cache of a service can be invalidated from the admin, after the catalogue was
+changed. When an entry expires, only one process fetches it again - the others wait
+for the result rather than all calling the Catalogi API at the same time.
+"""
+import hashlib
+import json
+import time
+import uuid
+
+from django.core.cache import caches
+
+from zgw_consumers.models import Service
+
+from openforms.contrib.clients import get_client
+
+from .models import ZgwConfig
+
+__all__ = ["list_catalogi_resource", "invalidate_catalogi_cache"]
+
+CACHE_ALIAS = "default"
+KEY_PREFIX = "zgw-catalogi"
+# maximum time (in seconds) other processes wait for the process fetching a resource
+LOCK_TIMEOUT = 10
+POLL_INTERVAL = 0.1
+
+
+def _get_generation(service: Service) -> str:
+    cache = caches[CACHE_ALIAS]
+    key = f"{KEY_PREFIX}:{service.pk}:generation"
+    cache.add(key, uuid.uuid4().hex, timeout=None)
+    # fall back to a generation that is never cached when the cache is unavailable
+    return cache.get(key) or uuid.uuid4().hex
+
+
+def _get_cache_key(service: Service, resource: str, query_params: dict) -> str:
+    query = hashlib.md5(
+        json.dumps(query_params, sort_keys=True).encode("utf-8")
+    ).hexdigest()
+    return f"{KEY_PREFIX}:{service.pk}:{_get_generation(service)}:{resource}:{query}"
+
+
+def list_catalogi_resource(config: ZgwConfig, resource: str, query_params: dict):
+    """
+    Return the (cached) response of listing a resource of the Catalogi API.
+    """
+    client = get_client(config.ztc_service)
+    timeout = config.catalogi_cache_timeout
+    if not timeout:
+        return client.list(resource, query_params)
+
+    cache = caches[CACHE_ALIAS]
+    cache_key = _get_cache_key(config.ztc_service, resource, query_params)
+    lock_key = f"{cache_key}:lock"
+
+    response = cache.get(cache_key)
+    if response is not None:
+        return response
+
+    locked = cache.add(lock_key, True, timeout=LOCK_TIMEOUT)
+    if not locked:
+        # another process is fetching the resource, wait for it to complete. When it
+        # failed (or the cache is unavailable), fetch the resource anyway.
+        deadline = time.monotonic() + LOCK_TIMEOUT
+        while cache.get(lock_key) and time.monotonic() < deadline:
+            time.sleep(POLL_INTERVAL)
+        response = cache.get(cache_key)
+        if response is not None:
+            return response
+
+    try:
+        response = client.list(resource, query_params)
+        cache.set(cache_key, response, timeout=timeout)
+    finally:
+        if locked:
+            cache.delete(lock_key)
+    return response
+
+
+def invalidate_catalogi_cache(service: Service) -> None:
+    """
+    Discard the cached resources of the Catalogi API service.
+    """
+    caches[CACHE_ALIAS].set(
+        f"{KEY_PREFIX}:{service.pk}:generation", uuid.uuid4().hex, timeout=None
+    )
@@ -0,0 +1,20 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("zgw_apis", "0004_auto_20210902_2120"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zgwconfig",
+            name="catalogi_cache_timeout",
+            field=models.PositiveIntegerField(
+                default=3600,
+                help_text="Number of seconds the resources looked up in the Catalogi API (like ROLTYPEN and STATUSTYPEN) are cached. Use 0 to disable the cache.",
+                verbose_name="Catalogi API cache timeout",
+            ),
+        ),
+    ]
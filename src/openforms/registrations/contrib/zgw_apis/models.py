@@ -57,6 +57,14 @@ class ZgwConfig(SingletonModel):
         validators=[validate_rsin],
         help_text=_("Default RSIN of organization, which creates the ZAAK"),
     )
+    catalogi_cache_timeout = models.PositiveIntegerField(
+        _("Catalogi API cache timeout"),
+        default=60 * 60,
+        help_text=_(
+            "Number of seconds the resources looked up in the Catalogi API (like "
+            "ROLTYPEN and STATUSTYPEN) are cached. Use 0 to disable the cache."
+        ),
+    )
 
     class Meta:
         verbose_name = _("ZGW API's configuration")
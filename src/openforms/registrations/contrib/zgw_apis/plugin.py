@@ -1,5 +1,6 @@
-from typing import Dict, Optional
+from typing import Dict, Optional, Union
 
+from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 
 from rest_framework import serializers
@@ -20,9 +21,18 @@ from openforms.registrations.contrib.zgw_apis.service import (
     relate_document,
     set_zaak_payment,
 )
+from openforms.registrations.progress import (
+    get_registration_progress,
+    process_concurrently,
+    save_registration_progress,
+)
 from openforms.registrations.registry import register
 from openforms.submissions.mapping import FieldConf, apply_data_mapping
-from openforms.submissions.models import Submission, SubmissionReport
+from openforms.submissions.models import (
+    Submission,
+    SubmissionFileAttachment,
+    SubmissionReport,
+)
 from openforms.utils.mixins import JsonSchemaSerializerMixin
 from openforms.utils.validators import validate_rsin
 
@@ -78,34 +88,78 @@ class ZGWRegistration(BasePlugin):
         zgw = ZgwConfig.get_solo()
         zgw.apply_defaults_to(options)
 
-        zaak = create_zaak(options, payment_required=submission.payment_required)
+        # the progress of a previous (failed) attempt, so retries only create what's
+        # missing
+        result = get_registration_progress(submission, self.identifier)
+        result.setdefault("attachments", {})
+        result.setdefault("relations", {})
 
-        submission_report = SubmissionReport.objects.get(submission=submission)
-        document = create_document(
-            submission.form.admin_name, submission_report, options
-        )
-        relate_document(zaak["url"], document["url"])
+        if "zaak" not in result:
+            result["zaak"] = create_zaak(
+                options, payment_required=submission.payment_required
+            )
+            save_registration_progress(submission, self.identifier, result)
+        zaak = result["zaak"]
 
-        rol_data = apply_data_mapping(
-            submission, self.rol_mapping, REGISTRATION_ATTRIBUTE
+        # upload the report and attachments concurrently
+        name = submission.form.admin_name
+        drc = zgw.drc_service
+        uploads = []
+        if "document" not in result:
+            uploads.append(SubmissionReport.objects.get(submission=submission))
+        attachments = list(submission.attachments.order_by("pk"))
+        uploads += [
+            attachment
+            for attachment in attachments
+            if str(attachment.pk) not in result["attachments"]
+        ]
+
+        def upload(obj: Union[SubmissionReport, SubmissionFileAttachment]) -> dict:
+            if isinstance(obj, SubmissionReport):
+                return create_document(name, obj, options, get_drc=lambda: drc)
+            return create_attachment(name, obj, options, get_drc=lambda: drc)
+
+        def on_uploaded(obj, document: dict):
+            if isinstance(obj, SubmissionReport):
+                result["document"] = document
+            else:
+                result["attachments"][str(obj.pk)] = document
+            save_registration_progress(submission, self.identifier, result)
+
+        process_concurrently(
+            upload,
+            uploads,
+            on_success=on_uploaded,
+            max_workers=settings.REGISTRATION_MAX_WORKERS,
+            describe=lambda obj: (
+                obj.title
+                if isinstance(obj, SubmissionReport)
+                else obj.get_display_name()
+            ),
         )
-        rol = create_rol(zaak, rol_data, options)
-
-        # for now create generic status
-        status = create_status(zaak)
 
-        for attachment in submission.attachments:
-            attachment = create_attachment(
-                submission.form.admin_name, attachment, options
+        documents = [result["document"]] + [
+            result["attachments"][str(attachment.pk)] for attachment in attachments
+        ]
+        for document in documents:
+            if document["url"] in result["relations"]:
+                continue
+            zio = relate_document(zaak["url"], document["url"])
+            result["relations"][document["url"]] = zio["url"]
+            save_registration_progress(submission, self.identifier, result)
+
+        if "rol" not in result:
+            rol_data = apply_data_mapping(
+                submission, self.rol_mapping, REGISTRATION_ATTRIBUTE
             )
-            relate_document(zaak["url"], attachment["url"])
-
-        result = {
-            "zaak": zaak,
-            "document": document,
-            "status": status,
-            "rol": rol,
-        }
+            result["rol"] = create_rol(zaak, rol_data, options)
+            save_registration_progress(submission, self.identifier, result)
+
+        if "status" not in result:
+            # for now create generic status
+            result["status"] = create_status(zaak)
+            save_registration_progress(submission, self.identifier, result)
+
         return result
 
     def get_reference_from_result(self, result: Dict[str, str]) -> str:
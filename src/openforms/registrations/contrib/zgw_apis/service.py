@@ -7,15 +7,18 @@ from django.utils import timezone
 
 from zgw_consumers.models import Service
 
+from openforms.contrib.clients import get_client, get_client_for_url
 from openforms.registrations.contrib.zgw_apis.models import ZgwConfig
 from openforms.submissions.models import SubmissionFileAttachment, SubmissionReport
 
+from .catalogi import list_catalogi_resource
+
 logger = logging.getLogger(__name__)
 
 
 def create_zaak(options: dict, payment_required: bool = False) -> dict:
     config = ZgwConfig.get_solo()
-    client = config.zrc_service.build_client()
+    client = get_client(config.zrc_service)
     today = date.today().isoformat()
     data = {
         "zaaktype": options["zaaktype"],
@@ -41,7 +44,7 @@ def default_get_drc() -> Service:
 
 def partial_update_zaak(zaak_url: str, data: dict) -> dict:
     config = ZgwConfig.get_solo()
-    client = config.zrc_service.build_client()
+    client = get_client(config.zrc_service)
     zaak = client.partial_update("zaak", data, url=zaak_url)
     return zaak
 
@@ -60,7 +63,7 @@ def create_document(
     options: dict,
     get_drc=default_get_drc,
 ) -> dict:
-    client = get_drc().build_client()
+    client = get_client(get_drc())
     today = date.today().isoformat()
 
     submission_report.content.seek(0)
@@ -92,7 +95,7 @@ def create_attachment(
     options: dict,
     get_drc=default_get_drc,
 ) -> dict:
-    client = get_drc().build_client()
+    client = get_client(get_drc())
     today = date.today().isoformat()
 
     submission_attachment.content.seek(0)
@@ -119,7 +122,7 @@ def create_attachment(
 
 
 def relate_document(zaak_url: str, document_url: str) -> dict:
-    client = Service.get_client(zaak_url)
+    client = get_client_for_url(zaak_url)
     data = {"zaak": zaak_url, "informatieobject": document_url}
 
     zio = client.create("zaakinformatieobject", data)
@@ -128,12 +131,11 @@ def relate_document(zaak_url: str, document_url: str) -> dict:
 
 def create_rol(zaak: dict, initiator: dict, options: dict) -> Optional[dict]:
     config = ZgwConfig.get_solo()
-    ztc_client = config.ztc_service.build_client()
     query_params = {
         "zaaktype": options["zaaktype"],
         "omschrijvingGeneriek": initiator.get("omschrijvingGeneriek", "initiator"),
     }
-    rol_typen = ztc_client.list("roltype", query_params)
+    rol_typen = list_catalogi_resource(config, "roltype", query_params)
     if not rol_typen or not rol_typen.get("results"):
         logger.warning(
             "Roltype specified, but no matching roltype found in the zaaktype.",
@@ -141,7 +143,7 @@ def create_rol(zaak: dict, initiator: dict, options: dict) -> Optional[dict]:
         )
         return None
 
-    zrc_client = config.zrc_service.build_client()
+    zrc_client = get_client(config.zrc_service)
     data = {
         "zaak": zaak["url"],
         # "betrokkene": initiator.get("betrokkene", ""),
@@ -159,16 +161,15 @@ def create_status(zaak: dict) -> dict:
     config = ZgwConfig.get_solo()
 
     # get statustype for initial status
-    ztc_client = config.ztc_service.build_client()
-    statustypen = ztc_client.list("statustype", {"zaaktype": zaak["zaaktype"]})[
-        "results"
-    ]
+    statustypen = list_catalogi_resource(
+        config, "statustype", {"zaaktype": zaak["zaaktype"]}
+    )["results"]
     statustype = next(filter(lambda x: x["volgnummer"] == 1, statustypen))
 
     initial_status_remarks = ""  # variables.get("initialStatusRemarks", "")
 
     # create status
-    zrc_client = config.zrc_service.build_client()
+    zrc_client = get_client(config.zrc_service)
     data = {
         "zaak": zaak["url"],
         "statustype": statustype["url"],
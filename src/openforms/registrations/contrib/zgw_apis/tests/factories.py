@@ -11,9 +11,16 @@ class ServiceFactory(factory.django.DjangoModelFactory):
 
 
 class ZgwConfigFactory(factory.django.DjangoModelFactory):
-    zrc_service = factory.SubFactory(ServiceFactory, api_type=APITypes.zrc)
-    drc_service = factory.SubFactory(ServiceFactory, api_type=APITypes.drc)
-    ztc_service = factory.SubFactory(ServiceFactory, api_type=APITypes.ztc)
+    # the API roots of the services must be unique
+    zrc_service = factory.SubFactory(
+        ServiceFactory, api_type=APITypes.zrc, api_root="https://zaken.nl/api/v1/"
+    )
+    drc_service = factory.SubFactory(
+        ServiceFactory, api_type=APITypes.drc, api_root="https://documenten.nl/api/v1/"
+    )
+    ztc_service = factory.SubFactory(
+        ServiceFactory, api_type=APITypes.ztc, api_root="https://catalogus.nl/api/v1/"
+    )
 
     class Meta:
         model = ZgwConfig
@@ -1,6 +1,6 @@
 from decimal import Decimal
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 import requests_mock
 from freezegun import freeze_time
@@ -13,6 +13,7 @@ from openforms.submissions.tests.factories import (
     SubmissionFactory,
     SubmissionFileAttachmentFactory,
 )
+from openforms.tests.utils import NOOP_CACHES
 
 from ....constants import RegistrationAttribute
 from ....service import extract_submission_reference
@@ -22,6 +23,9 @@ from .factories import ZgwConfigFactory
 
 @temp_private_root()
 @requests_mock.Mocker(real_http=False)
+# upload the documents one after the other to keep the request_history indexes
+# consistent
+@override_settings(CACHES=NOOP_CACHES, REGISTRATION_MAX_WORKERS=1)
 class ZGWBackendTests(TestCase):
     @classmethod
     def setUpTestData(cls):
@@ -252,7 +256,7 @@ class ZGWBackendTests(TestCase):
             "https://catalogi.nl/api/v1/informatieobjecttypen/1",
         )
 
-        create_zio = m.request_history[4]
+        create_zio = m.request_history[5]
         create_zio_body = create_zio.json()
         self.assertEqual(create_zio.method, "POST")
         self.assertEqual(
@@ -264,7 +268,7 @@ class ZGWBackendTests(TestCase):
             "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/1",
         )
 
-        create_rol = m.request_history[7]
+        create_rol = m.request_history[9]
         create_rol_body = create_rol.json()
         self.assertEqual(create_rol.method, "POST")
         self.assertEqual(create_rol.url, "https://zaken.nl/api/v1/rollen")
@@ -284,7 +288,7 @@ class ZGWBackendTests(TestCase):
             },
         )
 
-        create_status = m.request_history[9]
+        create_status = m.request_history[11]
         create_status_body = create_status.json()
         self.assertEqual(create_status.method, "POST")
         self.assertEqual(create_status.url, "https://zaken.nl/api/v1/statussen")
@@ -294,7 +298,7 @@ class ZGWBackendTests(TestCase):
             "https://catalogus.nl/api/v1/statustypen/1",
         )
 
-        create_attachment = m.request_history[10]
+        create_attachment = m.request_history[4]
         create_attachment_body = create_attachment.json()
         self.assertEqual(create_attachment.method, "POST")
         self.assertEqual(
@@ -304,7 +308,7 @@ class ZGWBackendTests(TestCase):
         self.assertEqual(create_attachment_body["bestandsnaam"], attachment.file_name)
         self.assertEqual(create_attachment_body["formaat"], attachment.content_type)
 
-        relate_attachment = m.request_history[11]
+        relate_attachment = m.request_history[6]
         relate_attachment_body = relate_attachment.json()
         self.assertEqual(relate_attachment.method, "POST")
         self.assertEqual(
@@ -318,6 +322,70 @@ class ZGWBackendTests(TestCase):
             "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/2",
         )
 
+    def test_retry_resumes_previous_attempt(self, m):
+        submission = SubmissionFactory.from_data({"voornaam": "Foo"})
+        attachment = SubmissionFileAttachmentFactory.create(
+            submission_step=submission.steps[0],
+        )
+        submission.registration_result = {
+            "progress": {
+                "zgw": {
+                    "zaak": {
+                        "url": "https://zaken.nl/api/v1/zaken/1",
+                        "zaaktype": "https://catalogi.nl/api/v1/zaaktypen/1",
+                    },
+                    "document": {
+                        "url": "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/10"
+                    },
+                    "relations": {
+                        "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/10": "https://zaken.nl/api/v1/zaakinformatieobjecten/10"
+                    },
+                }
+            },
+            "traceback": "...",
+        }
+        submission.save()
+        zgw_form_options = dict(
+            zaaktype="https://catalogi.nl/api/v1/zaaktypen/1",
+            informatieobjecttype="https://catalogi.nl/api/v1/informatieobjecttypen/1",
+            organisatie_rsin="000000000",
+        )
+        self.install_mocks(m)
+
+        plugin = ZGWRegistration("zgw")
+        result = plugin.register_submission(submission, zgw_form_options)
+
+        # the zaak and report are not created again
+        created = [
+            request.url for request in m.request_history if request.method == "POST"
+        ]
+        self.assertEqual(
+            created,
+            [
+                "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten",
+                "https://zaken.nl/api/v1/zaakinformatieobjecten",
+                "https://zaken.nl/api/v1/rollen",
+                "https://zaken.nl/api/v1/statussen",
+            ],
+        )
+        relate_attachment = next(
+            request
+            for request in m.request_history
+            if request.url == "https://zaken.nl/api/v1/zaakinformatieobjecten"
+        )
+        self.assertEqual(
+            relate_attachment.json()["informatieobject"],
+            "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/1",
+        )
+        self.assertEqual(
+            result["attachments"][str(attachment.pk)]["url"],
+            "https://documenten.nl/api/v1/enkelvoudiginformatieobjecten/1",
+        )
+        self.assertNotIn("traceback", result)
+
+        submission.refresh_from_db()
+        self.assertEqual(submission.registration_result, result)
+
     @freeze_time("2021-01-01 10:00")
     def test_register_and_update_paid_product(self, m):
         submission = SubmissionFactory.from_data(
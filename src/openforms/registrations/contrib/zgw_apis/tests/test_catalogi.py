@@ -0,0 +1,131 @@
+from unittest.mock import patch
+
+from django.core.cache import caches
+from django.test import TestCase
+from django.urls import reverse
+
+import requests_mock
+from django_webtest import WebTest
+from zds_client.oas import schema_fetcher
+from zgw_consumers.test.schema_mock import mock_service_oas_get
+
+from openforms.accounts.tests.factories import SuperUserFactory
+from openforms.tests.utils import disable_2fa
+
+from ..catalogi import _get_cache_key, invalidate_catalogi_cache, list_catalogi_resource
+from .factories import ZgwConfigFactory
+
+ROLTYPEN_URL = "https://catalogus.nl/api/v1/roltypen?zaaktype=https%3A%2F%2Fcatalogus.nl%2Fapi%2Fv1%2Fzaaktypen%2F1"
+
+
+@requests_mock.Mocker()
+class CatalogiCacheTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.config = ZgwConfigFactory.create(
+            ztc_service__api_root="https://catalogus.nl/api/v1/"
+        )
+
+        caches["default"].clear()
+        self.addCleanup(caches["default"].clear)
+        schema_fetcher.cache.clear()
+        self.addCleanup(schema_fetcher.cache.clear)
+
+    def _list_roltypen(self):
+        return list_catalogi_resource(
+            self.config,
+            "roltype",
+            {"zaaktype": "https://catalogus.nl/api/v1/zaaktypen/1"},
+        )
+
+    def _install_mocks(self, m):
+        mock_service_oas_get(m, "https://catalogus.nl/api/v1/", "catalogi")
+        m.get(ROLTYPEN_URL, json={"count": 0, "results": []})
+
+    def _get_list_requests(self, m):
+        return [request for request in m.request_history if request.url == ROLTYPEN_URL]
+
+    def test_resource_is_cached(self, m):
+        self._install_mocks(m)
+
+        first = self._list_roltypen()
+        second = self._list_roltypen()
+
+        self.assertEqual(first, {"count": 0, "results": []})
+        self.assertEqual(second, first)
+        self.assertEqual(len(self._get_list_requests(m)), 1)
+
+    def test_cache_disabled(self, m):
+        self._install_mocks(m)
+        self.config.catalogi_cache_timeout = 0
+
+        self._list_roltypen()
+        self._list_roltypen()
+
+        self.assertEqual(len(self._get_list_requests(m)), 2)
+
+    def test_query_params_are_part_of_the_key(self, m):
+        self._install_mocks(m)
+        m.get(
+            "https://catalogus.nl/api/v1/roltypen?zaaktype=https%3A%2F%2Fcatalogus.nl%2Fapi%2Fv1%2Fzaaktypen%2F2",
+            json={"count": 0, "results": []},
+        )
+
+        self._list_roltypen()
+        list_catalogi_resource(
+            self.config,
+            "roltype",
+            {"zaaktype": "https://catalogus.nl/api/v1/zaaktypen/2"},
+        )
+
+        self.assertEqual(m.call_count, 3)
+
+    def test_invalidate(self, m):
+        self._install_mocks(m)
+        self._list_roltypen()
+
+        invalidate_catalogi_cache(self.config.ztc_service)
+        self._list_roltypen()
+
+        self.assertEqual(len(self._get_list_requests(m)), 2)
+
+    def test_waits_for_other_process_fetching_the_resource(self, m):
+        self._install_mocks(m)
+        cache = caches["default"]
+        cache_key = _get_cache_key(
+            self.config.ztc_service,
+            "roltype",
+            {"zaaktype": "https://catalogus.nl/api/v1/zaaktypen/1"},
+        )
+        cache.set(f"{cache_key}:lock", True)
+
+        def other_process_completes(seconds):
+            cache.set(cache_key, {"count": 1, "results": []})
+            cache.delete(f"{cache_key}:lock")
+
+        with patch(
+            "openforms.registrations.contrib.zgw_apis.catalogi.time.sleep",
+            side_effect=other_process_completes,
+        ):
+            response = self._list_roltypen()
+
+        self.assertEqual(response, {"count": 1, "results": []})
+        self.assertEqual(self._get_list_requests(m), [])
+
+
+@disable_2fa
+@patch("zgw_consumers.admin_fields.get_zaaktypen", return_value={})
+class ZgwConfigAdminTests(WebTest):
+    def test_clear_catalogi_cache(self, mock_get_zaaktypen):
+        config = ZgwConfigFactory.create()
+        url = reverse("admin:zgw_apis_zgwconfig_change")
+
+        change_page = self.app.get(url, user=SuperUserFactory.create())
+        with patch(
+            "openforms.registrations.contrib.zgw_apis.admin.invalidate_catalogi_cache"
+        ) as mock_invalidate:
+            response = change_page.form.submit("_clear_catalogi_cache")
+
+        self.assertRedirects(response, url, fetch_redirect_response=False)
+        mock_invalidate.assert_called_once_with(config.ztc_service)
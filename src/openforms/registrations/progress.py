@@ -0,0 +1,111 @@
+"""
+Helpers for plugins that register a submission in multiple steps.
+
+A registration that fails halfway should not be started from scratch on the next
+attempt, as that duplicates the objects created in the remote system(s). Plugins
+record their progress in :attr:`Submission.registration_result` after every step.
+When the registration fails, the progress is kept next to the traceback (see
+:func:`openforms.registrations.tasks._register_submission`), and the next attempt only
+performs the steps that are missing. The progress is recorded per registration
+backend, so a retry never resumes from the progress of another backend when the
+registration backend of the form was changed in the meantime.
+"""
+import copy
+from concurrent import futures
+from typing import Any, Callable, List, Sequence, Tuple, TypeVar
+
+from zgw_consumers.concurrent import parallel
+
+from openforms.submissions.models import Submission
+
+from .exceptions import RegistrationFailed
+
+__all__ = [
+    "get_registration_progress",
+    "save_registration_progress",
+    "process_concurrently",
+]
+
+T = TypeVar("T")
+
+# the progress is recorded per registration backend under this key
+PROGRESS_KEY = "progress"
+
+
+def get_registration_progress(submission: Submission, backend: str) -> dict:
+    """
+    Return the progress recorded by a previous, failed attempt of the backend.
+    """
+    result = submission.registration_result
+    if not isinstance(result, dict):
+        return {}
+    progress = (result.get(PROGRESS_KEY) or {}).get(backend)
+    return copy.deepcopy(progress) if isinstance(progress, dict) else {}
+
+
+def save_registration_progress(
+    submission: Submission, backend: str, progress: dict
+) -> None:
+    # the progress of other backends is kept, in case the form is switched back
+    result = submission.registration_result
+    all_progress = result.get(PROGRESS_KEY) if isinstance(result, dict) else None
+    registration_result = {PROGRESS_KEY: {**(all_progress or {}), backend: progress}}
+    submission.registration_result = registration_result
+    Submission.objects.filter(pk=submission.pk).update(
+        registration_result=registration_result
+    )
+
+
+def process_concurrently(
+    fn: Callable[[T], Any],
+    items: Sequence[T],
+    on_success: Callable[[T, Any], None],
+    max_workers: int,
+    describe: Callable[[T], str] = str,
+) -> None:
+    """
+    Call ``fn`` for every item, using at most ``max_workers`` threads.
+
+    ``on_success`` is called in the calling thread with the item and the return value
+    as soon as a call completes, so that the progress can be saved. A failing call
+    does not abort the others. Once all calls have completed, the failures are raised
+    as a single :class:`RegistrationFailed`, in the order of ``items``.
+
+    ``fn`` is executed in other threads with their own database connections, which
+    don't see uncommitted changes of the calling thread. Look up any objects it needs
+    beforehand.
+    """
+    errors = {}
+
+    max_workers = min(max_workers, len(items))
+    if max_workers <= 1:
+        for index, item in enumerate(items):
+            try:
+                value = fn(item)
+            except Exception as exc:
+                errors[index] = exc
+            else:
+                on_success(item, value)
+    else:
+        with parallel(max_workers=max_workers) as executor:
+            pending = {
+                executor.submit(fn, item): index for index, item in enumerate(items)
+            }
+            for future in futures.as_completed(pending):
+                index = pending[future]
+                exc = future.exception()
+                if exc is not None:
+                    errors[index] = exc
+                else:
+                    on_success(items[index], future.result())
+
+    if not errors:
+        return
+
+    failures: List[Tuple[T, Exception]] = [
+        (items[index], errors[index]) for index in sorted(errors)
+    ]
+    details = "; ".join(f"{describe(item)}: {exc!r}" for item, exc in failures)
+    raise RegistrationFailed(
+        f"{len(failures)} of {len(items)} uploads failed: {details}"
+    ) from failures[0][1]
@@ -16,7 +16,7 @@ from .exceptions import RegistrationFailed
 logger = logging.getLogger(__name__)
 
 
-@app.task(time_limit=settings.SUBMISSION_REGISTRATION_TIMEOUT)
+@app.task(ignore_result=True, time_limit=settings.SUBMISSION_REGISTRATION_TIMEOUT)
 def register_submission(submission_id: int) -> Optional[dict]:
     # initial first try with timeouts as the user is waiting
     return _register_submission(submission_id)
@@ -28,6 +28,15 @@ def retry_register_submission(submission_id: int) -> Optional[dict]:
     return _register_submission(submission_id)
 
 
+def _get_failure_result(submission: Submission) -> dict:
+    # keep the progress recorded by the plugin, so a retry can resume from it
+    result = submission.registration_result
+    return {
+        **(result if isinstance(result, dict) else {}),
+        "traceback": traceback.format_exc(),
+    }
+
+
 def _register_submission(submission_id: int) -> Optional[dict]:
     submission = Submission.objects.get(id=submission_id)
 
@@ -75,7 +84,7 @@ def _register_submission(submission_id: int) -> Optional[dict]:
         options_serializer.is_valid(raise_exception=True)
     except Exception as e:
         submission.save_registration_status(
-            RegistrationStatuses.failed, {"traceback": traceback.format_exc()}
+            RegistrationStatuses.failed, _get_failure_result(submission)
         )
         logevent.registration_failure(submission, e, plugin)
         raise
@@ -87,7 +96,7 @@ def _register_submission(submission_id: int) -> Optional[dict]:
         )
     except Exception as e:
         submission.save_registration_status(
-            RegistrationStatuses.failed, {"traceback": traceback.format_exc()}
+            RegistrationStatuses.failed, _get_failure_result(submission)
         )
         logevent.registration_failure(submission, e, plugin)
         raise
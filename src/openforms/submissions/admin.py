@@ -1,5 +1,7 @@
+from django.conf import settings
 from django.contrib import admin, messages
 from django.contrib.contenttypes.admin import GenericTabularInline
+from django.db import transaction
 from django.template.defaultfilters import filesizeformat
 from django.utils.translation import gettext_lazy as _, ngettext
 
@@ -16,14 +18,17 @@ from openforms.payments.models import SubmissionPayment
 from openforms.registrations.tasks import retry_register_submission
 
 from .constants import IMAGE_COMPONENTS, RegistrationStatuses
-from .exports import export_submissions
+from .exports import STREAMING_FORMATS, export_submissions
 from .models import (
     Submission,
+    SubmissionExport,
     SubmissionFileAttachment,
+    SubmissionProcessingState,
     SubmissionReport,
     SubmissionStep,
     TemporaryFileUpload,
 )
+from .tasks import export_submissions_job
 
 
 class SubmissionTypeListFilter(admin.ListFilter):
@@ -114,6 +119,19 @@ class SubmissionPaymentInline(admin.StackedInline):
     order_id_str.admin_order_field = "order_id"
 
 
+class SubmissionProcessingStateInline(admin.TabularInline):
+    model = SubmissionProcessingState
+    extra = 0
+    fields = ("task_name", "task_id", "state", "updated_on")
+    readonly_fields = fields
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
 class SubmissionLogInline(GenericTabularInline):
     model = TimelineLogProxy
     fields = ("get_message",)
@@ -145,6 +163,7 @@ class SubmissionAdmin(admin.ModelAdmin):
     inlines = [
         SubmissionStepInline,
         SubmissionPaymentInline,
+        SubmissionProcessingStateInline,
         SubmissionLogInline,
     ]
     readonly_fields = [
@@ -153,10 +172,9 @@ class SubmissionAdmin(admin.ModelAdmin):
         "get_appointment_status",
         "get_appointment_id",
         "get_appointment_error_information",
-        "on_completion_task_ids",
         "confirmation_email_sent",
     ]
-    actions = ["export_csv", "export_xlsx", "resend_submissions"]
+    actions = ["export_csv", "export_ndjson", "export_xlsx", "resend_submissions"]
 
     def get_registration_backend(self, obj):
         return obj.form.registration_backend
@@ -212,8 +230,29 @@ class SubmissionAdmin(admin.ModelAdmin):
             )
             return
 
-        log_export_submissions(queryset.first().form, request.user)
-        return export_submissions(queryset, file_type)
+        form = queryset.first().form
+        log_export_submissions(form, request.user)
+
+        if (
+            file_type in STREAMING_FORMATS
+            and queryset.count() <= settings.SUBMISSION_EXPORT_BACKGROUND_THRESHOLD
+        ):
+            return export_submissions(queryset, file_type)
+
+        export = SubmissionExport.objects.create(
+            form=form,
+            user=request.user,
+            file_type=file_type,
+            submission_ids=list(queryset.order_by("pk").values_list("pk", flat=True)),
+        )
+        transaction.on_commit(lambda: export_submissions_job.delay(export.pk))
+        messages.success(
+            request,
+            _(
+                "The export is being prepared, you will receive an e-mail when it "
+                "is ready."
+            ),
+        )
 
     def export_csv(self, request, queryset):
         return self._export(request, queryset, "csv")
@@ -222,6 +261,13 @@ class SubmissionAdmin(admin.ModelAdmin):
         "Export selected %(verbose_name_plural)s as CSV-file."
     )
 
+    def export_ndjson(self, request, queryset):
+        return self._export(request, queryset, "ndjson")
+
+    export_ndjson.short_description = _(
+        "Export selected %(verbose_name_plural)s as NDJSON-file."
+    )
+
     def export_xlsx(self, request, queryset):
         return self._export(request, queryset, "xlsx")
 
@@ -251,6 +297,49 @@ class SubmissionAdmin(admin.ModelAdmin):
     )
 
 
+@admin.register(SubmissionExport)
+class SubmissionExportAdmin(PrivateMediaMixin, admin.ModelAdmin):
+    list_display = (
+        "form",
+        "user",
+        "file_type",
+        "status",
+        "get_progress",
+        "created_on",
+        "completed_on",
+    )
+    list_filter = ("status", "file_type")
+    fields = (
+        "form",
+        "user",
+        "file_type",
+        "status",
+        "get_progress",
+        "created_on",
+        "completed_on",
+        "since",
+        "watermark",
+        "content",
+    )
+    readonly_fields = (
+        "form",
+        "user",
+        "file_type",
+        "status",
+        "get_progress",
+        "created_on",
+        "completed_on",
+        "since",
+        "watermark",
+    )
+    date_hierarchy = "created_on"
+
+    private_media_fields = ("content",)
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(SubmissionReport)
 class SubmissionReportAdmin(PrivateMediaMixin, admin.ModelAdmin):
     list_display = ("title",)
@@ -0,0 +1,406 @@
+"""
+Columnar (Parquet/Arrow IPC) exports of submissions, for analytics.
+
+The completed submissions of a form are exported with their timestamps, registration
+and payment status and the merged submission data. Every component of the form becomes
+a column, typed after the Form.io component type.
+
+The files are partitioned by form and month (of completion), in a Hive-style layout::
+
+    <output dir>/form=<form uuid>/month=<YYYY-MM>/<export id>.parquet
+
+The watermark of the last export of a form can be kept in the directory of the form, in
+a ``_watermark`` file (which is skipped by the readers of the dataset).
+
+Submissions are read over a server-side cursor and written in row groups of
+:data:`ROW_GROUP_SIZE` rows, so only one row group is kept in memory. Exports can be
+incremental: only the submissions completed after the watermark of a previous export
+are exported, into new files next to the existing ones.
+
+The watermark is the moment up to which the submissions are exported. It lags
+:data:`WATERMARK_DELAY` behind the start of the export, so that submissions completed
+just before the export, but committed after it started, are not skipped by the next
+export.
+
+The columns follow the components of the form at the moment of the export. After the
+form is changed, the files of a later (incremental) export can have a different schema
+than the files already in the same partition: columns are added or removed, or change
+type. Read the dataset with schema unification, e.g. ``pyarrow.dataset.dataset`` with a
+schema from ``pyarrow.unify_schemas``, or export the form again with a full export.
+
+pyarrow is only imported when the files are written.
+"""
+import json
+import os
+import tempfile
+import uuid
+import zipfile
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from openforms.forms.models import Form
+from openforms.payments.models import SubmissionPayment
+
+from .exports import materialize_merged_data
+from .models import Submission
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+__all__ = [
+    "FILE_FORMATS",
+    "get_columns",
+    "export_form_submissions",
+    "write_export_archive",
+    "read_watermark",
+    "write_watermark",
+]
+
+ROW_GROUP_SIZE = 10_000
+
+WATERMARK_DELAY = timedelta(minutes=5)
+WATERMARK_FILENAME = "_watermark"
+
+FILE_FORMATS = ("parquet", "arrow")
+
+# component types that only structure the form, without a value of their own
+LAYOUT_COMPONENT_TYPES = {
+    "button",
+    "columns",
+    "content",
+    "fieldset",
+    "htmlelement",
+    "panel",
+    "table",
+    "tabs",
+    "well",
+}
+
+
+def _to_string(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, cls=DjangoJSONEncoder)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None or value == "" or isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_bool(value: Any) -> Optional[bool]:
+    return value if isinstance(value, bool) else None
+
+
+def _to_date(value: Any) -> Optional[date]:
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        return parse_date(value[:10])
+    except ValueError:
+        return None
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        parsed = parse_datetime(value)
+    except ValueError:
+        return None
+    if parsed is not None and timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def _to_mapping(value: Any) -> Optional[List[Tuple[str, bool]]]:
+    if not isinstance(value, dict):
+        return None
+    return [(str(key), bool(checked)) for key, checked in value.items()]
+
+
+def get_arrow_type(column_type: str) -> "pa.DataType":
+    import pyarrow as pa
+
+    return {
+        "bool": pa.bool_,
+        "date": pa.date32,
+        "float": pa.float64,
+        "map": lambda: pa.map_(pa.string(), pa.bool_()),
+        "string": pa.string,
+        "timestamp": lambda: pa.timestamp("us", tz="UTC"),
+    }[column_type]()
+
+
+# Form.io component type -> (column type, conversion of the submitted value), see
+# :func:`get_arrow_type` for the column types
+COMPONENT_TYPES: Dict[str, Tuple[str, Callable[[Any], Any]]] = {
+    "checkbox": ("bool", _to_bool),
+    "currency": ("float", _to_float),
+    "date": ("date", _to_date),
+    "datetime": ("timestamp", _to_datetime),
+    "number": ("float", _to_float),
+    "selectboxes": ("map", _to_mapping),
+}
+DEFAULT_COMPONENT_TYPE = ("string", _to_string)
+
+
+@dataclass
+class Column:
+    name: str
+    type: str
+    convert: Callable[[Any], Any] = field(repr=False)
+
+
+FIXED_COLUMNS = [
+    Column("submission_uuid", "string", str),
+    Column("created_on", "timestamp", lambda value: value),
+    Column("completed_on", "timestamp", lambda value: value),
+    Column("registration_status", "string", _to_string),
+    Column("payment_status", "string", _to_string),
+]
+
+
+def get_columns(form: Form) -> List[Column]:
+    """
+    Return the columns of the export: the fixed columns and a column per component.
+    """
+    columns = list(FIXED_COLUMNS)
+    names = {column.name for column in columns}
+    for component in form.iter_components(recursive=True):
+        key = component.get("key")
+        if (
+            not key
+            or key in names
+            or component.get("input") is False
+            or component.get("type") in LAYOUT_COMPONENT_TYPES
+        ):
+            continue
+        column_type, convert = COMPONENT_TYPES.get(
+            component.get("type"), DEFAULT_COMPONENT_TYPE
+        )
+        columns.append(Column(key, column_type, convert))
+        names.add(key)
+    return columns
+
+
+class _PartitionWriter:
+    def __init__(self, path: str, columns: List[Column], file_format: str):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        schema = pa.schema(
+            [pa.field(column.name, get_arrow_type(column.type)) for column in columns]
+        )
+        self.path = path
+        self.schema = schema
+        if file_format == "parquet":
+            self._sink = None
+            self._writer = pq.ParquetWriter(path, schema)
+        else:
+            self._sink = pa.OSFile(path, "wb")
+            self._writer = pa.ipc.new_file(self._sink, schema)
+
+    def write(self, columns: List[list]) -> None:
+        import pyarrow as pa
+
+        arrays = [
+            pa.array(values, type=schema_field.type)
+            for values, schema_field in zip(columns, self.schema)
+        ]
+        self._writer.write_table(pa.Table.from_arrays(arrays, schema=self.schema))
+
+    def close(self) -> None:
+        self._writer.close()
+        if self._sink is not None:
+            self._sink.close()
+
+
+@dataclass
+class AnalyticsExport:
+    files: List[str] = field(default_factory=list)
+    num_rows: int = 0
+    # the submissions completed up to this moment are exported, the ``since`` value of
+    # the next incremental export
+    watermark: Optional[datetime] = None
+
+
+def _iter_rows(
+    form: Form, columns: List[Column], since: Optional[datetime], until: datetime
+) -> Iterator[list]:
+    queryset = Submission.objects.filter(form=form, completed_on__lte=until)
+    if since is not None:
+        queryset = queryset.filter(completed_on__gt=since)
+    materialize_merged_data(queryset)
+
+    latest_payment = SubmissionPayment.objects.filter(
+        submission=OuterRef("pk")
+    ).order_by("-pk")
+    submissions = (
+        queryset.annotate(
+            latest_payment_status=Subquery(latest_payment.values("status")[:1])
+        )
+        .order_by("completed_on", "pk")
+        .values_list(
+            "uuid",
+            "created_on",
+            "completed_on",
+            "registration_status",
+            "latest_payment_status",
+            "_merged_data",
+        )
+    )
+
+    data_columns = columns[len(FIXED_COLUMNS) :]
+    for *fixed_values, merged_data in submissions.iterator(chunk_size=ROW_GROUP_SIZE):
+        merged_data = merged_data or {}
+        row = [
+            column.convert(value) for column, value in zip(FIXED_COLUMNS, fixed_values)
+        ]
+        row += [column.convert(merged_data.get(column.name)) for column in data_columns]
+        yield row
+
+
+def _get_form_dir(output_dir: str, form: Form) -> str:
+    return os.path.join(output_dir, f"form={form.uuid}")
+
+
+def read_watermark(output_dir: str, form: Form) -> Optional[datetime]:
+    """
+    Return the watermark of the last export of the form to the output directory.
+    """
+    path = os.path.join(_get_form_dir(output_dir, form), WATERMARK_FILENAME)
+    if not os.path.exists(path):
+        return None
+    with open(path) as watermark_file:
+        return parse_datetime(watermark_file.read().strip())
+
+
+def write_watermark(output_dir: str, form: Form, watermark: datetime) -> None:
+    form_dir = _get_form_dir(output_dir, form)
+    os.makedirs(form_dir, exist_ok=True)
+    with open(os.path.join(form_dir, WATERMARK_FILENAME), "w") as watermark_file:
+        watermark_file.write(watermark.isoformat())
+
+
+def _get_month(completed_on: datetime) -> str:
+    return completed_on.astimezone(dt_timezone.utc).strftime("%Y-%m")
+
+
+def export_form_submissions(
+    form: Form,
+    output_dir: str,
+    file_format: str = "parquet",
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    on_progress: Optional[Callable[[int], None]] = None,
+) -> AnalyticsExport:
+    """
+    Export the completed submissions of the form to partitioned files.
+
+    :param since: only export the submissions completed after this moment, usually the
+      watermark of the previous export.
+    :param until: only export the submissions completed up to this moment, defaults
+      to :data:`WATERMARK_DELAY` before now.
+    :param on_progress: called with the number of exported submissions, after every
+      row group.
+    """
+    if file_format not in FILE_FORMATS:
+        raise ValueError(f"Unsupported file format '{file_format}'")
+
+    if until is None:
+        until = timezone.now() - WATERMARK_DELAY
+    columns = get_columns(form)
+    export_id = f"{timezone.now():%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}"
+    completed_on_index = [column.name for column in columns].index("completed_on")
+
+    result = AnalyticsExport(watermark=until)
+    writer: Optional[_PartitionWriter] = None
+    month = None
+    rows: List[list] = []
+
+    def flush() -> None:
+        if rows:
+            writer.write([list(values) for values in zip(*rows)])
+            rows.clear()
+            if on_progress:
+                on_progress(result.num_rows)
+
+    try:
+        for row in _iter_rows(form, columns, since, until):
+            completed_on = row[completed_on_index]
+            # submissions are ordered by completion, a partition is complete as soon
+            # as the next month starts
+            if _get_month(completed_on) != month:
+                if writer is not None:
+                    flush()
+                    writer.close()
+                month = _get_month(completed_on)
+                path = os.path.join(
+                    _get_form_dir(output_dir, form),
+                    f"month={month}",
+                    f"{export_id}.{file_format}",
+                )
+                writer = _PartitionWriter(path, columns, file_format)
+                result.files.append(path)
+
+            rows.append(row)
+            result.num_rows += 1
+            if len(rows) >= ROW_GROUP_SIZE:
+                flush()
+    finally:
+        if writer is not None:
+            flush()
+            writer.close()
+
+    return result
+
+
+def write_export_archive(
+    form: Form,
+    outfile: IO[bytes],
+    file_format: str = "parquet",
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    on_progress: Optional[Callable[[int], None]] = None,
+) -> AnalyticsExport:
+    """
+    Export the completed submissions of the form to a ZIP archive of partitioned files.
+
+    See :func:`export_form_submissions` for the parameters. The paths of the files in
+    the archive are relative to the output directory.
+    """
+    with tempfile.TemporaryDirectory() as output_dir:
+        result = export_form_submissions(
+            form,
+            output_dir,
+            file_format=file_format,
+            since=since,
+            until=until,
+            on_progress=on_progress,
+        )
+        with zipfile.ZipFile(outfile, "w") as zip_file:
+            for path in result.files:
+                zip_file.write(path, os.path.relpath(path, output_dir))
+    return result
@@ -13,12 +13,13 @@ from rest_framework.reverse import reverse
 from rest_framework_nested.serializers import NestedHyperlinkedModelSerializer
 
 from openforms.forms.api.serializers import FormDefinitionSerializer
-from openforms.forms.models import FormStep
+from openforms.forms.models import Form, FormStep
 
 from ...forms.validators import validate_not_maintainance_mode
-from ..constants import ProcessingResults, ProcessingStatuses
+from ..analytics import FILE_FORMATS
+from ..constants import ProcessingResults, ProcessingStatuses, SubmissionExportStatuses
 from ..form_logic import check_submission_logic, evaluate_form_logic
-from ..models import Submission, SubmissionStep, TemporaryFileUpload
+from ..models import Submission, SubmissionExport, SubmissionStep, TemporaryFileUpload
 from .fields import NestedRelatedField
 
 logger = logging.getLogger(__name__)
@@ -248,6 +249,48 @@ class FormDataSerializer(serializers.Serializer):
     )
 
 
+class FormDataChangesSerializer(FormDataSerializer):
+    changed_keys = serializers.ListField(
+        child=serializers.CharField(),
+        label=_("changed keys"),
+        help_text=_(
+            "The keys in the form data that changed since the previous logic check. "
+            "Only the logic rules depending on these keys are evaluated."
+        ),
+    )
+
+
+class LogicChangesSerializer(serializers.Serializer):
+    components = serializers.DictField(
+        child=serializers.DictField(),
+        label=_("component changes"),
+        help_text=_(
+            "The Form.io component properties affected by the logic rules, keyed by "
+            "component key. Properties that are no longer modified by any rule are "
+            "reset to their value in the form definition."
+        ),
+    )
+    data = serializers.JSONField(
+        label=_("data changes"),
+        help_text=_("Form data values set by the triggered logic rules."),
+    )
+    can_submit = serializers.BooleanField(
+        label=_("can submit"),
+        allow_null=True,
+        help_text=_(
+            "Whether the step can be submitted, or `null` if this is not affected by "
+            "the changes."
+        ),
+    )
+    steps = serializers.DictField(
+        child=serializers.BooleanField(),
+        label=_("step applicability changes"),
+        help_text=_(
+            "The applicability of the affected form steps, keyed by form step UUID."
+        ),
+    )
+
+
 class SubmissionSuspensionSerializer(serializers.ModelSerializer):
     email = serializers.EmailField(
         required=True,
@@ -351,6 +394,30 @@ class SubmissionCompletionSerializer(serializers.Serializer):
     )
 
 
+class SubmissionProcessingStatusQuerySerializer(serializers.Serializer):
+    wait = serializers.IntegerField(
+        label=_("wait"),
+        required=False,
+        default=0,
+        min_value=0,
+        help_text=_(
+            "Number of seconds to wait for the processing to complete before "
+            "responding. The response is returned as soon as the processing is done."
+        ),
+    )
+
+    def validate_wait(self, value: int) -> int:
+        max_wait = settings.SUBMISSION_STATUS_MAX_WAIT
+        if value > max_wait:
+            raise serializers.ValidationError(
+                _("Ensure this value is less than or equal to {max_wait}.").format(
+                    max_wait=max_wait
+                ),
+                code="max_value",
+            )
+        return value
+
+
 class SubmissionProcessingStatusSerializer(serializers.Serializer):
     status = serializers.ChoiceField(
         label=_("background processing status"),
@@ -418,3 +485,91 @@ class SubmissionProcessingStatusSerializer(serializers.Serializer):
             "a timestamped token generated by the backend."
         ),
     )
+
+
+class AnalyticsExportInputSerializer(serializers.Serializer):
+    form = serializers.SlugRelatedField(
+        slug_field="uuid",
+        queryset=Form.objects.all(),
+        label=_("form"),
+        help_text=_("UUID of the form to export the submissions of."),
+    )
+    # not "format", which selects the renderer of the response in DRF
+    file_format = serializers.ChoiceField(
+        choices=FILE_FORMATS,
+        default="parquet",
+        label=_("file format"),
+        help_text=_("File format of the export."),
+    )
+    since = serializers.DateTimeField(
+        required=False,
+        label=_("since"),
+        help_text=_(
+            "Only export the submissions completed after this moment, usually the "
+            "watermark of the previous export."
+        ),
+    )
+
+
+class AnalyticsExportSerializer(serializers.ModelSerializer):
+    url = serializers.SerializerMethodField(
+        label=_("URL"),
+        help_text=_("URL to poll the status of the export."),
+    )
+    form = serializers.SlugRelatedField(
+        slug_field="uuid",
+        read_only=True,
+        label=_("form"),
+        help_text=_("UUID of the form of the exported submissions."),
+    )
+    file_format = serializers.CharField(
+        source="file_type",
+        read_only=True,
+        label=_("file format"),
+        help_text=_("File format of the export."),
+    )
+    progress = serializers.IntegerField(
+        source="get_progress",
+        read_only=True,
+        label=_("progress"),
+        help_text=_("Progress of the export, in percent."),
+    )
+    download_url = serializers.SerializerMethodField(
+        label=_("download URL"),
+        help_text=_(
+            "URL to download the ZIP archive of the export, once the export "
+            "succeeded. The watermark is returned in the 'X-Export-Watermark' header."
+        ),
+    )
+
+    class Meta:
+        model = SubmissionExport
+        fields = (
+            "url",
+            "form",
+            "file_format",
+            "since",
+            "watermark",
+            "status",
+            "progress",
+            "created_on",
+            "completed_on",
+            "download_url",
+        )
+        read_only_fields = fields
+
+    def get_url(self, export: SubmissionExport) -> str:
+        return reverse(
+            "api:submissions:analytics-export-detail",
+            kwargs={"pk": export.pk},
+            request=self.context["request"],
+        )
+
+    def get_download_url(self, export: SubmissionExport) -> str:
+        if export.status != SubmissionExportStatuses.success:
+            return ""
+        return reverse(
+            "api:submissions:analytics-export-download",
+            kwargs={"pk": export.pk},
+            request=self.context["request"],
+        )
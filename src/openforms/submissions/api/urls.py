@@ -1,6 +1,9 @@
 from django.urls import path
 
 from .views import (
+    AnalyticsExportDetailView,
+    AnalyticsExportDownloadView,
+    AnalyticsExportView,
     DownloadSubmissionReportView,
     TemporaryFileUploadView,
     TemporaryFileView,
@@ -24,4 +27,19 @@ urlpatterns = [
         TemporaryFileView.as_view(),
         name="temporary-file",
     ),
+    path(
+        "analytics/export",
+        AnalyticsExportView.as_view(),
+        name="analytics-export",
+    ),
+    path(
+        "analytics/export/<int:pk>",
+        AnalyticsExportDetailView.as_view(),
+        name="analytics-export-detail",
+    ),
+    path(
+        "analytics/export/<int:pk>/download",
+        AnalyticsExportDownloadView.as_view(),
+        name="analytics-export-download",
+    ),
 ]
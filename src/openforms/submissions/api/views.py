@@ -1,17 +1,23 @@
 import os
 
 from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
 from django_sendfile import sendfile
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema, extend_schema_view
-from rest_framework.generics import DestroyAPIView, GenericAPIView
+from rest_framework import permissions, status
+from rest_framework.generics import DestroyAPIView, GenericAPIView, RetrieveAPIView
 from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 
+from ..analytics import FILE_FORMATS, WATERMARK_DELAY
 from ..attachments import clean_mime_type
-from ..models import SubmissionReport, TemporaryFileUpload
+from ..constants import SubmissionExportStatuses
+from ..models import Submission, SubmissionExport, SubmissionReport, TemporaryFileUpload
+from ..tasks import export_submissions_analytics_job
 from ..utils import add_upload_to_session, remove_upload_from_session
 from .permissions import (
     AnyActiveSubmissionPermission,
@@ -19,7 +25,11 @@ from .permissions import (
     OwnsTemporaryUploadPermission,
 )
 from .renderers import FileRenderer, PDFRenderer
-from .serializers import TemporaryFileUploadSerializer
+from .serializers import (
+    AnalyticsExportInputSerializer,
+    AnalyticsExportSerializer,
+    TemporaryFileUploadSerializer,
+)
 
 
 @extend_schema(
@@ -143,3 +153,84 @@ class TemporaryFileView(DestroyAPIView):
     def perform_destroy(self, instance):
         remove_upload_from_session(instance, self.request.session)
         instance.delete()
+
+
+class AnalyticsExportView(GenericAPIView):
+    """
+    Export the completed submissions of a form to Parquet/Arrow files for analytics.
+
+    The export is prepared in the background. The export files are partitioned by form
+    and month of completion and returned in a ZIP archive. Pass the watermark of the
+    export as ``since`` to only export the submissions completed afterwards.
+    """
+
+    permission_classes = (permissions.IsAdminUser,)
+    serializer_class = AnalyticsExportSerializer
+
+    @extend_schema(
+        summary=_("Export submissions for analytics"),
+        description=_(
+            "Start the export of the completed submissions of a form. The export is "
+            "prepared in the background, poll the returned URL for its status."
+        ),
+        request=AnalyticsExportInputSerializer,
+        responses={202: AnalyticsExportSerializer},
+    )
+    def post(self, request, *args, **kwargs):
+        input_serializer = AnalyticsExportInputSerializer(data=request.data)
+        input_serializer.is_valid(raise_exception=True)
+        form = input_serializer.validated_data["form"]
+        since = input_serializer.validated_data.get("since")
+
+        # the range of the export is fixed now, the job exports the same submissions
+        watermark = timezone.now() - WATERMARK_DELAY
+        submissions = Submission.objects.filter(form=form, completed_on__lte=watermark)
+        if since is not None:
+            submissions = submissions.filter(completed_on__gt=since)
+
+        export = SubmissionExport.objects.create(
+            form=form,
+            user=request.user,
+            file_type=input_serializer.validated_data["file_format"],
+            submission_ids=list(
+                submissions.order_by("pk").values_list("pk", flat=True)
+            ),
+            since=since,
+            watermark=watermark,
+        )
+        transaction.on_commit(lambda: export_submissions_analytics_job.delay(export.pk))
+
+        serializer = self.get_serializer(instance=export)
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+
+@extend_schema(summary=_("Retrieve the status of an analytics export"))
+class AnalyticsExportDetailView(RetrieveAPIView):
+    permission_classes = (permissions.IsAdminUser,)
+    queryset = SubmissionExport.objects.filter(file_type__in=FILE_FORMATS)
+    serializer_class = AnalyticsExportSerializer
+
+
+@extend_schema(
+    summary=_("Download an analytics export"),
+    responses={(200, "application/zip"): OpenApiTypes.BINARY},
+)
+class AnalyticsExportDownloadView(GenericAPIView):
+    permission_classes = (permissions.IsAdminUser,)
+    queryset = SubmissionExport.objects.filter(
+        file_type__in=FILE_FORMATS, status=SubmissionExportStatuses.success
+    )
+    renderer_classes = (FileRenderer,)
+    serializer_class = None
+
+    def get(self, request, *args, **kwargs):
+        export = self.get_object()
+        response = sendfile(
+            request,
+            export.content.path,
+            attachment=True,
+            attachment_filename=f"submissions_{export.form.uuid}.zip",
+            mimetype="application/zip",
+        )
+        response["X-Export-Watermark"] = export.watermark.isoformat()
+        return response
@@ -1,5 +1,6 @@
 import logging
 
+from django.conf import settings
 from django.db import transaction
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
@@ -17,13 +18,14 @@ from openforms.api.filters import PermissionFilterMixin
 from openforms.api.serializers import ExceptionSerializer
 from openforms.logging import logevent
 from openforms.logging.logevent import submission_details_view_api
+from openforms.prefill.tasks import warm_up_prefill
 from openforms.utils.patches.rest_framework_nested.viewsets import NestedViewSetMixin
 
 from ..attachments import attach_uploads_to_submission_step
-from ..form_logic import evaluate_form_logic
+from ..form_logic import evaluate_form_logic, evaluate_form_logic_changes
 from ..models import Submission, SubmissionStep
 from ..parsers import IgnoreDataFieldCamelCaseJSONParser
-from ..status import SubmissionProcessingStatus
+from ..status import SubmissionProcessingStatus, wait_for_processing
 from ..tasks import on_completion
 from ..tokens import submission_status_token_generator
 from ..utils import (
@@ -33,8 +35,11 @@ from ..utils import (
 )
 from .permissions import ActiveSubmissionPermission, SubmissionStatusPermission
 from .serializers import (
+    FormDataChangesSerializer,
     FormDataSerializer,
+    LogicChangesSerializer,
     SubmissionCompletionSerializer,
+    SubmissionProcessingStatusQuerySerializer,
     SubmissionProcessingStatusSerializer,
     SubmissionSerializer,
     SubmissionStateLogic,
@@ -95,6 +100,12 @@ class SubmissionViewSet(
 
         logevent.submission_start(serializer.instance)
 
+        # the identifying details from the authentication return are now known, start
+        # retrieving the prefill values for the whole form in the background
+        if bsn:
+            submission_id = serializer.instance.id
+            transaction.on_commit(lambda: warm_up_prefill.delay(submission_id))
+
     @extend_schema(
         summary=_("Complete a submission"),
         request=None,
@@ -170,6 +181,15 @@ class SubmissionViewSet(
                 description=_("Time-based authentication token"),
                 required=True,
             ),
+            OpenApiParameter(
+                "wait",
+                OpenApiTypes.INT,
+                OpenApiParameter.QUERY,
+                description=_(
+                    "Number of seconds (at most {max_wait}) to wait for the processing "
+                    "to complete before responding."
+                ).format(max_wait=settings.SUBMISSION_STATUS_MAX_WAIT),
+            ),
         ],
     )
     @action(
@@ -183,10 +203,20 @@ class SubmissionViewSet(
         Obtain the current submission processing status, after completing it.
 
         The submission is processed asynchronously. Poll this endpoint to receive
-        information on the status of this async processing.
+        information on the status of this async processing. Pass ``wait`` to have the
+        endpoint respond as soon as the processing is done (or the number of seconds
+        passed), instead of polling repeatedly. When too many requests are waiting
+        already, the current status is returned immediately.
         """
         submission = self.get_object()
-        status = SubmissionProcessingStatus(request, submission)
+        query_serializer = SubmissionProcessingStatusQuerySerializer(
+            data=request.query_params
+        )
+        query_serializer.is_valid(raise_exception=True)
+        if wait := query_serializer.validated_data["wait"]:
+            status = wait_for_processing(request, submission, timeout=wait)
+        else:
+            status = SubmissionProcessingStatus(request, submission)
         status.ensure_failure_can_be_managed()
         serializer = SubmissionProcessingStatusSerializer(instance=status)
         return Response(serializer.data)
@@ -351,3 +381,30 @@ class SubmissionStepViewSet(
             context={"request": request},
         )
         return Response(submission_state_logic_serializer.data)
+
+    @extend_schema(
+        summary=_("Apply/check form logic for changed data"),
+        description=_(
+            "Evaluate only the logic rules affected by the changed form data keys, and "
+            "return the resulting component property, data and step changes instead "
+            "of the full submission and step state."
+        ),
+        request=FormDataChangesSerializer,
+        responses={200: LogicChangesSerializer},
+    )
+    @action(detail=True, methods=["post"], url_path="_check_logic_changes")
+    def logic_check_changes(self, request, *args, **kwargs):
+        submission_step = self.get_object()
+
+        form_data_serializer = FormDataChangesSerializer(data=request.data)
+        form_data_serializer.is_valid(raise_exception=True)
+
+        data = form_data_serializer.validated_data.get("data") or {}
+        merged_data = {**submission_step.submission.data, **data}
+        changes = evaluate_form_logic_changes(
+            submission_step.submission,
+            submission_step,
+            merged_data,
+            form_data_serializer.validated_data["changed_keys"],
+        )
+        return Response(LogicChangesSerializer(instance=changes).data)
@@ -1,10 +1,12 @@
 import os.path
 import re
 from datetime import timedelta
-from typing import Iterable, Optional, Tuple
+from functools import partial
+from typing import Iterable, Iterator, Optional, Tuple
 from urllib.parse import urlparse
 
 from django.core.files.temp import NamedTemporaryFile
+from django.db import transaction
 from django.urls import Resolver404, resolve
 
 import PIL
@@ -78,13 +80,7 @@ def attach_uploads_to_submission_step(submission_step: SubmissionStep) -> list:
 
     result = list()
     for key, (component, uploads) in uploads.items():
-        # grab resize settings
-        resize_apply = glom(component, "image.resize.apply", default=False)
-        resize_size = (
-            glom(component, "image.resize.width", default=DEFAULT_IMAGE_MAX_SIZE[0]),
-            glom(component, "image.resize.height", default=DEFAULT_IMAGE_MAX_SIZE[1]),
-        )
-
+        resize_size = get_resize_size(component)
         base_name = glom(component, "file.name", default="")
 
         # formio sends a list of uploads even with multiple=False
@@ -98,14 +94,56 @@ def attach_uploads_to_submission_step(submission_step: SubmissionStep) -> list:
             )
             result.append((attachment, created))
 
-            if created and resize_apply and resize_size:
-                # NOTE there is a possible race-condition if user completes a submission before this resize task is done
-                # see https://github.com/open-formulieren/open-forms/issues/507
+            if created and resize_size:
+                # the submission can be completed before this resize task is done, the
+                # on_completion workflow resizes the images again before registration
+                # (see https://github.com/open-formulieren/open-forms/issues/507)
                 resize_submission_attachment.delay(attachment.id, resize_size)
 
     return result
 
 
+def get_resize_size(component: dict) -> Optional[Tuple[int, int]]:
+    """
+    Return the maximum image size of the uploads of a file component, if they must be
+    resized.
+    """
+    if not glom(component, "image.resize.apply", default=False):
+        return None
+    return (
+        glom(component, "image.resize.width", default=DEFAULT_IMAGE_MAX_SIZE[0]),
+        glom(component, "image.resize.height", default=DEFAULT_IMAGE_MAX_SIZE[1]),
+    )
+
+
+def iter_attachments_to_resize(
+    submission: Submission,
+) -> Iterator[Tuple[SubmissionFileAttachment, Tuple[int, int]]]:
+    """
+    Yield the attachments of the submission that must be resized, with their size.
+    """
+    components_by_step = {}
+    attachments = SubmissionFileAttachment.objects.for_submission(
+        submission
+    ).select_related("submission_step__form_step__form_definition")
+    for attachment in attachments:
+        submission_step = attachment.submission_step
+        if submission_step.id not in components_by_step:
+            components_by_step[submission_step.id] = {
+                component["key"]: component
+                for component in submission_step.form_step.iter_components(
+                    recursive=True
+                )
+                if "key" in component
+            }
+        component = components_by_step[submission_step.id].get(attachment.form_key)
+        if component is None:
+            continue
+        resize_size = get_resize_size(component)
+        if resize_size:
+            yield attachment, resize_size
+
+
 def cleanup_submission_temporary_uploaded_files(submission: Submission):
     for attachment in SubmissionFileAttachment.objects.for_submission(
         submission
@@ -209,5 +247,10 @@ def resize_attachment(
         with NamedTemporaryFile() as tmp:
             image.thumbnail(size)
             image.save(tmp, image.format)
+            # the resized image gets a new file name, remove the original image once
+            # the attachment refers to the new file
+            original_name = attachment.content.name
             attachment.content.save(attachment.content.name, tmp, save=True)
+            storage = attachment.content.storage
+            transaction.on_commit(partial(storage.delete, original_name))
             return True
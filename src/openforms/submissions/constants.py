@@ -17,7 +17,7 @@ class RegistrationStatuses(DjangoChoices):
 
 class ProcessingStatuses(DjangoChoices):
     """
-    Translation of interal Celery states to public states.
+    Translation of the on_completion task states to public states.
     """
 
     in_progress = ChoiceItem("in_progress", _("In progress"))
@@ -31,3 +31,21 @@ class ProcessingResults(DjangoChoices):
 
     failed = ChoiceItem("failed", _("Failed, should return to the start of the form."))
     success = ChoiceItem("success", _("Success, proceed to confirmation page."))
+
+
+class ProcessingTaskStates(DjangoChoices):
+    """
+    States of the tasks of the on_completion workflow.
+    """
+
+    pending = ChoiceItem("pending", _("Pending"))
+    started = ChoiceItem("started", _("Started"))
+    success = ChoiceItem("success", _("Success"))
+    failed = ChoiceItem("failed", _("Failed"))
+
+
+class SubmissionExportStatuses(DjangoChoices):
+    pending = ChoiceItem("pending", _("Pending"))
+    in_progress = ChoiceItem("in_progress", _("In progress"))
+    success = ChoiceItem("success", _("Success"))
+    failed = ChoiceItem("failed", _("Failed"))
@@ -1,39 +1,210 @@
-from django.http import FileResponse
+"""
+Export the data of submissions.
+
+The submission data is read from the materialized merged data of the submissions,
+over a server-side cursor in chunks of :data:`EXPORT_CHUNK_SIZE` submissions. The
+headers are discovered in a first pass that only fetches the keys of the data, and are
+put in the order of the form components.
+
+CSV and NDJSON exports are streamed to the client while they are produced. Exports in
+other formats (and very large exports) are prepared in the background, see
+:func:`openforms.submissions.tasks.exports.export_submissions_job`.
+"""
+import csv
+import json
+from typing import IO, Callable, Iterator, List, Optional
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import F, Func, Min, TextField
+from django.http import FileResponse, StreamingHttpResponse
+from django.http.response import HttpResponseBase
 from django.utils.timezone import make_naive
 
 import tablib
+from openpyxl import Workbook
+
+from openforms.forms.models import Form
 
 from .query import SubmissionQuerySet
 
+EXPORT_CHUNK_SIZE = 500
 
-def create_submission_export(queryset: SubmissionQuerySet) -> tablib.Dataset:
-    headers = []
-    for submission in queryset:
-        headers += list(submission.get_merged_data().keys())
-    headers = list(dict.fromkeys(headers))  # Remove duplicates
-    data = tablib.Dataset(headers=["Formuliernaam", "Inzendingdatum"] + headers)
-    for submission in queryset:
-        inzending_datum = (
-            make_naive(submission.completed_on) if submission.completed_on else None
+FIXED_HEADERS = ["Formuliernaam", "Inzendingdatum"]
+
+
+def materialize_merged_data(queryset: SubmissionQuerySet) -> None:
+    # submissions without (saved) steps have no merged data snapshot yet
+    for submission in queryset.filter(_merged_data__isnull=True).iterator():
+        submission.update_merged_data()
+
+
+def get_export_headers(queryset: SubmissionQuerySet) -> List[str]:
+    """
+    Return the keys of the submission data, in order of the form components.
+
+    Keys without a (current) component of the form follow, in order of appearance.
+    """
+    materialize_merged_data(queryset)
+    keys = (
+        queryset.order_by("pk")
+        .annotate(
+            data_key=Func(
+                F("_merged_data"),
+                function="jsonb_object_keys",
+                output_field=TextField(),
+            )
         )
-        submission_data = [
-            submission.form.admin_name,
-            inzending_datum,
+        .values_list("data_key", flat=True)
+    )
+    data_keys = list(dict.fromkeys(keys.iterator(chunk_size=EXPORT_CHUNK_SIZE)))
+
+    form_ids = [
+        row["form"]
+        for row in queryset.order_by()
+        .values("form")
+        .annotate(first_submission=Min("pk"))
+        .order_by("first_submission")
+    ]
+    forms = Form.objects.in_bulk(form_ids)
+    present_keys = set(data_keys)
+    headers = {}
+    for form_id in form_ids:
+        for component in forms[form_id].iter_components():
+            key = component.get("key")
+            if key in present_keys:
+                headers[key] = None
+    headers.update(dict.fromkeys(data_keys))
+    return list(headers)
+
+
+def iter_export_rows(
+    queryset: SubmissionQuerySet, headers: List[str]
+) -> Iterator[list]:
+    """
+    Yield the row of every submission, with the values of the fixed and data headers.
+    """
+    submissions = queryset.order_by("pk").values_list(
+        "form__internal_name", "form__name", "completed_on", "_merged_data"
+    )
+    for internal_name, name, completed_on, merged_data in submissions.iterator(
+        chunk_size=EXPORT_CHUNK_SIZE
+    ):
+        # equivalent to :attr:`Form.admin_name`
+        form_name = internal_name or name
+        inzending_datum = make_naive(completed_on) if completed_on else None
+        merged_data = merged_data or {}
+        yield [form_name, inzending_datum] + [
+            merged_data.get(header) for header in headers
         ]
-        merged_data = submission.get_merged_data()
-        for header in headers:
-            submission_data.append(merged_data.get(header))
-        data.append(submission_data)
+
+
+def create_submission_export(queryset: SubmissionQuerySet) -> tablib.Dataset:
+    headers = get_export_headers(queryset)
+    data = tablib.Dataset(headers=FIXED_HEADERS + headers)
+    for row in iter_export_rows(queryset, headers):
+        data.append(row)
     return data
 
 
-def export_submissions(queryset: SubmissionQuerySet, file_type: str) -> FileResponse:
-    export_data = create_submission_export(queryset)
+class _Echo:
+    """
+    File-like object returning the written value, for :func:`csv.writer`.
+    """
+
+    def write(self, value: str) -> str:
+        return value
 
+
+def stream_csv(headers: List[str], rows: Iterator[list]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow(FIXED_HEADERS + headers)
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def stream_ndjson(headers: List[str], rows: Iterator[list]) -> Iterator[str]:
+    all_headers = FIXED_HEADERS + headers
+    for row in rows:
+        yield json.dumps(dict(zip(all_headers, row)), cls=DjangoJSONEncoder) + "\n"
+
+
+# formats that are produced row by row: file type -> (generator, content type)
+STREAMING_FORMATS = {
+    "csv": (stream_csv, "text/csv"),
+    "ndjson": (stream_ndjson, "application/x-ndjson"),
+}
+
+
+def export_submissions(
+    queryset: SubmissionQuerySet, file_type: str
+) -> HttpResponseBase:
     filename = f"submissions_export.{file_type}"
+
+    if file_type in STREAMING_FORMATS:
+        stream, content_type = STREAMING_FORMATS[file_type]
+        headers = get_export_headers(queryset)
+        response = StreamingHttpResponse(
+            stream(headers, iter_export_rows(queryset, headers)),
+            content_type=content_type,
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    export_data = create_submission_export(queryset)
     response = FileResponse(
         export_data.export(file_type), filename=filename, as_attachment=True
     )
     response.set_headers(response.streaming_content)
 
     return response
+
+
+def _to_cell_value(value):
+    # spreadsheet cells only hold scalar values
+    if isinstance(value, (dict, list)):
+        return str(value)
+    return value
+
+
+def _write_xlsx(headers: List[str], rows: Iterator[list], outfile: IO[bytes]) -> None:
+    # the rows of a write-only workbook are written to disk while they are added
+    workbook = Workbook(write_only=True)
+    worksheet = workbook.create_sheet()
+    worksheet.append(FIXED_HEADERS + headers)
+    for row in rows:
+        worksheet.append([_to_cell_value(value) for value in row])
+    workbook.save(outfile)
+
+
+def write_submission_export(
+    queryset: SubmissionQuerySet,
+    file_type: str,
+    outfile: IO[bytes],
+    on_progress: Optional[Callable[[int], None]] = None,
+) -> None:
+    """
+    Write the export to a (binary) file.
+
+    :param on_progress: called with the number of exported submissions, after every
+      chunk of submissions.
+    """
+    headers = get_export_headers(queryset)
+
+    def rows() -> Iterator[list]:
+        num_processed = 0
+        for row in iter_export_rows(queryset, headers):
+            yield row
+            num_processed += 1
+            if on_progress and num_processed % EXPORT_CHUNK_SIZE == 0:
+                on_progress(num_processed)
+        if on_progress:
+            on_progress(num_processed)
+
+    if file_type in STREAMING_FORMATS:
+        stream, _ = STREAMING_FORMATS[file_type]
+        for chunk in stream(headers, rows()):
+            outfile.write(chunk.encode("utf-8"))
+    elif file_type == "xlsx":
+        _write_xlsx(headers, rows(), outfile)
+    else:
+        raise ValueError(f"Unsupported export file type '{file_type}'")
@@ -1,9 +1,9 @@
-from typing import TYPE_CHECKING, Any, Dict
-
-from json_logic import jsonLogic
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional
 
+from openforms.forms.component_index import ComponentIndex, get_component_index
 from openforms.forms.constants import LogicActionTypes
-from openforms.forms.models.form import FormLogic
+from openforms.forms.logic import get_form_logic
 from openforms.prefill import JSONObject
 
 if TYPE_CHECKING:
@@ -15,15 +15,13 @@ def set_property_value(
     component_key: str,
     property_name: str,
     property_value: str,
+    component_index: Optional[ComponentIndex] = None,
 ) -> JSONObject:
-    for index, component in enumerate(configuration["components"]):
-        if "components" in component:
-            configuration = set_property_value(
-                component, component_key, property_name, property_value
-            )
+    if component_index is None:
+        component_index = get_component_index(configuration)
 
-        if component["key"] == component_key:
-            configuration["components"][index][property_name] = property_value
+    for component in component_index.locate(configuration, component_key):
+        component[property_name] = property_value
 
     return configuration
 
@@ -35,7 +33,8 @@ def evaluate_form_logic(
     Process all the form logic rules and mutate the step configuration if required.
     """
     # grab the configuration that can be **mutated**
-    configuration = step.form_step.form_definition.configuration
+    form_definition = step.form_step.form_definition
+    configuration = form_definition.configuration
 
     if not step.data:
         step.data = {}
@@ -45,33 +44,38 @@ def evaluate_form_logic(
     if _evaluated:
         return configuration
 
-    rules = FormLogic.objects.filter(form=step.form_step.form)
+    form_logic = get_form_logic(step.form_step.form)
     submission_state = submission.load_execution_state()
+    # index the configuration before modifying it - the logic only changes component
+    # properties, the structure of the configuration remains the same
+    component_index = form_definition.component_index
 
-    for rule in rules:
-        if jsonLogic(rule.json_logic_trigger, data):
+    for rule in form_logic.rules:
+        if rule.is_triggered(data):
             for action in rule.actions:
-                action_details = action["action"]
-                if action_details["type"] == LogicActionTypes.value:
-                    new_value = jsonLogic(action_details["value"], data)
+                if action.type == LogicActionTypes.value:
+                    new_value = action.value(data)
                     configuration = set_property_value(
-                        configuration, action["component"], "value", new_value
+                        configuration,
+                        action.component,
+                        "value",
+                        new_value,
+                        component_index=component_index,
                     )
-                    step.data[action["component"]] = new_value
-                elif action_details["type"] == LogicActionTypes.property:
-                    property_name = action_details["property"]["value"]
-                    property_value = action_details["state"]
+                    step.data[action.component] = new_value
+                elif action.type == LogicActionTypes.property:
                     set_property_value(
                         configuration,
-                        action["component"],
-                        property_name,
-                        property_value,
+                        action.component,
+                        action.property_name,
+                        action.get_state(),
+                        component_index=component_index,
                     )
-                elif action_details["type"] == LogicActionTypes.disable_next:
+                elif action.type == LogicActionTypes.disable_next:
                     step._can_submit = False
-                elif action_details["type"] == LogicActionTypes.step_not_applicable:
+                elif action.type == LogicActionTypes.step_not_applicable:
                     submission_step_to_modify = submission_state.resolve_step(
-                        action["form_step"]
+                        action.form_step
                     )
                     submission_step_to_modify._is_applicable = False
 
@@ -81,21 +85,110 @@ def evaluate_form_logic(
 
 
 def check_submission_logic(submission):
-    logic_rules = FormLogic.objects.filter(
-        form=submission.form,
-        actions__contains=[{"action": {"type": LogicActionTypes.step_not_applicable}}],
+    logic_rules = get_form_logic(submission.form).get_rules_with_action(
+        LogicActionTypes.step_not_applicable
     )
+    if not logic_rules:
+        return
 
     merged_data = submission.data
     submission_state = submission.load_execution_state()
 
     for rule in logic_rules:
-        if jsonLogic(rule.json_logic_trigger, merged_data):
+        if rule.is_triggered(merged_data):
             for action in rule.actions:
-                if action["action"]["type"] != LogicActionTypes.step_not_applicable:
+                if action.type != LogicActionTypes.step_not_applicable:
                     continue
 
                 submission_step_to_modify = submission_state.resolve_step(
-                    action["form_step"]
+                    action.form_step
                 )
                 submission_step_to_modify._is_applicable = False
+
+
+@dataclass
+class LogicChanges:
+    """
+    The resulting state of everything the affected logic rules can modify.
+
+    ``components`` holds the component properties by component key, ``data`` the
+    values set by triggered value actions and ``steps`` the applicability of form
+    steps, by form step UUID. ``can_submit`` is ``None`` if not affected.
+    """
+
+    components: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    data: Dict[str, Any] = field(default_factory=dict)
+    can_submit: Optional[bool] = None
+    steps: Dict[str, bool] = field(default_factory=dict)
+
+
+def evaluate_form_logic_changes(
+    submission: "Submission",
+    step: "SubmissionStep",
+    data: Dict[str, Any],
+    changed_keys: Iterable[str],
+) -> LogicChanges:
+    """
+    Evaluate only the logic rules affected by the changed data keys.
+
+    Instead of the full mutated step configuration, the state of every component
+    property, data key and step attribute that the affected rules can modify is
+    returned. For those, the outcome is identical to :func:`evaluate_form_logic` - if
+    no triggered rule modifies them, the values from the form definition apply again.
+    """
+    rules = get_form_logic(step.form_step.form).get_affected_rules(changed_keys)
+    changes = LogicChanges()
+    if not rules:
+        return changes
+
+    component_index = step.form_step.form_definition.component_index
+    steps = {}
+
+    def get_step_uuid(form_step_url: str) -> Optional[str]:
+        if form_step_url not in steps:
+            submission_state = submission.load_execution_state()
+            submission_step = submission_state.resolve_step(form_step_url)
+            steps[form_step_url] = (
+                str(submission_step.form_step.uuid) if submission_step else None
+            )
+        return steps[form_step_url]
+
+    # start from the state as defined in the form
+    for rule in rules:
+        for action in rule.actions:
+            target = action.target
+            if action.type in (LogicActionTypes.property, LogicActionTypes.value):
+                if (component := component_index.get_component(target.key)) is not None:
+                    changes.components.setdefault(target.key, {})[
+                        target.attribute
+                    ] = component.get(target.attribute)
+            elif action.type == LogicActionTypes.disable_next:
+                changes.can_submit = True
+            elif action.type == LogicActionTypes.step_not_applicable:
+                if step_uuid := get_step_uuid(action.form_step):
+                    changes.steps[step_uuid] = True
+
+    # and apply the triggered rules, in order
+    for rule in rules:
+        if not rule.is_triggered(data):
+            continue
+
+        for action in rule.actions:
+            target = action.target
+            if action.type == LogicActionTypes.value:
+                new_value = action.value(data)
+                changes.data[action.component] = new_value
+                if target.key in changes.components:
+                    changes.components[target.key][target.attribute] = new_value
+            elif action.type == LogicActionTypes.property:
+                if target.key in changes.components:
+                    changes.components[target.key][
+                        target.attribute
+                    ] = action.get_state()
+            elif action.type == LogicActionTypes.disable_next:
+                changes.can_submit = False
+            elif action.type == LogicActionTypes.step_not_applicable:
+                if step_uuid := get_step_uuid(action.form_step):
+                    changes.steps[step_uuid] = False
+
+    return changes
@@ -0,0 +1,81 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_datetime
+from django.utils.translation import ugettext_lazy as _
+
+from openforms.forms.models import Form
+
+from ...analytics import (
+    FILE_FORMATS,
+    export_form_submissions,
+    read_watermark,
+    write_watermark,
+)
+
+
+class Command(BaseCommand):
+    help = "Export the completed submissions to Parquet/Arrow files for analytics."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "form_uuids",
+            nargs="*",
+            help=_("UUIDs of the forms to export (default: all forms)"),
+        )
+        parser.add_argument(
+            "--output-dir",
+            required=True,
+            help=_("Directory to write the (partitioned) export files to"),
+        )
+        parser.add_argument(
+            "--format",
+            choices=FILE_FORMATS,
+            default="parquet",
+            help=_("File format of the export"),
+        )
+        parser.add_argument(
+            "--since",
+            help=_(
+                "Only export submissions completed after this ISO-8601 timestamp, "
+                "instead of after the watermark of the previous export. Requires a "
+                "single form."
+            ),
+        )
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help=_(
+                "Export all submissions, ignoring the watermark of previous exports"
+            ),
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options["since"]:
+            if len(options["form_uuids"]) != 1:
+                raise CommandError("--since can only be used to export a single form")
+            since = parse_datetime(options["since"])
+            if since is None:
+                raise CommandError(f"Invalid timestamp '{options['since']}'")
+
+        forms = Form.objects.order_by("pk")
+        if options["form_uuids"]:
+            forms = forms.filter(uuid__in=options["form_uuids"])
+
+        for form in forms.iterator():
+            # every form is exported from its own watermark
+            form_since = since
+            if form_since is None and not options["full"]:
+                form_since = read_watermark(options["output_dir"], form)
+            result = export_form_submissions(
+                form,
+                options["output_dir"],
+                file_format=options["format"],
+                since=form_since,
+            )
+            write_watermark(options["output_dir"], form, result.watermark)
+            for path in result.files:
+                self.stdout.write(path)
+            self.stdout.write(
+                f"Exported {result.num_rows} submission(s) of '{form.admin_name}', "
+                f"watermark: {result.watermark.isoformat()}"
+            )
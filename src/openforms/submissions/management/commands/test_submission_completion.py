@@ -24,12 +24,6 @@ class Command(BaseCommand):
             type=int,
             help="Re-use an existing submission to test.",
         )
-        parser.add_argument(
-            "--no-forget",
-            dest="forget",
-            action="store_false",
-            help="Do not forget the results from the celery result backend.",
-        )
         parser.add_argument(
             "--with-incomplete-appointment",
             action="store_true",
@@ -74,16 +68,16 @@ class Command(BaseCommand):
         self.stdout.write("Entering on_completion flow...")
         on_completion(submission.id)
 
-        submission.refresh_from_db()
-        request = RequestFactory().get("/irrelevant")
-        processing_status = SubmissionProcessingStatus(
-            request=Request(request), submission=submission
-        )
+        request = Request(RequestFactory().get("/irrelevant"))
 
-        while processing_status.status == ProcessingStatuses.in_progress:
+        while True:
+            # the processing status reads the task states once
+            processing_status = SubmissionProcessingStatus(
+                request=request, submission=submission
+            )
+            if processing_status.status != ProcessingStatuses.in_progress:
+                break
             self.stdout.write("Still processing...")
             time.sleep(1)
 
         self.stdout.write(f"Processing complete, result: {processing_status.result}")
-        if options["forget"]:
-            processing_status.forget_results()
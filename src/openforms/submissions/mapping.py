@@ -84,7 +84,7 @@ def apply_data_mapping(
     # build a lookup, also implicitly de-duplicates assigned attributes
     attr_key_lookup = dict()
 
-    for component in submission.form.iter_components(recursive=True):
+    for component in submission.form.iter_components_with(component_attribute):
         key = component.get("key")
         attribute = glom(component, component_attribute, default=None)
         if key and attribute:
@@ -134,7 +134,7 @@ def get_unmapped_data(
 
     attr_key_lookup = dict()
 
-    for component in submission.form.iter_components(recursive=True):
+    for component in submission.form.iter_components_with(component_attribute):
         key = component.get("key")
         attribute = glom(component, component_attribute, default=None)
         if key and attribute:
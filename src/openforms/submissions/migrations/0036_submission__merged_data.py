@@ -0,0 +1,41 @@
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations
+
+
+def materialize_merged_data(apps, _):
+    Submission = apps.get_model("submissions", "Submission")
+    SubmissionStep = apps.get_model("submissions", "SubmissionStep")
+
+    for submission_id in Submission.objects.values_list("pk", flat=True).iterator():
+        steps_data = (
+            SubmissionStep.objects.filter(submission_id=submission_id)
+            .exclude(data=None)
+            .order_by("pk")
+            .values_list("data", flat=True)
+        )
+        merged_data = {}
+        for step_data in steps_data:
+            merged_data.update(step_data)
+        Submission.objects.filter(pk=submission_id).update(_merged_data=merged_data)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submissions", "0035_submission_confirmation_email_sent"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="submission",
+            name="_merged_data",
+            field=django.contrib.postgres.fields.jsonb.JSONField(
+                blank=True,
+                editable=False,
+                help_text="Snapshot of the data of all submission steps, updated whenever step data is saved.",
+                null=True,
+                verbose_name="merged data",
+            ),
+        ),
+        migrations.RunPython(materialize_merged_data, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,113 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+import django_better_admin_arrayfield.models.fields
+import privates.fields
+import privates.storages
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("forms", "0004_form_logic_version"),
+        ("submissions", "0036_submission__merged_data"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SubmissionExport",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "file_type",
+                    models.CharField(max_length=10, verbose_name="file type"),
+                ),
+                (
+                    "submission_ids",
+                    django_better_admin_arrayfield.models.fields.ArrayField(
+                        base_field=models.PositiveIntegerField(
+                            verbose_name="submission ID"
+                        ),
+                        blank=True,
+                        default=list,
+                        size=None,
+                        verbose_name="submission IDs",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("in_progress", "In progress"),
+                            ("success", "Success"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=50,
+                        verbose_name="status",
+                    ),
+                ),
+                (
+                    "num_processed",
+                    models.PositiveIntegerField(
+                        default=0, verbose_name="number of processed submissions"
+                    ),
+                ),
+                (
+                    "content",
+                    privates.fields.PrivateMediaFileField(
+                        blank=True,
+                        help_text="Content of the export.",
+                        storage=privates.storages.PrivateMediaFileSystemStorage(),
+                        upload_to="submission-exports/%Y/%m/%d",
+                        verbose_name="content",
+                    ),
+                ),
+                (
+                    "created_on",
+                    models.DateTimeField(auto_now_add=True, verbose_name="created on"),
+                ),
+                (
+                    "completed_on",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="completed on"
+                    ),
+                ),
+                (
+                    "form",
+                    models.ForeignKey(
+                        help_text="Form of the exported submissions.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="forms.Form",
+                        verbose_name="form",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="User who requested the export.",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="user",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "submission export",
+                "verbose_name_plural": "submission exports",
+            },
+        ),
+    ]
@@ -0,0 +1,75 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submissions", "0037_submissionexport"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SubmissionProcessingState",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "task_name",
+                    models.CharField(max_length=255, verbose_name="task name"),
+                ),
+                (
+                    "task_id",
+                    models.CharField(
+                        blank=True,
+                        db_index=True,
+                        help_text="ID of the Celery task, assigned when the workflow is scheduled.",
+                        max_length=255,
+                        verbose_name="task ID",
+                    ),
+                ),
+                (
+                    "state",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("started", "Started"),
+                            ("success", "Success"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=50,
+                        verbose_name="state",
+                    ),
+                ),
+                (
+                    "updated_on",
+                    models.DateTimeField(auto_now=True, verbose_name="updated on"),
+                ),
+                (
+                    "submission",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="processing_states",
+                        to="submissions.Submission",
+                        verbose_name="submission",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "submission processing state",
+                "verbose_name_plural": "submission processing states",
+            },
+        ),
+        migrations.RemoveField(
+            model_name="submission",
+            name="on_completion_task_ids",
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("submissions", "0038_submissionprocessingstate"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="submissionexport",
+            name="since",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Analytics exports only: the submissions completed after this moment are exported.",
+                null=True,
+                verbose_name="since",
+            ),
+        ),
+        migrations.AddField(
+            model_name="submissionexport",
+            name="watermark",
+            field=models.DateTimeField(
+                blank=True,
+                help_text="Analytics exports only: the submissions completed up to this moment are exported. Pass it as 'since' to the next export.",
+                null=True,
+                verbose_name="watermark",
+            ),
+        ),
+    ]
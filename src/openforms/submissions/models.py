@@ -4,18 +4,18 @@ import uuid
 from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
+from django.conf import settings
 from django.contrib.postgres.fields import JSONField
 from django.core.files.base import ContentFile, File
 from django.db import models, transaction
 from django.shortcuts import render
-from django.template import Context, Template
+from django.template import Context
 from django.urls import resolve
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 
-from celery.result import AsyncResult
 from django_better_admin_arrayfield.models.fields import ArrayField
 from furl import furl
 from glom import glom
@@ -26,11 +26,16 @@ from openforms.config.models import GlobalConfiguration
 from openforms.emails.utils import sanitize_content
 from openforms.forms.models import FormStep
 from openforms.utils.fields import StringUUIDField
+from openforms.utils.templates import get_template_from_string
 from openforms.utils.validators import validate_bsn
 
 from ..contrib.kvk.validators import validate_kvk
 from ..payments.constants import PaymentStatus
-from .constants import RegistrationStatuses
+from .constants import (
+    ProcessingTaskStates,
+    RegistrationStatuses,
+    SubmissionExportStatuses,
+)
 from .query import SubmissionQuerySet
 
 logger = logging.getLogger(__name__)
@@ -84,6 +89,22 @@ class SubmissionState:
         return self.get_submission_step(form_step_uuid=step_to_modify_uuid)
 
 
+def merge_step_data(steps_data: Iterable[dict]) -> dict:
+    merged_data = dict()
+
+    for step_data in steps_data:
+        for key, value in step_data.items():
+            if key in merged_data:
+                logger.warning(
+                    "%s was previously in merged_data and will be overwritten by %s",
+                    key,
+                    value,
+                )
+            merged_data[key] = value
+
+    return merged_data
+
+
 def _get_config_field(field: str) -> str:
     # workaround for when this function is called during migrations and the table
     # hasn't fully migrated yet
@@ -173,27 +194,23 @@ class Submission(models.Model):
         help_text=_("Indicates whether the confirmation email has been sent."),
     )
 
-    _is_cleaned = models.BooleanField(
-        _("is cleaned"),
-        default=False,
+    # denormalized merge of the submission step data, maintained on step writes
+    _merged_data = JSONField(
+        _("merged data"),
+        blank=True,
+        null=True,
+        editable=False,
         help_text=_(
-            "Indicates whether sensitive data (if there was any) has been removed from this submission."
+            "Snapshot of the data of all submission steps, updated whenever step data "
+            "is saved."
         ),
     )
 
-    # tracking async execution state
-    on_completion_task_ids = ArrayField(
-        base_field=models.CharField(
-            _("on completion task ID"),
-            max_length=255,
-            blank=True,
-        ),
-        default=list,
-        verbose_name=_("on completion task IDs"),
-        blank=True,
+    _is_cleaned = models.BooleanField(
+        _("is cleaned"),
+        default=False,
         help_text=_(
-            "Celery task IDs of the on_completion workflow. Use this to inspect the "
-            "state of the async jobs."
+            "Indicates whether sensitive data (if there was any) has been removed from this submission."
         ),
     )
 
@@ -216,6 +233,17 @@ class Submission(models.Model):
             started=self.created_on or _("(no timestamp yet)"),
         )
 
+    def save(self, *args, **kwargs):
+        # the merged data snapshot is maintained by the submission steps - never
+        # overwrite it with a possibly outdated in-memory version
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "_merged_data"
+            ]
+        super().save(*args, **kwargs)
+
     def refresh_from_db(self, *args, **kwargs):
         super().refresh_from_db(*args, **kwargs)
         if hasattr(self, "_execution_state"):
@@ -290,15 +318,20 @@ class Submission(models.Model):
         return state
 
     def render_confirmation_page(self) -> str:
-        if not (template := self.form.submission_confirmation_template):
+        if template := self.form.submission_confirmation_template:
+            scope = ("submission_confirmation_template", self.form_id)
+        else:
             config = GlobalConfiguration.get_solo()
             template = config.submission_confirmation_template
+            scope = ("submission_confirmation_template", None)
 
         context_data = {
             "public_reference": self.public_registration_reference,
             **self.data,
         }
-        rendered_content = Template(template).render(Context(context_data))
+        rendered_content = get_template_from_string(template, scope=scope).render(
+            Context(context_data)
+        )
 
         return sanitize_content(rendered_content)
 
@@ -353,7 +386,7 @@ class Submission(models.Model):
         merged_data = self.get_merged_data()
         appointment_data = {}
 
-        for component in self.form.iter_components(recursive=True):
+        for component in self.form.iter_components_with("appointments"):
             # is this component any of the keys were looking for?
             for (
                 component_key,
@@ -373,19 +406,20 @@ class Submission(models.Model):
         return appointment_data
 
     def get_merged_data(self) -> dict:
-        merged_data = dict()
-
-        for step in self.submissionstep_set.exclude(data=None):
-            for key, value in step.data.items():
-                if key in merged_data:
-                    logger.warning(
-                        "%s was previously in merged_data and will be overwritten by %s",
-                        key,
-                        value,
-                    )
-                merged_data[key] = value
+        if self._merged_data is None:
+            # not materialized yet, e.g. the submission has no (saved) steps
+            self.update_merged_data()
+        # the caller may modify the result - don't hand out the snapshot itself
+        return dict(self._merged_data)
+
+    def update_merged_data(self) -> None:
+        """
+        Rebuild the merged data snapshot from the submission steps.
 
-        return merged_data
+        :meth:`SubmissionStep.save` and :meth:`SubmissionStep.delete` take care of
+        this, call it after bulk modifications of submission step data.
+        """
+        self._merged_data = _update_merged_data(self.pk) if self.pk else {}
 
     def get_printable_data(self) -> Dict[str, str]:
         printable_data = OrderedDict()
@@ -479,6 +513,33 @@ class SubmissionStep(models.Model):
     def __str__(self):
         return f"SubmissionStep {self.pk}: Submission {self.submission_id} submitted on {self.created_on}"
 
+    def save(self, *args, **kwargs):
+        with transaction.atomic():
+            self._lock_submission()
+            super().save(*args, **kwargs)
+            self._update_submission_merged_data()
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            self._lock_submission()
+            result = super().delete(*args, **kwargs)
+            self._update_submission_merged_data()
+        return result
+
+    def _lock_submission(self) -> None:
+        # serialize concurrent writes of steps of the same submission, so that the
+        # merged data snapshot includes the data of the other (committed) steps
+        Submission.objects.select_for_update().filter(
+            pk=self.submission_id
+        ).values_list("pk").first()
+
+    def _update_submission_merged_data(self) -> None:
+        # keep the in-memory submission in sync too, if there is one
+        if SubmissionStep.submission.is_cached(self):
+            self.submission.update_merged_data()
+        else:
+            _update_merged_data(self.submission_id)
+
     @property
     def completed(self) -> bool:
         # TODO: should check that all the data for the form definition is present?
@@ -495,6 +556,18 @@ class SubmissionStep(models.Model):
         return self._is_applicable
 
 
+def _update_merged_data(submission_id: int) -> dict:
+    steps_data = (
+        SubmissionStep.objects.filter(submission_id=submission_id)
+        .exclude(data=None)
+        .order_by("pk")
+        .values_list("data", flat=True)
+    )
+    merged_data = merge_step_data(steps_data)
+    Submission.objects.filter(pk=submission_id).update(_merged_data=merged_data)
+    return merged_data
+
+
 class SubmissionReport(models.Model):
     title = models.CharField(
         verbose_name=_("title"),
@@ -564,11 +637,44 @@ class SubmissionReport(models.Model):
         )
         self.save()
 
-    def get_celery_task(self) -> Optional[AsyncResult]:
-        if not self.task_id:
-            return
 
-        return AsyncResult(id=self.task_id)
+class SubmissionProcessingState(models.Model):
+    """
+    State of a task of the on_completion workflow of a submission.
+
+    The states are updated by the tasks themselves (see
+    :mod:`openforms.submissions.tasks`), the processing status of a submission is read
+    from them.
+    """
+
+    submission = models.ForeignKey(
+        "Submission",
+        on_delete=models.CASCADE,
+        verbose_name=_("submission"),
+        related_name="processing_states",
+    )
+    task_name = models.CharField(_("task name"), max_length=255)
+    task_id = models.CharField(
+        _("task ID"),
+        max_length=255,
+        blank=True,
+        db_index=True,
+        help_text=_("ID of the Celery task, assigned when the workflow is scheduled."),
+    )
+    state = models.CharField(
+        _("state"),
+        max_length=50,
+        choices=ProcessingTaskStates.choices,
+        default=ProcessingTaskStates.pending,
+    )
+    updated_on = models.DateTimeField(_("updated on"), auto_now=True)
+
+    class Meta:
+        verbose_name = _("submission processing state")
+        verbose_name_plural = _("submission processing states")
+
+    def __str__(self):
+        return f"{self.task_name}: {self.get_state_display()}"
 
 
 def fmt_upload_to(prefix, instance, filename):
@@ -716,3 +822,82 @@ class SubmissionFileAttachment(models.Model):
 
     def get_format(self):
         return os.path.splitext(self.get_display_name())[1].lstrip(".")
+
+
+class SubmissionExport(models.Model):
+    """
+    Export of (many) submissions, prepared in the background.
+    """
+
+    form = models.ForeignKey(
+        "forms.Form",
+        on_delete=models.CASCADE,
+        verbose_name=_("form"),
+        help_text=_("Form of the exported submissions."),
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        verbose_name=_("user"),
+        help_text=_("User who requested the export."),
+    )
+    file_type = models.CharField(_("file type"), max_length=10)
+    submission_ids = ArrayField(
+        base_field=models.PositiveIntegerField(_("submission ID")),
+        default=list,
+        verbose_name=_("submission IDs"),
+        blank=True,
+    )
+    status = models.CharField(
+        _("status"),
+        max_length=50,
+        choices=SubmissionExportStatuses.choices,
+        default=SubmissionExportStatuses.pending,
+    )
+    num_processed = models.PositiveIntegerField(
+        _("number of processed submissions"), default=0
+    )
+    content = PrivateMediaFileField(
+        verbose_name=_("content"),
+        upload_to="submission-exports/%Y/%m/%d",
+        blank=True,
+        help_text=_("Content of the export."),
+    )
+    created_on = models.DateTimeField(_("created on"), auto_now_add=True)
+    completed_on = models.DateTimeField(_("completed on"), null=True, blank=True)
+    # analytics exports only
+    since = models.DateTimeField(
+        _("since"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "Analytics exports only: the submissions completed after this moment are "
+            "exported."
+        ),
+    )
+    watermark = models.DateTimeField(
+        _("watermark"),
+        null=True,
+        blank=True,
+        help_text=_(
+            "Analytics exports only: the submissions completed up to this moment are "
+            "exported. Pass it as 'since' to the next export."
+        ),
+    )
+
+    class Meta:
+        verbose_name = _("submission export")
+        verbose_name_plural = _("submission exports")
+
+    def __str__(self):
+        return f"{self.form} ({self.file_type})"
+
+    def get_progress(self) -> int:
+        if not self.submission_ids:
+            return 100
+        # submissions committed late can be included in analytics exports
+        return min(self.num_processed * 100 // len(self.submission_ids), 100)
+
+    get_progress.short_description = _("Progress (%)")
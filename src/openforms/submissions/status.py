@@ -1,40 +1,92 @@
 """
-Utility to interact with the celery task status.
+Utility to interact with the submission processing status.
+
+The tasks of the on_completion workflow record their state in
+:class:`openforms.submissions.models.SubmissionProcessingState`, the status is read
+from those in a single query.
+
+Clients can wait for the processing to complete instead of polling the status
+repeatedly: the status endpoint then blocks until the completion tasks are done (or a
+deadline passes). The waiting requests subscribe to a Redis pub/sub channel of the
+submission, on which a notification is published when the task workflow or its error
+callback finished. The task states are only read again after such a notification (or
+every :data:`RECHECK_INTERVAL` seconds, in case a notification was missed).
+
+A waiting request occupies a web server worker for its whole duration. The number of
+concurrently waiting requests is therefore limited by the
+``SUBMISSION_STATUS_MAX_WAITERS`` setting - when all waiter slots are taken, the
+current status is returned immediately and the client polls again.
 """
+import logging
+import math
+import time
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import List
+from typing import Callable, Iterator, List, Optional, Tuple
 
+from django.conf import settings
+from django.core.cache import caches
 from django.urls import reverse
 
-from celery import states
-from celery.result import AsyncResult
+from django_redis import get_redis_connection
+from redis import Redis
+from redis.exceptions import RedisError
 from rest_framework.request import Request
 
 from openforms.appointments.models import AppointmentInfo
 
-from .constants import ProcessingResults, ProcessingStatuses
+from .constants import ProcessingResults, ProcessingStatuses, ProcessingTaskStates
 from .models import Submission
 from .tokens import submission_report_token_generator
 from .utils import add_submmission_to_session
 
+logger = logging.getLogger(__name__)
+
+# seconds between reads of the task states while waiting for a notification
+RECHECK_INTERVAL = 5
+
+WAITER_SLOTS_CACHE_ALIAS = "default"
+WAITER_SLOT_KEY_PREFIX = "submission-status-waiter"
+# extra lifetime of a waiter slot, in case the request takes longer than the wait
+WAITER_SLOT_MARGIN = 60
+
 
 @dataclass
 class SubmissionProcessingStatus:
     request: Request
     submission: Submission
 
-    def get_async_results(self) -> List[AsyncResult]:
-        if not hasattr(self, "_async_result"):
-            task_ids = self.submission.on_completion_task_ids
-            self._async_results = [AsyncResult(task_id) for task_id in task_ids]
-        return self._async_results
+    def get_task_states(self) -> Tuple[List[str], List[str]]:
+        """
+        Return the states of the workflow tasks and the states of its error callback.
+        """
+        # imported here, the tasks notify the status changes
+        from .tasks import maybe_delete_submission_report
+
+        # the states are read once for all the fields of the status
+        if not hasattr(self, "_task_states"):
+            task_states, error_callback_states = [], []
+            for task_name, state in self.submission.processing_states.values_list(
+                "task_name", "state"
+            ):
+                if task_name == maybe_delete_submission_report.name:
+                    error_callback_states.append(state)
+                else:
+                    task_states.append(state)
+            self._task_states = (task_states, error_callback_states)
+        return self._task_states
 
     @property
     def status(self) -> str:
-        results = self.get_async_results()
-        any_failed = any((result.state == states.FAILURE for result in results))
-        all_ready = all((result.state in states.READY_STATES for result in results))
-        if results and (any_failed or all_ready):
+        task_states, error_callback_states = self.get_task_states()
+        # The processing is done at the end of the workflow: when all of its tasks
+        # succeeded, or when a task failed and the error callback finished. The error
+        # callback runs once the tasks running in parallel finished, so the failure is
+        # final by then.
+        all_success = task_states and all(
+            (state == ProcessingTaskStates.success for state in task_states)
+        )
+        if all_success or self._error_callback_finished(error_callback_states):
             return ProcessingStatuses.done
         return ProcessingStatuses.in_progress
 
@@ -42,20 +94,16 @@ class SubmissionProcessingStatus:
     def result(self) -> str:
         if self.status != ProcessingStatuses.done:
             return ""
-
-        results = self.get_async_results()
-        all_success = all((result.state == states.SUCCESS for result in results))
-        any_failed = any((result.state == states.FAILURE for result in results))
-
-        if all_success:
-            return ProcessingResults.success
-        if any_failed:
+        _, error_callback_states = self.get_task_states()
+        if self._error_callback_finished(error_callback_states):
             return ProcessingResults.failed
+        return ProcessingResults.success
 
-        raise RuntimeError(
-            "Unexpected result state! Some tasks were not a success (?) but "
-            "none failed either. Note that this can mean a task was incorrectly "
-            "defined as `ignore_result=True` which prevents us from tracking the state."
+    @staticmethod
+    def _error_callback_finished(error_callback_states: List[str]) -> bool:
+        return any(
+            state in (ProcessingTaskStates.success, ProcessingTaskStates.failed)
+            for state in error_callback_states
         )
 
     @property
@@ -81,7 +129,7 @@ class SubmissionProcessingStatus:
 
     @property
     def report_download_url(self) -> str:
-        # only return a download URL if the entire chain succeeded
+        # only return a download URL if the entire workflow succeeded
         if self.result != ProcessingResults.success:
             return ""
         report = self.submission.report
@@ -110,16 +158,6 @@ class SubmissionProcessingStatus:
         )
         return self.request.build_absolute_uri(payment_start_url)
 
-    def forget_results(self) -> None:
-        """
-        Clean up the results in the Celery result backend.
-
-        Forgetting the results ensures that we don't leak resources.
-        """
-        results = self.get_async_results()
-        for result in results:
-            result.forget()
-
     def ensure_failure_can_be_managed(self) -> None:
         """
         Execute the necessary side-effects to failure can be dealt with.
@@ -138,3 +176,124 @@ class SubmissionProcessingStatus:
         # add the submission ID back to the session so details can be retrieved and
         # submission can be completed again after correcting the mistakes.
         add_submmission_to_session(self.submission, self.request.session)
+
+
+def _get_channel(submission_id: int) -> str:
+    return f"openforms:submission-status:{submission_id}"
+
+
+def _get_redis_connection() -> Optional[Redis]:
+    try:
+        return get_redis_connection("default")
+    except NotImplementedError:
+        # the cache is not backed by Redis (e.g. in development)
+        return None
+
+
+def notify_status_change(submission_id: int) -> None:
+    """
+    Wake up the requests waiting for the processing of the submission.
+    """
+    connection = _get_redis_connection()
+    if connection is None:
+        return
+    try:
+        connection.publish(_get_channel(submission_id), "done")
+    except RedisError:
+        logger.warning(
+            "Could not publish the status change of submission %d",
+            submission_id,
+            exc_info=True,
+        )
+
+
+@contextmanager
+def _subscribe(submission_id: int) -> Iterator[Callable[[float], None]]:
+    """
+    Subscribe to the status changes and yield a function waiting for the next one.
+    """
+    connection = _get_redis_connection()
+    pubsub = None
+    if connection is not None:
+        pubsub = connection.pubsub(ignore_subscribe_messages=True)
+        try:
+            pubsub.subscribe(_get_channel(submission_id))
+        except RedisError:
+            logger.warning("Could not subscribe to status changes", exc_info=True)
+            pubsub.close()
+            pubsub = None
+
+    if pubsub is None:
+        yield time.sleep
+        return
+
+    def wait(timeout: float) -> None:
+        end = time.monotonic() + timeout
+        # get_message returns early for the (ignored) subscription confirmation
+        while (remaining := end - time.monotonic()) > 0:
+            if pubsub.get_message(timeout=remaining):
+                return
+
+    try:
+        yield wait
+    finally:
+        pubsub.close()
+
+
+@contextmanager
+def _claim_waiter_slot(timeout: float) -> Iterator[bool]:
+    """
+    Claim one of the limited waiter slots, yield whether one was available.
+
+    The slots are cache keys that expire on their own, so that slots of requests
+    that were killed are released as well.
+    """
+    cache = caches[WAITER_SLOTS_CACHE_ALIAS]
+    slot_timeout = math.ceil(timeout) + WAITER_SLOT_MARGIN
+    for index in range(settings.SUBMISSION_STATUS_MAX_WAITERS):
+        slot_key = f"{WAITER_SLOT_KEY_PREFIX}:{index}"
+        if cache.add(slot_key, True, timeout=slot_timeout):
+            break
+    else:
+        yield False
+        return
+
+    try:
+        yield True
+    finally:
+        cache.delete(slot_key)
+
+
+def wait_for_processing(
+    request: Request, submission: Submission, timeout: float
+) -> SubmissionProcessingStatus:
+    """
+    Return the processing status once the processing is done or the timeout passed.
+
+    If too many requests are waiting already, the current status is returned.
+    """
+    with _claim_waiter_slot(timeout) as claimed:
+        if not claimed:
+            logger.info(
+                "All waiter slots are taken, not waiting for the processing of "
+                "submission %d",
+                submission.id,
+            )
+            return SubmissionProcessingStatus(request, submission)
+        return _wait_for_processing(request, submission, timeout)
+
+
+def _wait_for_processing(
+    request: Request, submission: Submission, timeout: float
+) -> SubmissionProcessingStatus:
+    deadline = time.monotonic() + timeout
+    # subscribe before the states are read, to not miss a notification in between
+    with _subscribe(submission.id) as wait_for_notification:
+        processing_status = SubmissionProcessingStatus(request, submission)
+        while processing_status.status != ProcessingStatuses.done:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            wait_for_notification(min(remaining, RECHECK_INTERVAL))
+            processing_status = SubmissionProcessingStatus(request, submission)
+    return processing_status
@@ -1,12 +1,20 @@
-from celery import chain
-from celery.result import AsyncResult
+from typing import List
+
+from django.db import transaction
+from django.utils import timezone
+
+from celery import chain, chord, group
+from celery.signals import task_failure, task_prerun, task_success
 
 from openforms.celery import app
 
-from ..models import Submission
+from ..attachments import iter_attachments_to_resize
+from ..constants import ProcessingTaskStates
+from ..models import Submission, SubmissionProcessingState
+from ..status import notify_status_change
 from .appointments import *  # noqa
-from .cleanup import *  # noqa
 from .emails import *  # noqa
+from .exports import *  # noqa
 from .pdf import *  # noqa
 from .registration import *  # noqa
 from .user_uploads import *  # noqa
@@ -14,73 +22,180 @@ from .user_uploads import *  # noqa
 
 def on_completion(submission_id: int) -> None:
     """
-    Celery chain of tasks to execute on a submission completion event.
+    Celery workflow of tasks to execute on a submission completion event.
 
-    This SHOULD be invoked as a transaction.on_commit(...) handler, therefore it should
-    not execute any extra queries in the process this function is running in.
+    This SHOULD be invoked as a transaction.on_commit(...) handler. The processing
+    state of every task in the workflow is (re)set to pending before the workflow is
+    scheduled, the tasks update their state while they are executed.
     """
+    submission = Submission.objects.get(id=submission_id)
+
     # use immutable signatures so that the result of previous tasks is not passed
     # in as an argument to chained tasks
     register_appointment_task = maybe_register_appointment.si(submission_id)
     update_appointment_task = maybe_update_appointment.si(submission_id)
     generate_report_task = generate_submission_report.si(submission_id)
+    resize_attachment_tasks = [
+        resize_submission_attachment.si(attachment.id, resize_size)
+        for attachment, resize_size in iter_attachments_to_resize(submission)
+    ]
     register_submission_task = register_submission.si(submission_id)
     obtain_submission_reference_task = obtain_submission_reference.si(submission_id)
     finalize_completion_task = finalize_completion.si(submission_id)
+    delete_submission_report_task = maybe_delete_submission_report.si(submission_id)
+
+    tracked_tasks = [
+        register_appointment_task,
+        generate_report_task,
+        *resize_attachment_tasks,
+        register_submission_task,
+        obtain_submission_reference_task,
+        update_appointment_task,
+        finalize_completion_task,
+        delete_submission_report_task,
+    ]
+    # the processing states are tracked by task ID, assign the IDs upfront (the
+    # workflow keeps them when it's scheduled)
+    for task in tracked_tasks:
+        task.freeze()
 
     # for the orchestration with distributed processing and dependencies between
     # tasks, see the Celery documentation:
     # https://docs.celeryproject.org/en/stable/userguide/canvas.html#guide-canvas
-    # Additionally, check the developer documentation of Open Forms for a visual
-    # representation of the task orchestration and dependencies (TODO, @joeri)
-    # The linked task (= next task) is only executed if the previous task returns
-    # successfully, so error handling needs to happen inside each task.
-    on_completion_chain = chain(
-        # The appointment must be registered before a confirmation PDF is generated and
-        # any backend registration happens, as on-failure, the user should get feedback
-        # about the failure.
-        register_appointment_task,
-        # The submission report needs to already have been generated before it can be
-        # attached in the registration backend.
-        # TODO: can be in parallel with register_appointment_task and if that fails -> delete the report again
-        generate_report_task,
-        # TODO: ensure that any images that need resizing are done so before this is attempted
+    #
+    #   register_appointment ---+
+    #   generate_report --------+--> register_submission --> obtain_reference
+    #   resize_attachment (*) --+      --> update_appointment --> finalize_completion
+    #
+    # The tasks of the group run in parallel, the chord body (the rest of the workflow)
+    # only runs when all of them succeeded. The linked task (= next task) is only
+    # executed if the previous task returns successfully, so error handling needs to
+    # happen inside each task.
+    complete_registration = chain(
         register_submission_task,
         obtain_submission_reference_task,
         update_appointment_task,
-        # we schedule the finalization so that the ``async_result`` below is marked
-        # as done, which is the "signal" to show the confirmation page. Actual payment
+        # we schedule the finalization so that its processing state is marked as
+        # done, which is the "signal" to show the confirmation page. Actual payment
         # flow & confirmation e-mail follow later.
         finalize_completion_task,
     )
+    # The error callback is called when a task of the chain fails, or - through the
+    # chord body - when a task of the group failed, once all the tasks of the group
+    # finished. It is set on the chain itself: Celery passes it on to the tasks of the
+    # chain, and looks up the error callbacks of a failed chord on its body.
+    complete_registration.set(link_error=[delete_submission_report_task])
+    on_completion_workflow = chord(
+        group(
+            # On failure, the user should get feedback about the failed appointment
+            # before any backend registration happens.
+            register_appointment_task,
+            # The submission report needs to already have been generated before it can
+            # be attached in the registration backend.
+            generate_report_task,
+            # Images that need resizing must be resized before they are sent to the
+            # registration backend. Resizing when the step was saved may not be done
+            # yet, the task is a no-op if it was.
+            *resize_attachment_tasks,
+        ),
+        complete_registration,
+    )
 
     # this can run any time because they have been claimed earlier
     cleanup_temporary_files_for.delay(submission_id)
 
-    async_result: AsyncResult = on_completion_chain.delay()
-
-    # obtain all the task IDs so we can check the state later
-    task_ids = []
-
-    node = async_result
-    while node is not None:
-        task_ids.append(node.id)
-        node = node.parent
-
     # NOTE - this is "risky" since we're running outside of the transaction (this code
     # should run in transaction.on_commit)!
-    Submission.objects.filter(id=submission_id).update(on_completion_task_ids=task_ids)
+    with transaction.atomic():
+        # a failed submission can be completed again, which restarts the workflow -
+        # the tasks of the previous run no longer match any processing state
+        SubmissionProcessingState.objects.filter(submission_id=submission_id).delete()
+        SubmissionProcessingState.objects.bulk_create(
+            [
+                SubmissionProcessingState(
+                    submission_id=submission_id, task_name=task.task, task_id=task.id
+                )
+                for task in tracked_tasks
+            ]
+        )
 
+    on_completion_workflow.delay()
 
-@app.task(bind=True)
+
+@app.task(bind=True, ignore_result=True)
 def finalize_completion(task, submission_id: int) -> None:
     """
     Schedule all the tasks that need to happen to finalize the submission completion.
 
     Finalization happens _after_ the confirmation screen is shown to the end-user.
     Showing this screen depends on all the previous registration tasks being completed,
-    so the :func:`on_completion` handler must kick this off AND have its own task ID
-    that finishes, which is checked in the submission status endpoint.
+    so the :func:`on_completion` handler must kick this off AND have its own processing
+    state that finishes, which is checked in the submission status endpoint.
     """
     send_confirmation_email_task = maybe_send_confirmation_email.si(submission_id)
     send_confirmation_email_task.delay()
+
+
+# tasks of the on_completion workflow that have a processing state, besides the
+# resizes of the attachments
+ON_COMPLETION_TASKS = (
+    maybe_register_appointment.name,
+    generate_submission_report.name,
+    register_submission.name,
+    obtain_submission_reference.name,
+    maybe_update_appointment.name,
+    finalize_completion.name,
+    maybe_delete_submission_report.name,
+)
+
+# the processing is done when one of these tasks finishes: the last task of the
+# workflow, or its error callback
+FINAL_TASKS = (finalize_completion.name, maybe_delete_submission_report.name)
+
+TRACKED_TASKS = ON_COMPLETION_TASKS + (resize_submission_attachment.name,)
+
+
+def _update_processing_state(task_id: str, from_states: List[str], **fields) -> bool:
+    # The processing states are created with the task IDs of the current run of the
+    # workflow, a task of a previous run can't change them. Only the transitions from
+    # the given states are applied: a task that is retried outside of the workflow
+    # (see :func:`openforms.utils.celery.maybe_retry_in_workflow`) keeps its task ID,
+    # but it already finished in the workflow and does not change the state anymore.
+    updated = SubmissionProcessingState.objects.filter(
+        task_id=task_id, state__in=from_states
+    ).update(updated_on=timezone.now(), **fields)
+    return bool(updated)
+
+
+@task_prerun.connect
+def track_task_started(sender=None, task_id=None, task=None, **kwargs):
+    if task.name not in TRACKED_TASKS:
+        return
+    _update_processing_state(
+        task_id, [ProcessingTaskStates.pending], state=ProcessingTaskStates.started
+    )
+
+
+@task_success.connect
+def track_task_succeeded(sender=None, **kwargs):
+    if sender.name not in TRACKED_TASKS:
+        return
+    updated = _update_processing_state(
+        sender.request.id,
+        [ProcessingTaskStates.started],
+        state=ProcessingTaskStates.success,
+    )
+    if updated and sender.name in FINAL_TASKS:
+        notify_status_change(sender.request.args[0])
+
+
+@task_failure.connect
+def track_task_failed(sender=None, task_id=None, args=(), **kwargs):
+    if sender.name not in TRACKED_TASKS:
+        return
+    updated = _update_processing_state(
+        task_id, [ProcessingTaskStates.started], state=ProcessingTaskStates.failed
+    )
+    # when another task fails, the processing is done once the error callback ran
+    if updated and sender.name == maybe_delete_submission_report.name:
+        notify_status_change(args[0])
@@ -35,7 +35,7 @@ def should_retry_appointment_registration(exception, task) -> bool:
     retry_for=(AppointmentRegistrationFailed,),
     should_retry=should_retry_appointment_registration,
 )
-@app.task(bind=True, max_retries=3)
+@app.task(bind=True, max_retries=3, ignore_result=True)
 def maybe_register_appointment(task, submission_id: int) -> None:
     """
     Register an appointment for the submission IF relevant.
@@ -56,7 +56,7 @@ def maybe_register_appointment(task, submission_id: int) -> None:
     timeout=10,
     retry_for=(AppointmentUpdateFailed,),
 )
-@app.task(bind=True, max_retries=3)
+@app.task(bind=True, max_retries=3, ignore_result=True)
 def maybe_update_appointment(task, submission_id: int) -> None:
     """
     Check the submission state and update the appointment with the internal reference.
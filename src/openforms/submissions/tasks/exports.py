@@ -0,0 +1,122 @@
+import logging
+import tempfile
+from urllib.parse import urljoin
+
+from django.conf import settings
+from django.core.files import File
+from django.core.mail import send_mail
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.translation import gettext as _
+
+from openforms.celery import app
+
+from ..analytics import write_export_archive
+from ..constants import SubmissionExportStatuses
+from ..exports import write_submission_export
+from ..models import Submission, SubmissionExport
+
+__all__ = ["export_submissions_job", "export_submissions_analytics_job"]
+
+
+logger = logging.getLogger(__name__)
+
+
+def _notify_user(export: SubmissionExport) -> None:
+    if not export.user or not export.user.email:
+        return
+
+    url = urljoin(
+        settings.BASE_URL,
+        reverse("admin:submissions_submissionexport_change", args=(export.pk,)),
+    )
+    if export.status == SubmissionExportStatuses.success:
+        message = _("The export of the submissions of '{form}' is ready: {url}")
+    else:
+        message = _("The export of the submissions of '{form}' failed: {url}")
+
+    send_mail(
+        _("[Open Forms] Submission export"),
+        message.format(form=export.form.admin_name, url=url),
+        settings.DEFAULT_FROM_EMAIL,
+        [export.user.email],
+        fail_silently=False,
+    )
+
+
+@app.task(ignore_result=True)
+def export_submissions_job(export_id: int) -> None:
+    export = SubmissionExport.objects.select_related("form", "user").get(id=export_id)
+    logger.debug("Preparing submission export %d", export_id)
+
+    export.status = SubmissionExportStatuses.in_progress
+    export.save(update_fields=["status"])
+
+    def on_progress(num_processed: int) -> None:
+        SubmissionExport.objects.filter(pk=export_id).update(
+            num_processed=num_processed
+        )
+
+    queryset = Submission.objects.filter(pk__in=export.submission_ids)
+    try:
+        # the export is written to a temporary file first, to not keep the whole
+        # export in memory
+        with tempfile.TemporaryFile() as outfile:
+            write_submission_export(
+                queryset, export.file_type, outfile, on_progress=on_progress
+            )
+            outfile.seek(0)
+            export.content.save(
+                f"submissions_export.{export.file_type}", File(outfile), save=False
+            )
+    except Exception:
+        logger.exception("Submission export %d failed", export_id)
+        export.status = SubmissionExportStatuses.failed
+    else:
+        export.status = SubmissionExportStatuses.success
+
+    export.refresh_from_db(fields=["num_processed"])
+    export.completed_on = timezone.now()
+    export.save()
+
+    _notify_user(export)
+
+
+@app.task(ignore_result=True)
+def export_submissions_analytics_job(export_id: int) -> None:
+    export = SubmissionExport.objects.select_related("form", "user").get(id=export_id)
+    logger.debug("Preparing analytics export %d", export_id)
+
+    export.status = SubmissionExportStatuses.in_progress
+    export.save(update_fields=["status"])
+
+    def on_progress(num_processed: int) -> None:
+        SubmissionExport.objects.filter(pk=export_id).update(
+            num_processed=num_processed
+        )
+
+    try:
+        with tempfile.TemporaryFile() as outfile:
+            write_export_archive(
+                export.form,
+                outfile,
+                file_format=export.file_type,
+                since=export.since,
+                until=export.watermark,
+                on_progress=on_progress,
+            )
+            outfile.seek(0)
+            export.content.save(
+                f"submissions_{export.form.uuid}.zip", File(outfile), save=False
+            )
+    except Exception:
+        logger.exception("Analytics export %d failed", export_id)
+        export.status = SubmissionExportStatuses.failed
+    else:
+        export.status = SubmissionExportStatuses.success
+
+    export.refresh_from_db(fields=["num_processed"])
+    export.completed_on = timezone.now()
+    export.save()
+
+    _notify_user(export)
@@ -2,18 +2,21 @@ import logging
 
 from django.utils.translation import gettext_lazy as _
 
+from openforms.appointments.constants import AppointmentDetailsStatus
+from openforms.appointments.models import AppointmentInfo
 from openforms.celery import app
 from openforms.logging import logevent
 
-from ..models import Submission, SubmissionReport
+from ..constants import ProcessingTaskStates
+from ..models import Submission, SubmissionProcessingState, SubmissionReport
 
-__all__ = ["generate_submission_report"]
+__all__ = ["generate_submission_report", "maybe_delete_submission_report"]
 
 
 logger = logging.getLogger(__name__)
 
 
-@app.task(bind=True)
+@app.task(bind=True, ignore_result=True)
 def generate_submission_report(task, submission_id: int) -> None:
     logger.debug("Generating submission report for submission %d", submission_id)
     submission = Submission.objects.get(id=submission_id)
@@ -41,3 +44,48 @@ def generate_submission_report(task, submission_id: int) -> None:
         raise
     else:
         logevent.pdf_generation_success(submission, submission_report)
+
+
+@app.task(bind=True, ignore_result=True)
+def maybe_delete_submission_report(task, submission_id: int) -> None:
+    """
+    Delete the submission report again if the appointment registration failed.
+
+    The report is generated in parallel with the appointment registration. When the
+    appointment fails, the end-user corrects the submission data and completes the
+    submission again, which must then generate a new report instead of skipping it.
+
+    This task is the error callback of the on_completion workflow, it runs once all the
+    tasks of the parallel branch have finished. The processing of the submission is
+    only done once this task finished, so the submission can't be completed again
+    before the report is deleted.
+    """
+    # the processing state is started only if the task belongs to the current run of
+    # the workflow - an error callback of a previous run must not delete the report of
+    # the current run
+    is_current_run = SubmissionProcessingState.objects.filter(
+        task_id=task.request.id, state=ProcessingTaskStates.started
+    ).exists()
+    if not is_current_run:
+        logger.debug(
+            "Error callback %s does not belong to the current processing of "
+            "submission %d, skipping...",
+            task.request.id,
+            submission_id,
+        )
+        return
+
+    appointment_failed = AppointmentInfo.objects.filter(
+        submission_id=submission_id,
+        status__in=[
+            AppointmentDetailsStatus.failed,
+            AppointmentDetailsStatus.missing_info,
+        ],
+    ).exists()
+    if appointment_failed:
+        logger.debug(
+            "Appointment registration failed, deleting the submission report of "
+            "submission %d",
+            submission_id,
+        )
+        SubmissionReport.objects.filter(submission_id=submission_id).delete()
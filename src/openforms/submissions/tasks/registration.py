@@ -13,7 +13,7 @@ __all__ = ["register_submission", "obtain_submission_reference"]
 logger = logging.getLogger(__name__)
 
 
-@app.task
+@app.task(ignore_result=True)
 @transaction.atomic
 def obtain_submission_reference(submission_id: int) -> str:
     """
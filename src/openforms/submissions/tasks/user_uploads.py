@@ -2,6 +2,7 @@ from datetime import timedelta
 from typing import Tuple
 
 from django.conf import settings
+from django.db import transaction
 
 from openforms.celery import app
 
@@ -33,5 +34,11 @@ def cleanup_unclaimed_temporary_files() -> None:
 
 @app.task(ignore_result=True)
 def resize_submission_attachment(attachment_id: int, size: Tuple[int, int]) -> None:
-    attachment = SubmissionFileAttachment.objects.get(id=attachment_id)
-    resize_attachment(attachment, size)
+    # The attachment is resized when the step is saved and again in the on_completion
+    # workflow, both tasks can run at the same time. The row is locked, so the second
+    # task sees the resized image and has nothing to do.
+    with transaction.atomic():
+        attachment = SubmissionFileAttachment.objects.select_for_update().get(
+            id=attachment_id
+        )
+        resize_attachment(attachment, size)
@@ -16,6 +16,7 @@ from ..constants import RegistrationStatuses
 from ..models import (
     Submission,
     SubmissionFileAttachment,
+    SubmissionProcessingState,
     SubmissionReport,
     SubmissionStep,
     TemporaryFileUpload,
@@ -131,6 +132,14 @@ class SubmissionReportFactory(factory.django.DjangoModelFactory):
         model = SubmissionReport
 
 
+class SubmissionProcessingStateFactory(factory.django.DjangoModelFactory):
+    submission = factory.SubFactory(SubmissionFactory)
+    task_name = factory.Sequence(lambda n: f"openforms.submissions.tasks.task_{n}")
+
+    class Meta:
+        model = SubmissionProcessingState
+
+
 class TemporaryFileUploadFactory(factory.django.DjangoModelFactory):
     file_name = factory.Faker("file_name")
     content_type = factory.Faker("mime_type")
@@ -0,0 +1,205 @@
+from django.test import TestCase
+
+from openforms.forms.constants import LogicActionTypes
+from openforms.forms.logic import get_form_logic
+from openforms.forms.tests.factories import FormFactory
+
+from .factories import FormLogicFactory
+
+
+class CompiledFormLogicTests(TestCase):
+    def test_rules_are_compiled(self):
+        form = FormFactory.create()
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"==": [{"var": "foo"}, "bar"]},
+            actions=[
+                {
+                    "component": "baz",
+                    "action": {
+                        "type": "value",
+                        "value": {"cat": [{"var": "foo"}, "!"]},
+                    },
+                },
+                {
+                    "component": "qux",
+                    "action": {
+                        "type": "property",
+                        "property": {"type": "bool", "value": "hidden"},
+                        "state": True,
+                    },
+                },
+            ],
+        )
+        form.refresh_from_db()
+
+        form_logic = get_form_logic(form)
+
+        self.assertEqual(len(form_logic.rules), 1)
+        rule = form_logic.rules[0]
+        self.assertTrue(rule.is_triggered({"foo": "bar"}))
+        self.assertFalse(rule.is_triggered({"foo": "other"}))
+
+        value_action, property_action = rule.actions
+        self.assertEqual(value_action.type, LogicActionTypes.value)
+        self.assertEqual(value_action.component, "baz")
+        self.assertEqual(value_action.value({"foo": "bar"}), "bar!")
+        self.assertEqual(property_action.type, LogicActionTypes.property)
+        self.assertEqual(property_action.property_name, "hidden")
+        self.assertTrue(property_action.get_state())
+
+    def test_compiled_logic_is_cached(self):
+        form = FormFactory.create()
+        FormLogicFactory.create(form=form)
+        form.refresh_from_db()
+
+        with self.assertNumQueries(1):
+            get_form_logic(form)
+
+        with self.assertNumQueries(0):
+            get_form_logic(form)
+
+    def test_logic_version_bumped_on_rule_changes(self):
+        form = FormFactory.create()
+        self.assertEqual(form.logic_version, 0)
+
+        rule = FormLogicFactory.create(form=form)
+        form.refresh_from_db()
+        self.assertEqual(form.logic_version, 1)
+        self.assertEqual(len(get_form_logic(form).rules), 1)
+
+        FormLogicFactory.create(form=form)
+        form.refresh_from_db()
+        self.assertEqual(len(get_form_logic(form).rules), 2)
+
+        rule.delete()
+        form.refresh_from_db()
+        self.assertEqual(form.logic_version, 3)
+        self.assertEqual(len(get_form_logic(form).rules), 1)
+
+    def test_stale_form_save_keeps_logic_version(self):
+        form = FormFactory.create()
+        FormLogicFactory.create(form=form)
+
+        form.name = "Renamed"
+        form.save()
+
+        form.refresh_from_db()
+        self.assertEqual(form.name, "Renamed")
+        self.assertEqual(form.logic_version, 1)
+
+    def test_moving_rule_invalidates_old_form(self):
+        form1, form2 = FormFactory.create_batch(2)
+        rule = FormLogicFactory.create(form=form1)
+        form1.refresh_from_db()
+        self.assertEqual(len(get_form_logic(form1).rules), 1)
+
+        rule.form = form2
+        rule.save()
+
+        form1.refresh_from_db()
+        form2.refresh_from_db()
+        self.assertEqual(len(get_form_logic(form1).rules), 0)
+        self.assertEqual(len(get_form_logic(form2).rules), 1)
+
+    def test_rules_filtered_by_action_type(self):
+        form = FormFactory.create()
+        FormLogicFactory.create(
+            form=form,
+            actions=[{"action": {"type": "disable-next"}}],
+        )
+        FormLogicFactory.create(
+            form=form,
+            actions=[
+                {
+                    "form_step": "http://example.com/api/v1/forms/1/steps/2",
+                    "action": {"type": "step-not-applicable"},
+                }
+            ],
+        )
+        form.refresh_from_db()
+
+        rules = get_form_logic(form).get_rules_with_action(
+            LogicActionTypes.step_not_applicable
+        )
+
+        self.assertEqual(len(rules), 1)
+        self.assertEqual(
+            rules[0].actions[0].form_step, "http://example.com/api/v1/forms/1/steps/2"
+        )
+
+
+class DependencyGraphTests(TestCase):
+    def _rule(self, form, trigger_key, component, property_name="hidden"):
+        return FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"==": [{"var": trigger_key}, "yes"]},
+            actions=[
+                {
+                    "component": component,
+                    "action": {
+                        "type": "property",
+                        "property": {"type": "bool", "value": property_name},
+                        "state": True,
+                    },
+                }
+            ],
+        )
+
+    def test_only_rules_depending_on_changed_keys_are_affected(self):
+        form = FormFactory.create()
+        self._rule(form, "a", "x")
+        self._rule(form, "b", "y")
+        form.refresh_from_db()
+        form_logic = get_form_logic(form)
+
+        affected = form_logic.get_affected_rules(["a"])
+
+        self.assertEqual(affected, (form_logic.rules[0],))
+
+    def test_rules_writing_the_same_target_are_included(self):
+        form = FormFactory.create()
+        self._rule(form, "a", "x")
+        self._rule(form, "b", "x")
+        self._rule(form, "c", "z")
+        form.refresh_from_db()
+        form_logic = get_form_logic(form)
+
+        affected = form_logic.get_affected_rules(["b"])
+
+        self.assertEqual(affected, form_logic.rules[:2])
+
+    def test_transitive_dependents_are_affected(self):
+        form = FormFactory.create()
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"!!": [{"var": "a"}]},
+            actions=[
+                {
+                    "component": "total",
+                    "action": {"type": "value", "value": {"+": [{"var": "a"}, 1]}},
+                }
+            ],
+        )
+        self._rule(form, "total", "x")
+        self._rule(form, "unrelated", "y")
+        form.refresh_from_db()
+        form_logic = get_form_logic(form)
+
+        affected = form_logic.get_affected_rules(["a"])
+
+        self.assertEqual(affected, form_logic.rules[:2])
+
+    def test_dynamic_variables_are_always_affected(self):
+        form = FormFactory.create()
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"==": [{"var": {"cat": ["fo", "o"]}}, 1]},
+        )
+        self._rule(form, "b", "y")
+        form.refresh_from_db()
+        form_logic = get_form_logic(form)
+
+        affected = form_logic.get_affected_rules(["a"])
+
+        self.assertEqual(affected, (form_logic.rules[0],))
@@ -0,0 +1,178 @@
+from django.test import TestCase
+
+from rest_framework import status
+from rest_framework.reverse import reverse
+from rest_framework.test import APITestCase
+
+from openforms.forms.logic import get_form_logic
+from openforms.forms.tests.factories import FormFactory, FormStepFactory
+
+from ...form_logic import evaluate_form_logic, evaluate_form_logic_changes
+from ..factories import SubmissionFactory, SubmissionStepFactory
+from ..mixins import SubmissionsMixin
+from .factories import FormLogicFactory
+
+
+def _hide_rule(form, trigger_key, trigger_value, component):
+    return FormLogicFactory.create(
+        form=form,
+        json_logic_trigger={"==": [{"var": trigger_key}, trigger_value]},
+        actions=[
+            {
+                "component": component,
+                "action": {
+                    "type": "property",
+                    "property": {"type": "bool", "value": "hidden"},
+                    "state": True,
+                },
+            }
+        ],
+    )
+
+
+class LogicChangesTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.form = FormFactory.create()
+        self.step = FormStepFactory.create(
+            form=self.form,
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "name"},
+                    {"type": "textfield", "key": "nickname", "hidden": False},
+                    {"type": "number", "key": "age"},
+                    {"type": "textfield", "key": "driverId", "hidden": False},
+                    {"type": "textfield", "key": "greeting"},
+                ]
+            },
+        )
+        _hide_rule(self.form, "name", "", "nickname")
+        _hide_rule(self.form, "age", 16, "driverId")
+        FormLogicFactory.create(
+            form=self.form,
+            json_logic_trigger={"!!": [{"var": "name"}]},
+            actions=[
+                {
+                    "component": "greeting",
+                    "action": {
+                        "type": "value",
+                        "value": {"cat": ["Hello ", {"var": "name"}]},
+                    },
+                }
+            ],
+        )
+        self.form.refresh_from_db()
+        self.submission = SubmissionFactory.create(form=self.form)
+
+    def test_only_affected_state_is_returned(self):
+        submission_step = SubmissionStepFactory.build(
+            submission=self.submission, form_step=self.step
+        )
+
+        changes = evaluate_form_logic_changes(
+            self.submission, submission_step, {"name": "Bob", "age": 16}, ["name"]
+        )
+
+        self.assertEqual(
+            changes.components,
+            {"nickname": {"hidden": False}, "greeting": {"value": "Hello Bob"}},
+        )
+        self.assertEqual(changes.data, {"greeting": "Hello Bob"})
+        self.assertIsNone(changes.can_submit)
+        self.assertEqual(changes.steps, {})
+
+    def test_changes_match_full_evaluation(self):
+        data = {"name": "", "age": 16}
+        submission_step = SubmissionStepFactory.build(
+            submission=self.submission, form_step=self.step, data={}
+        )
+
+        changes = evaluate_form_logic_changes(
+            self.submission, submission_step, data, ["name", "age"]
+        )
+        configuration = evaluate_form_logic(self.submission, submission_step, data)
+
+        components = {
+            component["key"]: component for component in configuration["components"]
+        }
+        for key, properties in changes.components.items():
+            for property_name, value in properties.items():
+                with self.subTest(key=key, property=property_name):
+                    self.assertEqual(components[key].get(property_name), value)
+
+    def test_no_affected_rules(self):
+        submission_step = SubmissionStepFactory.build(
+            submission=self.submission, form_step=self.step
+        )
+        get_form_logic(self.form)
+
+        with self.assertNumQueries(0):
+            changes = evaluate_form_logic_changes(
+                self.submission, submission_step, {"unknown": 1}, ["unknown"]
+            )
+
+        self.assertEqual(changes.components, {})
+        self.assertEqual(changes.data, {})
+
+
+class CheckLogicChangesEndpointTests(SubmissionsMixin, APITestCase):
+    def test_disable_next_and_step_applicability(self):
+        form = FormFactory.create()
+        step1 = FormStepFactory.create(
+            form=form,
+            form_definition__configuration={
+                "components": [{"type": "number", "key": "age"}]
+            },
+        )
+        step2 = FormStepFactory.create(form=form)
+        form_step2_path = reverse(
+            "api:form-steps-detail",
+            kwargs={"form_uuid_or_slug": form.uuid, "uuid": step2.uuid},
+        )
+        FormLogicFactory.create(
+            form=form,
+            json_logic_trigger={"<": [{"var": "age"}, 18]},
+            actions=[
+                {"action": {"type": "disable-next"}},
+                {
+                    "form_step": f"http://example.com{form_step2_path}",
+                    "action": {"type": "step-not-applicable"},
+                },
+            ],
+        )
+        submission = SubmissionFactory.create(form=form)
+        self._add_submission_to_session(submission)
+        endpoint = reverse(
+            "api:submission-steps-logic-check-changes",
+            kwargs={"submission_uuid": submission.uuid, "step_uuid": step1.uuid},
+        )
+
+        response = self.client.post(
+            endpoint, {"data": {"age": 16}, "changedKeys": ["age"]}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.json(),
+            {
+                "components": {},
+                "data": {},
+                "canSubmit": False,
+                "steps": {str(step2.uuid): False},
+            },
+        )
+
+    def test_changed_keys_required(self):
+        form = FormFactory.create()
+        step = FormStepFactory.create(form=form)
+        submission = SubmissionFactory.create(form=form)
+        self._add_submission_to_session(submission)
+        endpoint = reverse(
+            "api:submission-steps-logic-check-changes",
+            kwargs={"submission_uuid": submission.uuid, "step_uuid": step.uuid},
+        )
+
+        response = self.client.post(endpoint, {"data": {}})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
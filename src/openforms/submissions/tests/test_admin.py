@@ -1,8 +1,11 @@
+import json
 from unittest.mock import patch
 
+from django.test import override_settings
 from django.urls import reverse
 from django.utils import timezone
 
+from django_capture_on_commit_callbacks import capture_on_commit_callbacks
 from django_webtest import WebTest
 
 from openforms.accounts.tests.factories import UserFactory
@@ -10,7 +13,7 @@ from openforms.forms.tests.factories import FormDefinitionFactory, FormStepFacto
 from openforms.logging.models import TimelineLogProxy
 
 from ..constants import RegistrationStatuses
-from ..models import Submission
+from ..models import Submission, SubmissionExport
 from .factories import SubmissionFactory, SubmissionStepFactory
 
 
@@ -30,7 +33,7 @@ class TestSubmissionAdmin(WebTest):
         )
         step = FormStepFactory.create(form_definition=form_definition)
         cls.submission_1 = SubmissionFactory.create(form=step.form)
-        submission_2 = SubmissionFactory.create(
+        cls.submission_2 = submission_2 = SubmissionFactory.create(
             form=step.form, completed_on=timezone.now()
         )
         cls.submission_step_1 = SubmissionStepFactory.create(
@@ -105,9 +108,8 @@ class TestSubmissionAdmin(WebTest):
 
         form = response.forms["changelist-form"]
         form["action"] = "export_csv"
-        form["_selected_action"] = [
-            str(submission.pk) for submission in Submission.objects.all()
-        ]
+        # only the completed submissions are listed by default
+        form["_selected_action"] = [str(self.submission_2.pk)]
 
         response = form.submit()
 
@@ -117,7 +119,11 @@ class TestSubmissionAdmin(WebTest):
             response["content-disposition"],
             'attachment; filename="submissions_export.csv"',
         )
-        self.assertIsNotNone(response.content)
+        self.assertEqual(
+            response.text.splitlines()[0],
+            "Formuliernaam,Inzendingdatum,voornaam,familienaam,geboortedatum",
+        )
+        self.assertEqual(len(response.text.splitlines()), 2)
         self.assertEqual(
             TimelineLogProxy.objects.filter(
                 template="logging/events/submission_export_list.txt"
@@ -132,22 +138,20 @@ class TestSubmissionAdmin(WebTest):
 
         form = response.forms["changelist-form"]
         form["action"] = "export_xlsx"
-        form["_selected_action"] = [
-            str(submission.pk) for submission in Submission.objects.all()
-        ]
+        form["_selected_action"] = [str(self.submission_2.pk)]
 
-        response = form.submit()
+        with patch(
+            "openforms.submissions.admin.export_submissions_job.delay"
+        ) as mock_delay:
+            with capture_on_commit_callbacks(execute=True):
+                response = form.submit()
 
-        self.assertEqual(response.status_code, 200)
-        self.assertEqual(
-            response["content-type"],
-            "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        )
-        self.assertEqual(
-            response["content-disposition"],
-            'attachment; filename="submissions_export.xlsx"',
-        )
-        self.assertIsNotNone(response.content)
+        self.assertEqual(response.status_code, 302)
+        export = SubmissionExport.objects.get()
+        self.assertEqual(export.file_type, "xlsx")
+        self.assertEqual(export.user, self.user)
+        self.assertEqual(export.submission_ids, [self.submission_2.pk])
+        mock_delay.assert_called_once_with(export.pk)
         self.assertEqual(
             TimelineLogProxy.objects.filter(
                 template="logging/events/submission_export_list.txt"
@@ -155,6 +159,45 @@ class TestSubmissionAdmin(WebTest):
             1,
         )
 
+    def test_export_ndjson_successfully_exports_ndjson_file(self):
+        response = self.app.get(
+            reverse("admin:submissions_submission_changelist"), user=self.user
+        )
+
+        form = response.forms["changelist-form"]
+        form["action"] = "export_ndjson"
+        form["_selected_action"] = [str(self.submission_2.pk)]
+
+        response = form.submit()
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["content-type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["voornaam"], "shea")
+        self.assertEqual(rows[0]["geboortedatum"], "01-01-1991")
+
+    @override_settings(SUBMISSION_EXPORT_BACKGROUND_THRESHOLD=0)
+    def test_export_large_selection_in_background(self):
+        response = self.app.get(
+            reverse("admin:submissions_submission_changelist"), user=self.user
+        )
+
+        form = response.forms["changelist-form"]
+        form["action"] = "export_csv"
+        form["_selected_action"] = [str(self.submission_2.pk)]
+
+        with patch(
+            "openforms.submissions.admin.export_submissions_job.delay"
+        ) as mock_delay:
+            with capture_on_commit_callbacks(execute=True):
+                response = form.submit()
+
+        self.assertEqual(response.status_code, 302)
+        export = SubmissionExport.objects.get()
+        self.assertEqual(export.file_type, "csv")
+        mock_delay.assert_called_once_with(export.pk)
+
     def test_exporting_multiple_forms_fails(self):
         step = FormStepFactory.create()
         SubmissionFactory.create(form=step.form, completed_on=timezone.now())
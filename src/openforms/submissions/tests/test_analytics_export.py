@@ -0,0 +1,361 @@
+import io
+import os
+import tempfile
+import zipfile
+from datetime import date, datetime, timedelta
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from django_capture_on_commit_callbacks import capture_on_commit_callbacks
+from freezegun import freeze_time
+from privates.test import temp_private_root
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from openforms.accounts.tests.factories import StaffUserFactory, UserFactory
+from openforms.forms.tests.factories import FormStepFactory
+from openforms.payments.constants import PaymentStatus
+from openforms.payments.tests.factories import SubmissionPaymentFactory
+
+from ..analytics import (
+    export_form_submissions,
+    get_arrow_type,
+    get_columns,
+    read_watermark,
+)
+from ..constants import RegistrationStatuses, SubmissionExportStatuses
+from ..models import SubmissionExport
+from ..tasks import export_submissions_analytics_job
+from .factories import SubmissionStepFactory
+
+CONFIGURATION = {
+    "components": [
+        {"key": "name", "type": "textfield"},
+        {"key": "age", "type": "number"},
+        {"key": "agree", "type": "checkbox"},
+        {"key": "birthDate", "type": "date"},
+        {"key": "extras", "type": "selectboxes"},
+        {
+            "key": "fieldset",
+            "type": "fieldset",
+            "components": [{"key": "remarks", "type": "textarea"}],
+        },
+        {"key": "intro", "type": "content", "input": False},
+    ]
+}
+
+
+class AnalyticsExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.step = FormStepFactory.create(form_definition__configuration=CONFIGURATION)
+        cls.form = cls.step.form
+
+    def _create_submission(self, completed_on: datetime, data: dict):
+        return SubmissionStepFactory.create(
+            submission__form=self.form,
+            submission__completed_on=completed_on,
+            submission__created_on=completed_on,
+            submission__registration_status=RegistrationStatuses.success,
+            form_step=self.step,
+            data=data,
+        ).submission
+
+    def test_columns_are_typed_after_the_components(self):
+        columns = {
+            column.name: get_arrow_type(column.type)
+            for column in get_columns(self.form)
+        }
+
+        self.assertEqual(
+            list(columns),
+            [
+                "submission_uuid",
+                "created_on",
+                "completed_on",
+                "registration_status",
+                "payment_status",
+                "name",
+                "age",
+                "agree",
+                "birthDate",
+                "extras",
+                "remarks",
+            ],
+        )
+        self.assertEqual(columns["name"], pa.string())
+        self.assertEqual(columns["age"], pa.float64())
+        self.assertEqual(columns["agree"], pa.bool_())
+        self.assertEqual(columns["birthDate"], pa.date32())
+        self.assertEqual(columns["extras"], pa.map_(pa.string(), pa.bool_()))
+
+    def test_export_partitioned_by_month(self):
+        submission = self._create_submission(
+            datetime(2021, 9, 30, 12, tzinfo=timezone.utc),
+            {
+                "name": "Jane",
+                "age": 42,
+                "agree": True,
+                "birthDate": "1979-05-01",
+                "extras": {"a": True, "b": False},
+                "remarks": "",
+            },
+        )
+        SubmissionPaymentFactory.create(
+            submission=submission, status=PaymentStatus.completed
+        )
+        self._create_submission(
+            datetime(2021, 10, 1, 12, tzinfo=timezone.utc), {"name": "John"}
+        )
+        # not completed
+        SubmissionStepFactory.create(submission__form=self.form, form_step=self.step)
+
+        until = datetime(2021, 10, 2, tzinfo=timezone.utc)
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            result = export_form_submissions(self.form, output_dir, until=until)
+
+            self.assertEqual(result.num_rows, 2)
+            self.assertEqual(result.watermark, until)
+            self.assertEqual(
+                [
+                    os.path.relpath(path, output_dir).split(os.sep)[:2]
+                    for path in result.files
+                ],
+                [
+                    [f"form={self.form.uuid}", "month=2021-09"],
+                    [f"form={self.form.uuid}", "month=2021-10"],
+                ],
+            )
+
+            september = pq.read_table(result.files[0]).to_pydict()
+            october = pq.read_table(result.files[1]).to_pydict()
+
+        self.assertEqual(september["submission_uuid"], [str(submission.uuid)])
+        self.assertEqual(
+            september["registration_status"], [RegistrationStatuses.success]
+        )
+        self.assertEqual(september["payment_status"], [PaymentStatus.completed])
+        self.assertEqual(september["age"], [42.0])
+        self.assertEqual(september["agree"], [True])
+        self.assertEqual(september["birthDate"], [date(1979, 5, 1)])
+        self.assertEqual(september["extras"], [[("a", True), ("b", False)]])
+        self.assertEqual(october["name"], ["John"])
+        self.assertEqual(october["age"], [None])
+        self.assertEqual(october["payment_status"], [None])
+
+    def test_incremental_export(self):
+        self._create_submission(
+            datetime(2021, 10, 1, 12, tzinfo=timezone.utc), {"name": "Jane"}
+        )
+        self._create_submission(
+            datetime(2021, 10, 2, 12, tzinfo=timezone.utc), {"name": "John"}
+        )
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            result = export_form_submissions(
+                self.form,
+                output_dir,
+                file_format="arrow",
+                since=datetime(2021, 10, 1, 12, tzinfo=timezone.utc),
+            )
+
+            self.assertEqual(result.num_rows, 1)
+            with pa.OSFile(result.files[0], "rb") as source:
+                table = pa.ipc.open_file(source).read_all()
+
+        self.assertEqual(table.column("name").to_pylist(), ["John"])
+
+    @freeze_time("2021-10-02T12:00:00Z")
+    def test_recently_completed_submissions_are_exported_next_time(self):
+        # completed just before the export, possibly not committed yet
+        self._create_submission(
+            datetime(2021, 10, 2, 11, 58, tzinfo=timezone.utc), {"name": "Jane"}
+        )
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            result = export_form_submissions(self.form, output_dir)
+
+            self.assertEqual(result.num_rows, 0)
+            self.assertEqual(
+                result.watermark, datetime(2021, 10, 2, 11, 55, tzinfo=timezone.utc)
+            )
+
+            with freeze_time("2021-10-02T13:00:00Z"):
+                next_result = export_form_submissions(
+                    self.form, output_dir, since=result.watermark
+                )
+
+            self.assertEqual(next_result.num_rows, 1)
+
+    def test_nothing_to_export(self):
+        until = datetime(2021, 10, 2, tzinfo=timezone.utc)
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            result = export_form_submissions(self.form, output_dir, until=until)
+
+        self.assertEqual(result.files, [])
+        self.assertEqual(result.num_rows, 0)
+        self.assertEqual(result.watermark, until)
+
+    @freeze_time("2021-10-03T12:00:00Z")
+    def test_command_exports_every_form_from_its_own_watermark(self):
+        other_step = FormStepFactory.create(
+            form_definition__configuration=CONFIGURATION
+        )
+        self._create_submission(
+            datetime(2021, 10, 1, 12, tzinfo=timezone.utc), {"name": "Jane"}
+        )
+
+        with tempfile.TemporaryDirectory() as output_dir:
+            call_command(
+                "export_submissions_analytics",
+                str(self.form.uuid),
+                output_dir=output_dir,
+                stdout=io.StringIO(),
+            )
+            self.assertEqual(
+                read_watermark(output_dir, self.form),
+                datetime(2021, 10, 3, 11, 55, tzinfo=timezone.utc),
+            )
+
+            # completed before the watermark of the first form
+            SubmissionStepFactory.create(
+                submission__form=other_step.form,
+                submission__completed_on=datetime(2021, 10, 2, 12, tzinfo=timezone.utc),
+                form_step=other_step,
+                data={"name": "John"},
+            )
+            with freeze_time(timezone.now() + timedelta(hours=1)):
+                call_command(
+                    "export_submissions_analytics",
+                    output_dir=output_dir,
+                    stdout=io.StringIO(),
+                )
+
+            self.assertEqual(
+                len(os.listdir(os.path.join(output_dir, f"form={self.form.uuid}"))),
+                2,  # the month partition and the watermark
+            )
+            other_files = os.listdir(
+                os.path.join(
+                    output_dir, f"form={other_step.form.uuid}", "month=2021-10"
+                )
+            )
+
+        self.assertEqual(len(other_files), 1)
+
+
+@temp_private_root()
+class AnalyticsExportAPITests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.step = FormStepFactory.create(form_definition__configuration=CONFIGURATION)
+        cls.submission_step = SubmissionStepFactory.create(
+            submission__form=cls.step.form,
+            submission__completed_on=datetime(2021, 10, 1, 12, tzinfo=timezone.utc),
+            form_step=cls.step,
+            data={"name": "Jane"},
+        )
+        cls.url = reverse("api:submissions:analytics-export")
+
+    def test_staff_only(self):
+        self.client.force_authenticate(user=UserFactory.create())
+
+        response = self.client.post(self.url, {"form": self.step.form.uuid})
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @freeze_time("2021-10-02T12:00:00Z")
+    def test_export(self):
+        user = StaffUserFactory.create()
+        self.client.force_authenticate(user=user)
+
+        with patch(
+            "openforms.submissions.api.views.export_submissions_analytics_job.delay"
+        ) as mock_delay:
+            with capture_on_commit_callbacks(execute=True):
+                response = self.client.post(
+                    self.url, {"form": self.step.form.uuid, "file_format": "parquet"}
+                )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        export = SubmissionExport.objects.get()
+        mock_delay.assert_called_once_with(export.pk)
+        self.assertEqual(export.user, user)
+        self.assertEqual(export.file_type, "parquet")
+        self.assertEqual(export.submission_ids, [self.submission_step.submission.pk])
+        self.assertIsNone(export.since)
+        self.assertEqual(
+            export.watermark, datetime(2021, 10, 2, 11, 55, tzinfo=timezone.utc)
+        )
+        detail_url = reverse(
+            "api:submissions:analytics-export-detail", kwargs={"pk": export.pk}
+        )
+        self.assertEqual(response.json()["url"], f"http://testserver{detail_url}")
+        self.assertEqual(response.json()["status"], SubmissionExportStatuses.pending)
+        self.assertEqual(response.json()["downloadUrl"], "")
+
+        export_submissions_analytics_job(export.pk)
+
+        response = self.client.get(detail_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["status"], SubmissionExportStatuses.success)
+        self.assertEqual(response.json()["progress"], 100)
+        self.assertEqual(response.json()["watermark"], "2021-10-02T13:55:00+02:00")
+
+        response = self.client.get(response.json()["downloadUrl"])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/zip")
+        self.assertEqual(response["X-Export-Watermark"], "2021-10-02T11:55:00+00:00")
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content)))
+        (name,) = archive.namelist()
+        self.assertTrue(name.startswith(f"form={self.step.form.uuid}/month=2021-10/"))
+        table = pq.read_table(io.BytesIO(archive.read(name)))
+        self.assertEqual(table.column("name").to_pylist(), ["Jane"])
+
+    def test_export_since(self):
+        self.client.force_authenticate(user=StaffUserFactory.create())
+
+        with patch(
+            "openforms.submissions.api.views.export_submissions_analytics_job.delay"
+        ):
+            response = self.client.post(
+                self.url,
+                {"form": self.step.form.uuid, "since": "2021-10-01T12:00:00Z"},
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        export = SubmissionExport.objects.get()
+        self.assertEqual(export.submission_ids, [])
+        self.assertEqual(export.file_type, "parquet")
+
+    def test_download_unfinished_export(self):
+        self.client.force_authenticate(user=StaffUserFactory.create())
+        export = SubmissionExport.objects.create(
+            form=self.step.form, file_type="parquet"
+        )
+        url = reverse(
+            "api:submissions:analytics-export-download", kwargs={"pk": export.pk}
+        )
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_invalid_parameters(self):
+        self.client.force_authenticate(user=StaffUserFactory.create())
+
+        response = self.client.post(
+            self.url, {"form": self.step.form.uuid, "file_format": "xml"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
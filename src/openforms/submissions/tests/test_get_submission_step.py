@@ -9,6 +9,7 @@ The tests in this module validate that we can retrieve the submission-context
 aware step definition.
 """
 import uuid
+from unittest.mock import patch
 
 from rest_framework import status
 from rest_framework.reverse import reverse
@@ -19,6 +20,7 @@ from openforms.forms.tests.factories import FormStepFactory
 
 from ..models import Submission
 from .factories import SubmissionFactory, SubmissionStepFactory
+from .form_logic.factories import FormLogicFactory
 from .mixins import SubmissionsMixin
 
 
@@ -96,6 +98,61 @@ class ReadSubmissionStepTests(SubmissionsMixin, APITestCase):
         }
         self.assertEqual(response.json(), expected)
 
+    def test_static_form_definition_is_served_pre_rendered(self):
+        self._add_submission_to_session(self.submission)
+        response = self.client.get(self.step_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        with patch(
+            "openforms.forms.api.serializers.handle_custom_types"
+        ) as mock_handle_custom_types:
+            cached_response = self.client.get(self.step_url)
+
+        mock_handle_custom_types.assert_not_called()
+        self.assertEqual(cached_response.status_code, status.HTTP_200_OK)
+        self.assertEqual(cached_response.json(), response.json())
+
+    def test_configuration_modified_by_logic_is_not_shared(self):
+        step = FormStepFactory.create(
+            form_definition__configuration={
+                "components": [
+                    {"key": "name", "type": "textfield"},
+                    {"key": "greeting", "type": "textfield"},
+                ]
+            }
+        )
+        FormLogicFactory.create(
+            form=step.form,
+            json_logic_trigger={"!!": [{"var": "name"}]},
+            actions=[
+                {
+                    "component": "greeting",
+                    "action": {
+                        "type": "value",
+                        "value": {"cat": ["Hello ", {"var": "name"}]},
+                    },
+                }
+            ],
+        )
+
+        for name in ("Alice", "Bob"):
+            with self.subTest(name=name):
+                submission = SubmissionFactory.create(form=step.form)
+                SubmissionStepFactory.create(
+                    submission=submission, form_step=step, data={"name": name}
+                )
+                self._add_submission_to_session(submission)
+                step_url = reverse(
+                    "api:submission-steps-detail",
+                    kwargs={"submission_uuid": submission.uuid, "step_uuid": step.uuid},
+                )
+
+                response = self.client.get(step_url)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                components = response.json()["formStep"]["configuration"]["components"]
+                self.assertEqual(components[1]["value"], f"Hello {name}")
+
     def test_dynamic_form_definition(self):
         @register("textfield")
         def custom_handler(component: dict, request, submission):
@@ -8,6 +8,7 @@ from openforms.forms.tests.factories import (
     FormStepFactory,
 )
 
+from ..models import Submission
 from .factories import SubmissionFactory, SubmissionStepFactory
 
 
@@ -33,6 +34,65 @@ class TestSubmission(TestCase):
             {"key1": "value1", "key2": "value-a", "key3": "value-b"},
         )
 
+    def test_merged_data_is_materialized(self):
+        submission = SubmissionFactory.create()
+        step = SubmissionStepFactory.create(
+            submission=submission,
+            data={"key1": "value1"},
+            form_step=FormStepFactory.create(),
+        )
+        SubmissionStepFactory.create(
+            submission=submission,
+            data={"key2": "value2"},
+            form_step=FormStepFactory.create(),
+        )
+        submission.refresh_from_db()
+
+        with self.assertNumQueries(0):
+            merged_data = submission.get_merged_data()
+
+        self.assertEqual(merged_data, {"key1": "value1", "key2": "value2"})
+
+        with self.subTest("step data modified"):
+            step.data = {"key1": "other"}
+            step.save()
+            submission.refresh_from_db()
+
+            self.assertEqual(submission.data, {"key1": "other", "key2": "value2"})
+
+        with self.subTest("step deleted"):
+            step.delete()
+            submission.refresh_from_db()
+
+            self.assertEqual(submission.data, {"key2": "value2"})
+
+    def test_in_memory_merged_data_updated_on_step_save(self):
+        submission = SubmissionFactory.create()
+        self.assertEqual(submission.data, {})
+
+        SubmissionStepFactory.create(
+            submission=submission,
+            data={"key1": "value1"},
+            form_step=FormStepFactory.create(),
+        )
+
+        self.assertEqual(submission.data, {"key1": "value1"})
+
+    def test_submission_save_does_not_overwrite_merged_data(self):
+        submission = SubmissionFactory.create()
+        step = SubmissionStepFactory.create(
+            submission=submission, form_step=FormStepFactory.create()
+        )
+        stale_submission = Submission.objects.get(pk=submission.pk)
+        stale_submission.data  # materialize the current (empty) data
+
+        step.data = {"key1": "value1"}
+        step.save()
+        stale_submission.save()
+
+        submission.refresh_from_db()
+        self.assertEqual(submission.data, {"key1": "value1"})
+
     def test_get_ordered_data_with_component_type(self):
         form_definition = FormDefinitionFactory.create(
             configuration={
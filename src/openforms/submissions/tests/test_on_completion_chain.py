@@ -1,14 +1,27 @@
-import uuid
+import os
 
 from django.core import mail
-from django.test import TestCase, override_settings
+from django.core.files import File
+from django.test import RequestFactory, TestCase, override_settings
 
+from PIL import Image
 from privates.test import temp_private_root
+from rest_framework.exceptions import ValidationError
+from rest_framework.request import Request
 
 from openforms.emails.tests.factories import ConfirmationEmailTemplateFactory
 
+from ..constants import ProcessingResults, ProcessingStatuses, ProcessingTaskStates
 from ..models import SubmissionReport, TemporaryFileUpload
-from ..tasks import on_completion
+from ..status import SubmissionProcessingStatus
+from ..tasks import (
+    ON_COMPLETION_TASKS,
+    finalize_completion,
+    maybe_delete_submission_report,
+    on_completion,
+    register_submission,
+    resize_submission_attachment,
+)
 from .factories import SubmissionFactory, SubmissionFileAttachmentFactory
 
 
@@ -40,16 +53,21 @@ class OnCompletionTests(TestCase):
         on_completion(submission.id)
 
         submission.refresh_from_db()
-        for task_id in submission.on_completion_task_ids:
-            with self.subTest(task_id=task_id):
-                try:
-                    uuid.UUID(task_id)
-                except ValueError:
-                    self.fail("Invalid task ID returned")
-
+        processing_states = submission.processing_states.order_by("pk")
         self.assertEqual(
-            len(submission.on_completion_task_ids), 6
-        )  # 6 tasks in the chain
+            [state.task_name for state in processing_states], list(ON_COMPLETION_TASKS)
+        )
+        for processing_state in processing_states:
+            with self.subTest(task_name=processing_state.task_name):
+                # the error callback is not called
+                expected_state = (
+                    ProcessingTaskStates.pending
+                    if processing_state.task_name == maybe_delete_submission_report.name
+                    else ProcessingTaskStates.success
+                )
+                self.assertEqual(processing_state.state, expected_state)
+                self.assertNotEqual(processing_state.task_id, "")
+
         # registration result reference
         self.assertTrue(submission.public_registration_reference.startswith("OF-"))
         self.assertTrue(SubmissionReport.objects.filter(submission=submission).exists())
@@ -57,3 +75,73 @@ class OnCompletionTests(TestCase):
         self.assertEqual(
             len(mail.outbox), 2
         )  # registration backend + confirmation email
+
+    def test_images_resized_before_registration(self):
+        submission = SubmissionFactory.from_components(
+            completed=True,
+            form__registration_backend="email",
+            form__registration_backend_options={
+                "to_emails": ["test@register.nl"],
+            },
+            components_list=[
+                {
+                    "key": "image",
+                    "type": "file",
+                    "image": {"resize": {"apply": True, "width": 100, "height": 100}},
+                },
+            ],
+        )
+        image_path = os.path.join(
+            os.path.dirname(__file__), "files", "image-256x256.png"
+        )
+        with open(image_path, "rb") as image_file:
+            attachment = SubmissionFileAttachmentFactory.create(
+                submission_step=submission.submissionstep_set.first(),
+                form_key="image",
+                content=File(image_file, name="image.png"),
+                content_type="image/png",
+            )
+
+        on_completion(submission.id)
+
+        attachment.refresh_from_db()
+        image = Image.open(attachment.content, formats=("png",))
+        self.assertEqual((image.width, image.height), (100, 100))
+        resize_state = submission.processing_states.get(
+            task_name=resize_submission_attachment.name
+        )
+        self.assertEqual(resize_state.state, ProcessingTaskStates.success)
+        self.assertEqual(
+            SubmissionProcessingStatus(
+                request=Request(RequestFactory().get("/irrelevant")),
+                submission=submission,
+            ).result,
+            ProcessingResults.success,
+        )
+
+    def test_error_callback_called_on_failure(self):
+        submission = SubmissionFactory.create(
+            completed=True,
+            form__registration_backend="email",
+            # invalid options, the registration fails
+            form__registration_backend_options={},
+        )
+
+        # eager tasks: the rest of the chain raises the error of the failed task
+        with self.assertRaises(ValidationError):
+            on_completion(submission.id)
+
+        states = dict(submission.processing_states.values_list("task_name", "state"))
+        self.assertEqual(states[register_submission.name], ProcessingTaskStates.failed)
+        self.assertEqual(states[finalize_completion.name], ProcessingTaskStates.pending)
+        self.assertEqual(
+            states[maybe_delete_submission_report.name], ProcessingTaskStates.success
+        )
+        # no appointment failed, the report is kept
+        self.assertTrue(SubmissionReport.objects.filter(submission=submission).exists())
+        processing_status = SubmissionProcessingStatus(
+            request=Request(RequestFactory().get("/irrelevant")),
+            submission=submission,
+        )
+        self.assertEqual(processing_status.status, ProcessingStatuses.done)
+        self.assertEqual(processing_status.result, ProcessingResults.failed)
@@ -10,6 +10,9 @@ Functional requirements are:
 * data of different submissions should not affect each other
 * "login" makes no sense, as we are usually dealing with anonymous users
 """
+from unittest.mock import patch
+
+from django_capture_on_commit_callbacks import capture_on_commit_callbacks
 from rest_framework import status
 from rest_framework.reverse import reverse, reverse_lazy
 from rest_framework.test import APITestCase
@@ -105,6 +108,22 @@ class SubmissionStartTests(APITestCase):
         submission = Submission.objects.get()
         self.assertEqual(submission.bsn, "123456782")
 
+    @patch("openforms.submissions.api.viewsets.warm_up_prefill.delay")
+    def test_start_submission_bsn_in_session_warms_up_prefill(self, mock_warm_up):
+        session = self.client.session
+        session[AuthAttribute.bsn] = "123456782"
+        session.save()
+
+        body = {
+            "form": f"http://testserver{self.form_url}",
+        }
+
+        with capture_on_commit_callbacks(execute=True):
+            response = self.client.post(self.endpoint, body)
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        mock_warm_up.assert_called_once_with(Submission.objects.get().id)
+
     def test_start_submission_in_maintenance_mode(self):
         form = FormFactory.create(maintenance_mode=True)
         step = FormStepFactory.create(form=form)
@@ -5,6 +5,7 @@ from django.core.files import File
 from django.test import TestCase, override_settings
 from django.urls import reverse
 
+from django_capture_on_commit_callbacks import capture_on_commit_callbacks
 from PIL import Image, UnidentifiedImageError
 from privates.test import temp_private_root
 
@@ -19,6 +20,7 @@ from openforms.submissions.attachments import (
     resolve_uploads_from_data,
 )
 from openforms.submissions.models import SubmissionFileAttachment
+from openforms.submissions.tasks import resize_submission_attachment
 from openforms.submissions.tests.factories import (
     SubmissionFileAttachmentFactory,
     SubmissionStepFactory,
@@ -343,6 +345,30 @@ class SubmissionAttachmentTest(TestCase):
         res = resize_attachment(attachment_bad, (1024, 1024))
         self.assertEqual(res, False)
 
+    def test_resize_submission_attachment_task(self):
+        with open(self.test_image_path, "rb") as f:
+            attachment = SubmissionFileAttachmentFactory.create(
+                content__name="my-image.png", content__data=f.read()
+            )
+        original_name = attachment.content.name
+
+        with capture_on_commit_callbacks(execute=True):
+            resize_submission_attachment(attachment.id, (200, 200))
+
+        attachment.refresh_from_db()
+        resized_name = attachment.content.name
+        self.assertImageSize(attachment.content, 200, 200, "png")
+        self.assertFalse(attachment.content.storage.exists(original_name))
+
+        # the other resize task (step save or on_completion workflow) runs after the
+        # lock is released, the image was resized already
+        with capture_on_commit_callbacks(execute=True):
+            resize_submission_attachment(attachment.id, (200, 200))
+
+        attachment.refresh_from_db()
+        self.assertEqual(attachment.content.name, resized_name)
+        self.assertTrue(attachment.content.storage.exists(resized_name))
+
     def test_append_file_num_postfix_helper(self):
         actual = append_file_num_postfix("orginal.txt", "new.bin", 1, 1)
         self.assertEqual("new.txt", actual)
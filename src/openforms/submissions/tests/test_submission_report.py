@@ -97,21 +97,6 @@ class DownloadSubmissionReportTests(APITestCase):
         # report.content.name contains the path too
         self.assertTrue(report.content.name.endswith("Test_Form.pdf"))
 
-    @patch(
-        "celery.result.AsyncResult._get_task_meta", return_value={"status": "SUCCESS"}
-    )
-    def test_check_report_status(self, mock_result):
-        submission = SubmissionFactory.create(completed=True)
-        submission_report = SubmissionReportFactory.create(submission=submission)
-
-        with self.subTest("without celery task ID stored"):
-            self.assertIsNone(submission_report.get_celery_task())
-
-        submission_report.task_id = "some-id"
-        with self.subTest("with celery task ID stored"):
-            task_result = submission_report.get_celery_task()
-            self.assertEqual(task_result.status, "SUCCESS")
-
     @patch("celery.app.task.Task.request")
     def test_celery_task_id_stored(self, mock_request):
         # monkeypatch the celery task ID onto the request
@@ -2,29 +2,49 @@ from datetime import timedelta
 from decimal import Decimal
 from unittest.mock import patch
 
-from django.test import TestCase
+from django.core.cache import caches
+from django.test import RequestFactory, TestCase, override_settings
 from django.utils import timezone
 
-from celery import states
+from celery.signals import task_failure, task_prerun, task_success
 from freezegun import freeze_time
 from privates.test import temp_private_root
 from rest_framework import status
+from rest_framework.request import Request
 from rest_framework.reverse import reverse
 from rest_framework.test import APITestCase
 
 from openforms.appointments.tests.factories import AppointmentInfoFactory
 from openforms.payments.contrib.ogone.tests.factories import OgoneMerchantFactory
 
-from ..constants import SUBMISSIONS_SESSION_KEY, ProcessingResults, ProcessingStatuses
-from ..tasks import cleanup_on_completion_results
+from ..constants import (
+    SUBMISSIONS_SESSION_KEY,
+    ProcessingResults,
+    ProcessingStatuses,
+    ProcessingTaskStates,
+)
+from ..status import (
+    WAITER_SLOT_KEY_PREFIX,
+    WAITER_SLOTS_CACHE_ALIAS,
+    SubmissionProcessingStatus,
+)
+from ..tasks import (
+    finalize_completion,
+    maybe_delete_submission_report,
+    register_submission,
+    resize_submission_attachment,
+)
 from ..tokens import submission_status_token_generator
-from .factories import SubmissionFactory, SubmissionReportFactory
+from .factories import (
+    SubmissionFactory,
+    SubmissionProcessingStateFactory,
+    SubmissionReportFactory,
+)
 
 
 class SubmissionStatusPermissionTests(APITestCase):
     def test_valid_token(self):
-        # Use empty task ID to not need a real broker
-        submission = SubmissionFactory.create(completed=True, on_completion_task_ids=[])
+        submission = SubmissionFactory.create(completed=True)
         token = submission_status_token_generator.make_token(submission)
         check_status_url = reverse(
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
@@ -36,8 +56,7 @@ class SubmissionStatusPermissionTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_expired_token(self):
-        # Use empty task ID to not need a real broker
-        submission = SubmissionFactory.create(completed=True, on_completion_task_ids=[])
+        submission = SubmissionFactory.create(completed=True)
         token = submission_status_token_generator.make_token(submission)
         check_status_url = reverse(
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
@@ -49,7 +68,7 @@ class SubmissionStatusPermissionTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_token_invalidated_by_new_completion(self):
-        submission = SubmissionFactory.create(completed=True, on_completion_task_ids=[])
+        submission = SubmissionFactory.create(completed=True)
         old_token = submission_status_token_generator.make_token(submission)
         submission.completed_on = timezone.now()
         submission.save()
@@ -63,7 +82,7 @@ class SubmissionStatusPermissionTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_wrongly_formatted_token(self):
-        submission = SubmissionFactory.create(completed=True, on_completion_task_ids=[])
+        submission = SubmissionFactory.create(completed=True)
         # can't reverse because bad format lol
         check_status_url = f"/api/v1/submissions/{submission.uuid}/badformat/status"
 
@@ -72,7 +91,7 @@ class SubmissionStatusPermissionTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_invalid_token_timestamp(self):
-        submission = SubmissionFactory.create(completed=True, on_completion_task_ids=[])
+        submission = SubmissionFactory.create(completed=True)
         # can't reverse because bad format lol
         check_status_url = f"/api/v1/submissions/{submission.uuid}/$$$-{'a'*20}/status"
 
@@ -82,8 +101,8 @@ class SubmissionStatusPermissionTests(APITestCase):
 
 
 class SubmissionStatusStatusAndResultTests(APITestCase):
-    def test_no_task_id_registered(self):
-        submission = SubmissionFactory.create(completed=True, on_completion_task_ids=[])
+    def test_no_processing_state_registered(self):
+        submission = SubmissionFactory.create(completed=True)
         token = submission_status_token_generator.make_token(submission)
         check_status_url = reverse(
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
@@ -98,9 +117,13 @@ class SubmissionStatusStatusAndResultTests(APITestCase):
         self.assertEqual(response_data["reportDownloadUrl"], "")
         self.assertEqual(response_data["confirmationPageContent"], "")
 
-    def test_in_progress_celery_states(self):
-        submission = SubmissionFactory.create(
-            completed=True, on_completion_task_ids=["some-id"]
+    def test_in_progress_states(self):
+        submission = SubmissionFactory.create(completed=True)
+        SubmissionProcessingStateFactory.create(
+            submission=submission, state=ProcessingTaskStates.success
+        )
+        processing_state = SubmissionProcessingStateFactory.create(
+            submission=submission
         )
         token = submission_status_token_generator.make_token(submission)
         check_status_url = reverse(
@@ -108,104 +131,162 @@ class SubmissionStatusStatusAndResultTests(APITestCase):
         )
 
         in_progress_states = [
-            states.PENDING,
-            states.RECEIVED,
-            states.STARTED,
-            states.RETRY,
+            ProcessingTaskStates.pending,
+            ProcessingTaskStates.started,
         ]
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
-            for state in in_progress_states:
-                with self.subTest(celery_state=state):
-                    mock_AsyncResult.return_value.state = state
+        for state in in_progress_states:
+            with self.subTest(state=state):
+                processing_state.state = state
+                processing_state.save()
 
-                    response = self.client.get(check_status_url)
+                response = self.client.get(check_status_url)
 
-                    self.assertEqual(response.status_code, status.HTTP_200_OK)
-                    response_data = response.json()
-                    self.assertEqual(
-                        response_data["status"], ProcessingStatuses.in_progress
-                    )
-                    self.assertEqual(response_data["result"], "")
-                    self.assertEqual(response_data["paymentUrl"], "")
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                response_data = response.json()
+                self.assertEqual(
+                    response_data["status"], ProcessingStatuses.in_progress
+                )
+                self.assertEqual(response_data["result"], "")
+                self.assertEqual(response_data["paymentUrl"], "")
 
-    def test_finished_celery_states(self):
-        submission = SubmissionFactory.create(
-            completed=True, on_completion_task_ids=["some-id"]
+    def test_result_for_done_states(self):
+        submission = SubmissionFactory.create(completed=True)
+        first_task = SubmissionProcessingStateFactory.create(submission=submission)
+        second_task = SubmissionProcessingStateFactory.create(submission=submission)
+        error_callback = SubmissionProcessingStateFactory.create(
+            submission=submission, task_name=maybe_delete_submission_report.name
         )
         token = submission_status_token_generator.make_token(submission)
         check_status_url = reverse(
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
         )
 
-        finished_states = [
-            states.SUCCESS,
-            states.FAILURE,
-        ]
-
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
-            for state in finished_states:
-                with self.subTest(celery_state=state):
-                    mock_AsyncResult.return_value.state = state
-
-                    response = self.client.get(check_status_url)
-
-                    self.assertEqual(response.status_code, status.HTTP_200_OK)
-                    response_data = response.json()
-                    self.assertEqual(response_data["status"], ProcessingStatuses.done)
-                    self.assertNotEqual(response_data["result"], "")
+        expected = (
+            # the error callback is not called
+            (
+                (
+                    ProcessingTaskStates.success,
+                    ProcessingTaskStates.success,
+                    ProcessingTaskStates.pending,
+                ),
+                ProcessingResults.success,
+            ),
+            # the workflow stops when a task fails, the next tasks remain pending
+            (
+                (
+                    ProcessingTaskStates.failed,
+                    ProcessingTaskStates.pending,
+                    ProcessingTaskStates.success,
+                ),
+                ProcessingResults.failed,
+            ),
+            (
+                (
+                    ProcessingTaskStates.failed,
+                    ProcessingTaskStates.pending,
+                    ProcessingTaskStates.failed,
+                ),
+                ProcessingResults.failed,
+            ),
+        )
 
-    def test_result_for_done_states(self):
-        submission = SubmissionFactory.create(
-            completed=True, on_completion_task_ids=["some-id"]
+        for states, expected_result in expected:
+            with self.subTest(states=states):
+                for processing_state, state in zip(
+                    (first_task, second_task, error_callback), states
+                ):
+                    processing_state.state = state
+                    processing_state.save()
+
+                response = self.client.get(check_status_url)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                response_data = response.json()
+                self.assertEqual(response_data["status"], ProcessingStatuses.done)
+                self.assertEqual(response_data["result"], expected_result)
+                # no payment configured
+                self.assertEqual(response_data["paymentUrl"], "")
+
+    def test_failure_in_progress_until_error_callback_finished(self):
+        submission = SubmissionFactory.create(completed=True)
+        SubmissionProcessingStateFactory.create(
+            submission=submission, state=ProcessingTaskStates.failed
+        )
+        parallel_task = SubmissionProcessingStateFactory.create(
+            submission=submission, state=ProcessingTaskStates.started
+        )
+        error_callback = SubmissionProcessingStateFactory.create(
+            submission=submission, task_name=maybe_delete_submission_report.name
         )
         token = submission_status_token_generator.make_token(submission)
         check_status_url = reverse(
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
         )
 
-        expected = (
-            (states.SUCCESS, ProcessingResults.success),
-            (states.FAILURE, ProcessingResults.failed),
-        )
+        response = self.client.get(check_status_url)
+
+        self.assertEqual(response.json()["status"], ProcessingStatuses.in_progress)
+
+        # the error callback is only called once the parallel tasks finished
+        parallel_task.state = ProcessingTaskStates.success
+        parallel_task.save()
+
+        response = self.client.get(check_status_url)
+
+        self.assertEqual(response.json()["status"], ProcessingStatuses.in_progress)
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
-            for state, expected_result in expected:
-                with self.subTest(celery_state=state):
-                    mock_AsyncResult.return_value.state = state
+        error_callback.state = ProcessingTaskStates.success
+        error_callback.save()
 
-                    response = self.client.get(check_status_url)
+        response = self.client.get(check_status_url)
 
-                    self.assertEqual(response.status_code, status.HTTP_200_OK)
-                    response_data = response.json()
-                    self.assertEqual(response_data["status"], ProcessingStatuses.done)
-                    self.assertEqual(response_data["result"], expected_result)
-                    # no payment configured
-                    self.assertEqual(response_data["paymentUrl"], "")
+        response_data = response.json()
+        self.assertEqual(response_data["status"], ProcessingStatuses.done)
+        self.assertEqual(response_data["result"], ProcessingResults.failed)
 
     def test_submission_id_in_session_for_failed_result(self):
-        submission = SubmissionFactory.create(
-            completed=True, on_completion_task_ids=["some-id"]
+        submission = SubmissionFactory.create(completed=True)
+        SubmissionProcessingStateFactory.create(
+            submission=submission, state=ProcessingTaskStates.failed
+        )
+        SubmissionProcessingStateFactory.create(
+            submission=submission,
+            task_name=maybe_delete_submission_report.name,
+            state=ProcessingTaskStates.success,
         )
         token = submission_status_token_generator.make_token(submission)
         check_status_url = reverse(
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
         )
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
-            mock_AsyncResult.return_value.state = states.FAILURE
+        response = self.client.get(check_status_url)
 
-            response = self.client.get(check_status_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertEqual(response_data["status"], ProcessingStatuses.done)
+        self.assertEqual(response_data["result"], ProcessingResults.failed)
+        # check that the submission ID is in the session
+        self.assertEqual(
+            response.wsgi_request.session[SUBMISSIONS_SESSION_KEY],
+            [str(submission.uuid)],
+        )
 
-            self.assertEqual(response.status_code, status.HTTP_200_OK)
-            response_data = response.json()
-            self.assertEqual(response_data["status"], ProcessingStatuses.done)
-            self.assertEqual(response_data["result"], ProcessingResults.failed)
-            # check that the submission ID is in the session
-            self.assertEqual(
-                response.wsgi_request.session[SUBMISSIONS_SESSION_KEY],
-                [str(submission.uuid)],
-            )
+
+class SubmissionProcessingStatusTests(TestCase):
+    def test_task_states_read_once(self):
+        submission = SubmissionFactory.create(completed=True)
+        SubmissionProcessingStateFactory.create_batch(
+            2, submission=submission, state=ProcessingTaskStates.success
+        )
+        processing_status = SubmissionProcessingStatus(
+            request=Request(RequestFactory().get("/irrelevant")),
+            submission=submission,
+        )
+
+        with self.assertNumQueries(1):
+            self.assertEqual(processing_status.status, ProcessingStatuses.done)
+            self.assertEqual(processing_status.result, ProcessingResults.success)
 
 
 @temp_private_root()
@@ -219,42 +300,46 @@ class SubmissionStatusExtraInformationTests(APITestCase):
     def test_succesful_processing(self):
         submission = SubmissionFactory.create(
             completed=True,
-            on_completion_task_ids=["some-id"],
             form__submission_confirmation_template="You get a cookie!",
             public_registration_reference="OF-ABCDE",
         )
+        SubmissionProcessingStateFactory.create(
+            submission=submission, state=ProcessingTaskStates.success
+        )
         SubmissionReportFactory.create(submission=submission)
         token = submission_status_token_generator.make_token(submission)
         check_status_url = reverse(
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
         )
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
-            mock_AsyncResult.return_value.state = states.SUCCESS
-
-            response = self.client.get(check_status_url)
+        response = self.client.get(check_status_url)
 
-            self.assertEqual(response.status_code, status.HTTP_200_OK)
-            response_data = response.json()
-            self.assertEqual(response_data["status"], ProcessingStatuses.done)
-            self.assertEqual(response_data["result"], ProcessingResults.success)
-            self.assertEqual(response_data["publicReference"], "OF-ABCDE")
-            self.assertEqual(response_data["errorMessage"], "")
-            self.assertEqual(
-                response_data["confirmationPageContent"], "You get a cookie!"
-            )
-            self.assertTrue(
-                response_data["reportDownloadUrl"].startswith("http://testserver")
-            )
-            # no payment configured/required -> no URL
-            self.assertEqual(response_data["paymentUrl"], "")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertEqual(response_data["status"], ProcessingStatuses.done)
+        self.assertEqual(response_data["result"], ProcessingResults.success)
+        self.assertEqual(response_data["publicReference"], "OF-ABCDE")
+        self.assertEqual(response_data["errorMessage"], "")
+        self.assertEqual(response_data["confirmationPageContent"], "You get a cookie!")
+        self.assertTrue(
+            response_data["reportDownloadUrl"].startswith("http://testserver")
+        )
+        # no payment configured/required -> no URL
+        self.assertEqual(response_data["paymentUrl"], "")
 
     def test_appointment_user_error(self):
         submission = SubmissionFactory.create(
             completed=True,
-            on_completion_task_ids=["some-id"],
             form__submission_confirmation_template="You get a cookie!",
         )
+        SubmissionProcessingStateFactory.create(
+            submission=submission, state=ProcessingTaskStates.failed
+        )
+        SubmissionProcessingStateFactory.create(
+            submission=submission,
+            task_name=maybe_delete_submission_report.name,
+            state=ProcessingTaskStates.success,
+        )
         AppointmentInfoFactory.create(submission=submission, has_missing_info=True)
 
         token = submission_status_token_generator.make_token(submission)
@@ -262,123 +347,286 @@ class SubmissionStatusExtraInformationTests(APITestCase):
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
         )
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
-            mock_AsyncResult.return_value.state = states.FAILURE
-
-            response = self.client.get(check_status_url)
+        response = self.client.get(check_status_url)
 
-            self.assertEqual(response.status_code, status.HTTP_200_OK)
-            response_data = response.json()
-            self.assertEqual(response_data["status"], ProcessingStatuses.done)
-            self.assertEqual(response_data["result"], ProcessingResults.failed)
-            self.assertEqual(response_data["errorMessage"], "Some fields are missing.")
-            self.assertEqual(response_data["confirmationPageContent"], "")
-            self.assertEqual(response_data["reportDownloadUrl"], "")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
+        self.assertEqual(response_data["status"], ProcessingStatuses.done)
+        self.assertEqual(response_data["result"], ProcessingResults.failed)
+        self.assertEqual(response_data["errorMessage"], "Some fields are missing.")
+        self.assertEqual(response_data["confirmationPageContent"], "")
+        self.assertEqual(response_data["reportDownloadUrl"], "")
 
     def test_payment_required(self):
         merchant = OgoneMerchantFactory.create()
         submission = SubmissionFactory.create(
             completed=True,
-            on_completion_task_ids=["some-id"],
             form__product__price=Decimal("10"),
             form__payment_backend="ogone-legacy",
             # see PR#650 which drops this requirement
             form__payment_backend_options={"merchant_id": merchant.id},
         )
+        SubmissionProcessingStateFactory.create(
+            submission=submission, state=ProcessingTaskStates.success
+        )
         SubmissionReportFactory.create(submission=submission)
         token = submission_status_token_generator.make_token(submission)
         check_status_url = reverse(
             "api:submission-status", kwargs={"uuid": submission.uuid, "token": token}
         )
 
-        with patch("openforms.submissions.status.AsyncResult") as mock_AsyncResult:
-            mock_AsyncResult.return_value.state = states.SUCCESS
+        response = self.client.get(check_status_url)
 
-            response = self.client.get(check_status_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        response_data = response.json()
 
-            self.assertEqual(response.status_code, status.HTTP_200_OK)
-            response_data = response.json()
+        expected_url = reverse(
+            "payments:start",
+            kwargs={"uuid": submission.uuid, "plugin_id": "ogone-legacy"},
+        )
+        self.assertEqual(
+            response_data["paymentUrl"], f"http://testserver{expected_url}"
+        )
 
-            expected_url = reverse(
-                "payments:start",
-                kwargs={"uuid": submission.uuid, "plugin_id": "ogone-legacy"},
-            )
-            self.assertEqual(
-                response_data["paymentUrl"], f"http://testserver{expected_url}"
-            )
 
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
 
-@patch("openforms.submissions.status.AsyncResult.forget", return_value=None)
-class CleanupTaskTests(TestCase):
-    def test_incomplete_submission(self, mock_forget):
-        SubmissionFactory.create(
-            completed=False,
-            suspended_on=None,
-            on_completion_task_ids=["some-id"],
-        )
+    def monotonic(self) -> float:
+        return self.now
 
-        cleanup_on_completion_results()
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
 
-        mock_forget.assert_not_called()
 
-    def test_complete_but_too_young(self, mock_forget):
-        SubmissionFactory.create(
-            completed=True,
-            completed_on=timezone.now() - timedelta(seconds=10),
-            suspended_on=None,
-            on_completion_task_ids=["some-id"],
+@override_settings(SUBMISSION_STATUS_MAX_WAIT=30, SUBMISSION_STATUS_MAX_WAITERS=2)
+class SubmissionStatusWaitTests(APITestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.submission = SubmissionFactory.create(completed=True)
+        self.processing_state = SubmissionProcessingStateFactory.create(
+            submission=self.submission
+        )
+        token = submission_status_token_generator.make_token(self.submission)
+        self.check_status_url = reverse(
+            "api:submission-status",
+            kwargs={"uuid": self.submission.uuid, "token": token},
         )
+        self.clock = FakeClock()
+        patcher = patch("openforms.submissions.status.time", new=self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _set_states_while_waiting(self, *states):
+        states = iter(states)
+
+        def sleep(seconds):
+            self.clock.sleeps.append(seconds)
+            self.clock.now += seconds
+            self.processing_state.state = next(states)
+            self.processing_state.save()
+
+        return patch.object(self.clock, "sleep", side_effect=sleep)
+
+    def test_wait_until_done(self):
+        with self._set_states_while_waiting(
+            ProcessingTaskStates.started, ProcessingTaskStates.success
+        ):
+            response = self.client.get(self.check_status_url, {"wait": 20})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["status"], ProcessingStatuses.done)
+        self.assertEqual(self.clock.sleeps, [5, 5])
+
+    def test_wait_until_deadline(self):
+        response = self.client.get(self.check_status_url, {"wait": 12})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["status"], ProcessingStatuses.in_progress)
+        self.assertEqual(self.clock.sleeps, [5, 5, 2])
+
+    def test_wait_for_scheduled_tasks(self):
+        self.processing_state.delete()
+
+        def schedule(seconds):
+            # the completion tasks are scheduled while the request waits
+            SubmissionProcessingStateFactory.create(
+                submission=self.submission, state=ProcessingTaskStates.success
+            )
+
+        with patch.object(self.clock, "sleep", side_effect=schedule):
+            response = self.client.get(self.check_status_url, {"wait": 10})
+
+        self.assertEqual(response.json()["status"], ProcessingStatuses.done)
+
+    def test_wait_too_long(self):
+        response = self.client.get(self.check_status_url, {"wait": 3600})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_no_wait_when_all_waiter_slots_are_taken(self):
+        cache = caches[WAITER_SLOTS_CACHE_ALIAS]
+        slot_keys = [f"{WAITER_SLOT_KEY_PREFIX}:{index}" for index in range(2)]
+        for slot_key in slot_keys:
+            cache.set(slot_key, True)
+            self.addCleanup(cache.delete, slot_key)
+
+        response = self.client.get(self.check_status_url, {"wait": 10})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["status"], ProcessingStatuses.in_progress)
+        self.assertEqual(self.clock.sleeps, [])
+
+        with self.subTest("slot released after waiting"):
+            cache.delete(slot_keys[1])
+
+            self.client.get(self.check_status_url, {"wait": 10})
+
+            self.assertEqual(self.clock.sleeps, [5, 5])
+            self.assertIsNone(cache.get(slot_keys[1]))
+
+    @override_settings(SUBMISSION_STATUS_MAX_WAITERS=0)
+    def test_waiting_disabled(self):
+        response = self.client.get(self.check_status_url, {"wait": 10})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.clock.sleeps, [])
 
-        cleanup_on_completion_results()
 
-        mock_forget.assert_not_called()
+@patch("openforms.submissions.tasks.notify_status_change")
+class ProcessingStateTrackingTests(TestCase):
+    def setUp(self):
+        super().setUp()
 
-    def test_suspended(self, mock_forget):
-        SubmissionFactory.create(
-            completed=False,
-            suspended_on=timezone.now() - timedelta(seconds=10),
-            on_completion_task_ids=[],
+        self.submission = SubmissionFactory.create(completed=True)
+        self.processing_state = SubmissionProcessingStateFactory.create(
+            submission=self.submission,
+            task_name=register_submission.name,
+            task_id="some-id",
         )
 
-        cleanup_on_completion_results()
+    def _start(self, processing_state):
+        processing_state.state = ProcessingTaskStates.started
+        processing_state.save()
+
+    def _send_prerun(self, task, task_id="some-id", args=None):
+        task_prerun.send(
+            sender=task,
+            task_id=task_id,
+            task=task,
+            args=args or (self.submission.id,),
+            kwargs={},
+        )
 
-        mock_forget.assert_not_called()
+    def _send_success(self, task, task_id="some-id"):
+        task.push_request(id=task_id, args=(self.submission.id,))
+        try:
+            task_success.send(sender=task, result=None)
+        finally:
+            task.pop_request()
+
+    def _send_failure(self, task, task_id="some-id"):
+        task_failure.send(
+            sender=task,
+            task_id=task_id,
+            exception=Exception("boom"),
+            args=(self.submission.id,),
+            kwargs={},
+        )
 
-    def test_completed_and_old_enough(self, mock_forget):
-        submission = SubmissionFactory.create(
-            completed=True,
-            completed_on=timezone.now() - timedelta(days=2, seconds=10),
-            suspended_on=None,
-            on_completion_task_ids=["some-id"],
+    def test_task_started(self, mock_notify):
+        self._send_prerun(register_submission)
+
+        self.processing_state.refresh_from_db()
+        self.assertEqual(self.processing_state.state, ProcessingTaskStates.started)
+        mock_notify.assert_not_called()
+
+    def test_task_succeeded(self, mock_notify):
+        self._start(self.processing_state)
+
+        self._send_success(register_submission)
+
+        self.processing_state.refresh_from_db()
+        self.assertEqual(self.processing_state.state, ProcessingTaskStates.success)
+        # only the end of the workflow is notified
+        mock_notify.assert_not_called()
+
+    def test_chain_finalized(self, mock_notify):
+        finalize_state = SubmissionProcessingStateFactory.create(
+            submission=self.submission,
+            task_name=finalize_completion.name,
+            state=ProcessingTaskStates.started,
+            task_id="finalize-id",
         )
 
-        cleanup_on_completion_results()
+        self._send_success(finalize_completion, task_id="finalize-id")
 
-        mock_forget.assert_called_once_with()
-        submission.refresh_from_db()
-        self.assertEqual(submission.on_completion_task_ids, [])
+        finalize_state.refresh_from_db()
+        self.assertEqual(finalize_state.state, ProcessingTaskStates.success)
+        mock_notify.assert_called_once_with(self.submission.id)
 
-    def test_multiple_cleanup_calls_only_forget_once(self, mock_forget):
-        SubmissionFactory.create(
-            completed=True,
-            completed_on=timezone.now() - timedelta(days=2, seconds=10),
-            suspended_on=None,
-            on_completion_task_ids=["some-id"],
+    def test_task_failed(self, mock_notify):
+        self._start(self.processing_state)
+
+        self._send_failure(register_submission)
+
+        self.processing_state.refresh_from_db()
+        self.assertEqual(self.processing_state.state, ProcessingTaskStates.failed)
+        # the processing is done once the error callback finished
+        mock_notify.assert_not_called()
+
+    def test_error_callback_failed(self, mock_notify):
+        errback_state = SubmissionProcessingStateFactory.create(
+            submission=self.submission,
+            task_name=maybe_delete_submission_report.name,
+            state=ProcessingTaskStates.started,
+            task_id="errback-id",
         )
 
-        cleanup_on_completion_results()
-        cleanup_on_completion_results()
+        self._send_failure(maybe_delete_submission_report, task_id="errback-id")
 
-        mock_forget.assert_called_once_with()
+        errback_state.refresh_from_db()
+        self.assertEqual(errback_state.state, ProcessingTaskStates.failed)
+        mock_notify.assert_called_once_with(self.submission.id)
 
-    def test_cleanup_skips_completed_submissions_without_tasks(self, mock_forget):
-        SubmissionFactory.create(
-            completed=True,
-            completed_on=timezone.now() - timedelta(days=2, seconds=10),
-            suspended_on=None,
-            on_completion_task_ids=[],
+    def test_attachment_resize_tracked(self, mock_notify):
+        resize_state = SubmissionProcessingStateFactory.create(
+            submission=self.submission,
+            task_name=resize_submission_attachment.name,
+            task_id="resize-id",
         )
 
-        cleanup_on_completion_results()
+        # the task takes the ID of the attachment, not of the submission
+        self._send_prerun(
+            resize_submission_attachment, task_id="resize-id", args=(123, (100, 100))
+        )
+        self._send_failure(resize_submission_attachment, task_id="resize-id")
+
+        resize_state.refresh_from_db()
+        self.assertEqual(resize_state.state, ProcessingTaskStates.failed)
+
+    def test_retry_outside_workflow_does_not_change_state(self, mock_notify):
+        self.processing_state.state = ProcessingTaskStates.success
+        self.processing_state.save()
+
+        # the re-scheduled task keeps its task ID
+        self._send_prerun(register_submission)
+        self._send_failure(register_submission)
+
+        self.processing_state.refresh_from_db()
+        self.assertEqual(self.processing_state.state, ProcessingTaskStates.success)
+
+    def test_task_of_previous_run_does_not_change_state(self, mock_notify):
+        # the workflow was restarted while a task of the previous run was running
+        self._start(self.processing_state)
+
+        self._send_success(register_submission, task_id="stale-id")
+        self._send_failure(register_submission, task_id="stale-id")
 
-        mock_forget.assert_not_called()
+        self.processing_state.refresh_from_db()
+        self.assertEqual(self.processing_state.state, ProcessingTaskStates.started)
+        mock_notify.assert_not_called()
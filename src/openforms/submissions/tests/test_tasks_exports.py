@@ -0,0 +1,134 @@
+from unittest.mock import patch
+
+from django.core import mail
+from django.test import TestCase, override_settings
+
+from openpyxl import load_workbook
+from privates.test import temp_private_root
+
+from openforms.accounts.tests.factories import UserFactory
+from openforms.forms.tests.factories import FormStepFactory
+
+from ..constants import SubmissionExportStatuses
+from ..exports import get_export_headers, iter_export_rows
+from ..models import Submission, SubmissionExport
+from ..tasks.exports import export_submissions_job
+from .factories import SubmissionFactory, SubmissionStepFactory
+
+
+@temp_private_root()
+@override_settings(BASE_URL="https://forms.example.com")
+class SubmissionExportJobTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        step = FormStepFactory.create(form__name="Test Form")
+        cls.form = step.form
+        for data in [{"foo": "bar"}, {"foo": "baz", "files": [{"name": "a.txt"}]}]:
+            SubmissionStepFactory.create(
+                submission__form=cls.form,
+                submission__completed=True,
+                form_step=step,
+                data=data,
+            )
+        # submission without steps
+        SubmissionFactory.create(form=cls.form)
+        cls.user = UserFactory.create(email="staff@example.com")
+
+    def _create_export(self, file_type: str) -> SubmissionExport:
+        return SubmissionExport.objects.create(
+            form=self.form,
+            user=self.user,
+            file_type=file_type,
+            submission_ids=list(
+                Submission.objects.order_by("pk").values_list("pk", flat=True)
+            ),
+        )
+
+    def test_export_csv(self):
+        export = self._create_export("csv")
+
+        export_submissions_job(export.pk)
+
+        export.refresh_from_db()
+        self.assertEqual(export.status, SubmissionExportStatuses.success)
+        self.assertEqual(export.num_processed, 3)
+        self.assertEqual(export.get_progress(), 100)
+        self.assertIsNotNone(export.completed_on)
+        lines = export.content.read().decode("utf-8").splitlines()
+        self.assertEqual(lines[0], "Formuliernaam,Inzendingdatum,foo,files")
+        self.assertEqual(len(lines), 4)
+        self.assertEqual(lines[3], "Test Form,,,")
+
+    def test_export_xlsx(self):
+        export = self._create_export("xlsx")
+
+        export_submissions_job(export.pk)
+
+        export.refresh_from_db()
+        self.assertEqual(export.status, SubmissionExportStatuses.success)
+        worksheet = load_workbook(export.content.path).active
+        rows = [[cell.value for cell in row] for row in worksheet.iter_rows()]
+        self.assertEqual(rows[0], ["Formuliernaam", "Inzendingdatum", "foo", "files"])
+        self.assertEqual(rows[1][2:], ["bar", None])
+        self.assertEqual(rows[2][2:], ["baz", "[{'name': 'a.txt'}]"])
+
+    def test_user_is_notified(self):
+        export = self._create_export("csv")
+
+        export_submissions_job(export.pk)
+
+        self.assertEqual(len(mail.outbox), 1)
+        message = mail.outbox[0]
+        self.assertEqual(message.to, ["staff@example.com"])
+        self.assertIn(
+            f"https://forms.example.com/admin/submissions/submissionexport/{export.pk}/change/",
+            message.body,
+        )
+
+    @patch(
+        "openforms.submissions.tasks.exports.write_submission_export",
+        side_effect=Exception("boom"),
+    )
+    def test_export_failed(self, mock_write):
+        export = self._create_export("csv")
+
+        export_submissions_job(export.pk)
+
+        export.refresh_from_db()
+        self.assertEqual(export.status, SubmissionExportStatuses.failed)
+        self.assertFalse(export.content)
+        self.assertEqual(len(mail.outbox), 1)
+
+
+class ExportDataTests(TestCase):
+    def test_headers_in_order_of_components(self):
+        step = FormStepFactory.create(
+            form_definition__configuration={
+                "components": [
+                    {"type": "textfield", "key": "surname"},
+                    {
+                        "type": "fieldset",
+                        "key": "address",
+                        "components": [{"type": "textfield", "key": "city"}],
+                    },
+                    {"type": "textfield", "key": "age"},
+                ]
+            }
+        )
+        SubmissionStepFactory.create(
+            submission__form=step.form,
+            form_step=step,
+            data={"age": 42, "removed": "x", "city": "Amsterdam", "surname": "Doe"},
+        )
+
+        headers = get_export_headers(Submission.objects.all())
+
+        self.assertEqual(headers, ["surname", "city", "age", "removed"])
+
+    def test_form_name_is_admin_name(self):
+        SubmissionFactory.create(form__name="Public", form__internal_name="Internal")
+        SubmissionFactory.create(form__name="Public", form__internal_name="")
+
+        rows = list(iter_export_rows(Submission.objects.all(), []))
+
+        self.assertEqual([row[0] for row in rows], ["Internal", "Public"])
@@ -1,11 +1,22 @@
-from django.test import TestCase
+from unittest.mock import patch
+
+from django.test import RequestFactory, TestCase
 from django.utils.translation import gettext_lazy as _
 
 from privates.test import temp_private_root
+from rest_framework.request import Request
+
+from openforms.appointments.tests.factories import AppointmentInfoFactory
 
+from ..constants import ProcessingResults, ProcessingStatuses, ProcessingTaskStates
 from ..models import SubmissionReport
-from ..tasks.pdf import generate_submission_report
-from .factories import SubmissionFactory
+from ..status import SubmissionProcessingStatus
+from ..tasks.pdf import generate_submission_report, maybe_delete_submission_report
+from .factories import (
+    SubmissionFactory,
+    SubmissionProcessingStateFactory,
+    SubmissionReportFactory,
+)
 
 
 @temp_private_root()
@@ -23,3 +34,98 @@ class SubmissionReportGenerationTests(TestCase):
         self.assertEqual(submission, report.submission)
         self.assertTrue(report.content.name.endswith("Test_Form.pdf"))
         self.assertEqual("some-id", report.task_id)
+
+
+@temp_private_root()
+@patch("openforms.submissions.tasks.notify_status_change")
+class SubmissionReportCleanupTests(TestCase):
+    def _run_error_callback(self, submission, task_id="errback-id"):
+        maybe_delete_submission_report.apply(args=(submission.id,), task_id=task_id)
+
+    def _create_error_callback_state(self, submission, task_id="errback-id"):
+        return SubmissionProcessingStateFactory.create(
+            submission=submission,
+            task_name=maybe_delete_submission_report.name,
+            task_id=task_id,
+        )
+
+    def test_report_deleted_when_appointment_failed(self, mock_notify):
+        for trait in ("registration_failed", "has_missing_info"):
+            with self.subTest(appointment=trait):
+                report = SubmissionReportFactory.create(submission__completed=True)
+                AppointmentInfoFactory.create(
+                    submission=report.submission, **{trait: True}
+                )
+                self._create_error_callback_state(
+                    report.submission, task_id=f"errback-{trait}"
+                )
+
+                self._run_error_callback(report.submission, task_id=f"errback-{trait}")
+
+                self.assertFalse(
+                    SubmissionReport.objects.filter(
+                        submission=report.submission
+                    ).exists()
+                )
+
+    def test_report_kept_when_appointment_succeeded(self, mock_notify):
+        report = SubmissionReportFactory.create(submission__completed=True)
+        AppointmentInfoFactory.create(
+            submission=report.submission, registration_ok=True
+        )
+        self._create_error_callback_state(report.submission)
+
+        self._run_error_callback(report.submission)
+
+        self.assertTrue(SubmissionReport.objects.filter(pk=report.pk).exists())
+
+    def test_report_kept_without_appointment(self, mock_notify):
+        report = SubmissionReportFactory.create(submission__completed=True)
+        self._create_error_callback_state(report.submission)
+
+        self._run_error_callback(report.submission)
+
+        self.assertTrue(SubmissionReport.objects.filter(pk=report.pk).exists())
+
+    def test_error_callback_finishes_processing(self, mock_notify):
+        report = SubmissionReportFactory.create(submission__completed=True)
+        SubmissionProcessingStateFactory.create(
+            submission=report.submission, state=ProcessingTaskStates.failed
+        )
+        SubmissionProcessingStateFactory.create(submission=report.submission)
+        errback_state = self._create_error_callback_state(report.submission)
+        processing_status = SubmissionProcessingStatus(
+            request=Request(RequestFactory().get("/irrelevant")),
+            submission=report.submission,
+        )
+        # the processing is not done before the error callback ran
+        self.assertEqual(processing_status.status, ProcessingStatuses.in_progress)
+
+        self._run_error_callback(report.submission)
+
+        errback_state.refresh_from_db()
+        self.assertEqual(errback_state.state, ProcessingTaskStates.success)
+        processing_status = SubmissionProcessingStatus(
+            request=Request(RequestFactory().get("/irrelevant")),
+            submission=report.submission,
+        )
+        self.assertEqual(processing_status.status, ProcessingStatuses.done)
+        self.assertEqual(processing_status.result, ProcessingResults.failed)
+        mock_notify.assert_called_once_with(report.submission.id)
+
+    def test_error_callback_of_previous_run_keeps_report(self, mock_notify):
+        # the submission was completed again, the processing states were recreated
+        report = SubmissionReportFactory.create(submission__completed=True)
+        AppointmentInfoFactory.create(
+            submission=report.submission, has_missing_info=True
+        )
+        current_state = self._create_error_callback_state(
+            report.submission, task_id="current-errback-id"
+        )
+
+        self._run_error_callback(report.submission, task_id="stale-errback-id")
+
+        self.assertTrue(SubmissionReport.objects.filter(pk=report.pk).exists())
+        current_state.refresh_from_db()
+        self.assertEqual(current_state.state, ProcessingTaskStates.pending)
+        mock_notify.assert_not_called()
@@ -3,9 +3,11 @@ from typing import Any
 
 from django.conf import settings
 from django.contrib.sessions.backends.base import SessionBase
-from django.core.mail import send_mail
+
+from django_yubin.constants import PRIORITY_HEADER
 
 from openforms.logging import logevent
+from openforms.utils.email import send_mail_plus
 
 from .constants import SUBMISSIONS_SESSION_KEY, UPLOADS_SESSION_KEY
 from .models import Submission, TemporaryFileUpload
@@ -85,13 +87,16 @@ def send_confirmation_email(submission: Submission):
 
     content = email_template.render(submission)
 
-    send_mail(
+    send_mail_plus(
         email_template.subject,
         content,
         settings.DEFAULT_FROM_EMAIL,  # TODO: add config option to specify sender e-mail
         to_emails,
         fail_silently=False,
         html_message=content,
+        # the submitter is waiting for the confirmation, send it before the
+        # registration e-mails
+        headers={PRIORITY_HEADER: "high"},
     )
 
     submission.confirmation_email_sent = True
@@ -93,6 +93,9 @@ def maybe_retry_in_workflow(
             # exceed the timeout, meaning we schedule it OUTSIDE the workflow.
             if has_timeout and total_runtime >= timeout:
                 logger.debug("Scheduling retries OUTSIDE of the current workflow")
+                # The workflow continues with the next task, the re-scheduled task is
+                # detached from it: it may not run the rest of the chain again, call
+                # the callbacks again or count as (another) part of a chord/group.
                 signature = task.signature_from_request(
                     task.request,
                     args=None,
@@ -101,6 +104,12 @@ def maybe_retry_in_workflow(
                     eta=None,
                     retries=retries + 1,
                     headers={"has_timeout": False},
+                    chain=None,
+                    chord=None,
+                    group_id=None,
+                    group_index=None,
+                    link=None,
+                    link_error=None,
                 )
                 signature.apply_async()
                 return
@@ -1,5 +1,63 @@
+import base64
+from email.mime.base import MIMEBase
+from tempfile import SpooledTemporaryFile
+from typing import Iterator
+
+from django.core.files import File
 from django.core.mail import EmailMultiAlternatives, get_connection
 
+# a multiple of 57 bytes, which encode to exactly one line of 76 base64 characters
+ATTACHMENT_CHUNK_SIZE = 57 * 1024
+# encoded attachments larger than this are spooled to disk rather than kept in memory
+ATTACHMENT_SPOOL_SIZE = 1024 * 1024
+
+
+def _encode_base64_lines(content: File) -> Iterator[bytes]:
+    remainder = b""
+    content.open("rb")
+    content.seek(0)
+    while True:
+        chunk = content.read(ATTACHMENT_CHUNK_SIZE)
+        if not chunk:
+            break
+        data = remainder + chunk
+        # only encode complete lines, the rest is carried over to the next chunk
+        cutoff = len(data) - len(data) % 57
+        remainder = data[cutoff:]
+        yield base64.encodebytes(data[:cutoff])
+    if remainder:
+        yield base64.encodebytes(remainder)
+
+
+def make_attachment(filename: str, content: File, mime_type: str) -> MIMEBase:
+    """
+    Create the MIME part of a file attachment.
+
+    The file is read from storage and base64 encoded chunk by chunk into a spooled
+    temporary file, so the raw content is never loaded in memory as a whole (unlike
+    :meth:`EmailMessage.attach`, which holds the content and its encoded version). The
+    payload is set once from that file: the e-mail generators need the encoded
+    content in memory. Callers bound its size, e.g. the e-mail registration links to
+    the uploads above ``EMAIL_REGISTRATION_MAX_ATTACHMENT_SIZE`` instead.
+    """
+    maintype, subtype = (mime_type or "application/octet-stream").split("/", 1)
+    with SpooledTemporaryFile(max_size=ATTACHMENT_SPOOL_SIZE) as payload_file:
+        for line in _encode_base64_lines(content):
+            payload_file.write(line)
+        payload_file.seek(0)
+        payload = payload_file.read().decode("ascii")
+
+    attachment = MIMEBase(maintype, subtype)
+    attachment.set_payload(payload)
+    attachment["Content-Transfer-Encoding"] = "base64"
+
+    try:
+        filename.encode("ascii")
+    except UnicodeEncodeError:
+        filename = ("utf-8", "", filename)
+    attachment.add_header("Content-Disposition", "attachment", filename=filename)
+    return attachment
+
 
 def send_mail_plus(
     subject,
@@ -12,11 +70,13 @@ def send_mail_plus(
     connection=None,
     html_message=None,
     attachments=None,
+    headers=None,
 ):
 
     """
     modified copy of django.core.mail.send_mail() with:
-    - attachment support
+    - attachment support, either (filename, content, mimetype) tuples or MIME parts
+    - extra headers, e.g. to set the priority in the e-mail queue
     """
 
     connection = connection or get_connection(
@@ -25,11 +85,20 @@ def send_mail_plus(
         fail_silently=fail_silently,
     )
     mail = EmailMultiAlternatives(
-        subject, message, from_email, recipient_list, connection=connection
+        subject,
+        message,
+        from_email,
+        recipient_list,
+        connection=connection,
+        headers=headers,
     )
     if html_message:
         mail.attach_alternative(html_message, "text/html")
     if attachments:
-        for filename, content, mime_type in attachments:
-            mail.attach(filename, content, mime_type)
+        for attachment in attachments:
+            if isinstance(attachment, MIMEBase):
+                mail.attach(attachment)
+            else:
+                filename, content, mime_type = attachment
+                mail.attach(filename, content, mime_type)
     return mail.send()
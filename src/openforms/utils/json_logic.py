@@ -2,13 +2,32 @@
 Utilities to parse/process jsonLogic expressions.
 """
 from dataclasses import dataclass, field
-from typing import List, Union
+from functools import partial
+from typing import Any, Callable, FrozenSet, List, Optional, Union
 
-from json_logic import jsonLogic
+from json_logic import get_var, jsonLogic, missing, missing_some, operations
 
-__all__ = ["JsonLogicTest"]
+try:
+    from json_logic import empty_operand_values_for_operators
+except ImportError:  # older json-logic-py releases don't short-circuit empty operands
+    empty_operand_values_for_operators = {}
+
+__all__ = ["JsonLogicTest", "compile_expression", "extract_variables"]
 
 JSONLogicValue = Union[str, int, "JsonLogicTest"]
+CompiledExpression = Callable[[dict], Any]
+
+# operators that receive (part of) their operands un-evaluated, or that otherwise
+# deviate from "evaluate the operands, apply the operation". These are delegated to
+# the json_logic interpreter.
+INTERPRETED_OPERATORS = {"reduce", "map", "filter", "all", "none", "some"}
+
+# operators that look up values in the data rather than operate on their operands
+DATA_OPERATORS = {
+    "var": get_var,
+    "missing": missing,
+    "missing_some": missing_some,
+}
 
 
 @dataclass
@@ -49,3 +68,106 @@ def normalize_value(value: Union[dict, list, tuple, int, str]) -> JSONLogicValue
         return JsonLogicTest.from_expression(value)
 
     raise NotImplementedError(f"Unknown value type: {type(value)}")
+
+
+def compile_expression(expression: Any) -> CompiledExpression:
+    """
+    Compile a jsonLogic expression into a Python callable.
+
+    The expression tree is walked once, and every node is turned into a closure. The
+    resulting callable takes the data to evaluate against and gives the same result
+    as ``jsonLogic(expression, data)``, without having to inspect the expression
+    structure again on every evaluation.
+    """
+    compiled = _compile(expression)
+
+    def evaluate(data: dict = None) -> Any:
+        return compiled(data or {})
+
+    return evaluate
+
+
+def _compile(expression: Any) -> CompiledExpression:
+    if isinstance(expression, (list, tuple)):
+        items = [_compile(item) for item in expression]
+        return lambda data: [item(data) for item in items]
+
+    # primitives evaluate to themselves
+    if not isinstance(expression, dict):
+        return lambda data: expression
+
+    operator = next(iter(expression), None)
+    if len(expression) != 1 or operator in INTERPRETED_OPERATORS:
+        return partial(_interpret, expression)
+
+    values = expression[operator]
+    # unary syntactic sugar, like {"var": "x"} instead of {"var": ["x"]}
+    if not isinstance(values, (list, tuple)):
+        values = [values]
+    operands = [_compile(value) for value in values]
+
+    if operator in DATA_OPERATORS:
+        lookup = DATA_OPERATORS[operator]
+        return lambda data: lookup(data, *[operand(data) for operand in operands])
+
+    if operator not in operations:
+        # let the interpreter raise the appropriate error at evaluation time
+        return partial(_interpret, expression)
+
+    operation = operations[operator]
+    empty_values = empty_operand_values_for_operators.get(operator)
+    if not empty_values:
+        return lambda data: operation(*[operand(data) for operand in operands])
+
+    def evaluate(data: dict) -> Any:
+        values = [operand(data) for operand in operands]
+        if any(value in empty_values for value in values):
+            return None
+        return operation(*values)
+
+    return evaluate
+
+
+def _interpret(expression: dict, data: dict) -> Any:
+    return jsonLogic(expression, data)
+
+
+def extract_variables(expression: Any) -> Optional[FrozenSet[str]]:
+    """
+    Determine the (top-level) data keys an expression reads.
+
+    For ``{"var": "foo.bar"}``, the dependency is on ``foo``, as that is the data key
+    holding the (nested) value. Returns ``None`` if the variables can not be determined
+    statically, e.g. when the variable name is itself an expression. Callers should
+    then assume the expression may depend on any data key.
+    """
+    if isinstance(expression, (list, tuple)):
+        variables = set()
+        for item in expression:
+            item_variables = extract_variables(item)
+            if item_variables is None:
+                return None
+            variables.update(item_variables)
+        return frozenset(variables)
+
+    if not isinstance(expression, dict):
+        return frozenset()
+
+    operator = next(iter(expression), None)
+    if len(expression) != 1 or operator in INTERPRETED_OPERATORS:
+        return None
+
+    values = expression[operator]
+    if operator in DATA_OPERATORS:
+        if operator != "var":
+            return None
+        if not isinstance(values, (list, tuple)):
+            values = [values]
+        # an empty name returns the data itself, and expression names or defaults
+        # are only known at run-time
+        if not values or any(isinstance(value, (dict, list)) for value in values):
+            return None
+        name = str(values[0])
+        return frozenset({name.split(".")[0]}) if name else None
+
+    return extract_variables(values)
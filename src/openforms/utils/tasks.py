@@ -1,5 +1,6 @@
 import logging
 
+from django.conf import settings
 from django.core import management
 
 from celery_once import QueueOnce
@@ -18,5 +19,8 @@ def clear_session_store():
 
 @app.task(base=QueueOnce, ignore_result=True)
 def send_emails() -> None:
+    from openforms.emails.tasks import drain_email_queue
+
     logger.debug("Processing e-mail queue")
-    management.call_command("send_mail")
+    for worker in range(settings.EMAIL_QUEUE_WORKERS):
+        drain_email_queue.delay(worker)
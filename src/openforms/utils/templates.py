@@ -0,0 +1,57 @@
+"""
+Cache the compiled templates of admin provided content.
+
+Templates configured in the admin (like the confirmation e-mail and confirmation page
+of a form) are rendered for every submission, and the confirmation page is rendered on
+every poll of the submission status. Compiling the template is the expensive part of
+rendering it, so the compiled :class:`django.template.Template` is cached per process.
+
+Every scope (for example: the confirmation page of a particular form) holds the
+template of a single version of its content, identified by a hash. When the content
+changes, the template is compiled again and replaces the previous version. The least
+recently used scopes are evicted when the cache is full.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Hashable, Tuple
+
+from django.template import Template
+
+__all__ = ["get_template_from_string", "clear_template_cache"]
+
+MAX_SIZE = 1000
+
+_templates: "OrderedDict[Hashable, Tuple[str, Template]]" = OrderedDict()
+_templates_lock = threading.Lock()
+
+
+def get_template_from_string(content: str, scope: Hashable) -> Template:
+    """
+    Return the compiled template of the content.
+
+    :param scope: identifies where the content is configured, e.g.
+      ``("confirmation_page", form.pk)``.
+    """
+    content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    with _templates_lock:
+        cached = _templates.get(scope)
+        if cached is not None and cached[0] == content_hash:
+            _templates.move_to_end(scope)
+            return cached[1]
+
+    # compile outside of the lock - a syntax error must not break other renders
+    template = Template(content)
+
+    with _templates_lock:
+        _templates[scope] = (content_hash, template)
+        _templates.move_to_end(scope)
+        while len(_templates) > MAX_SIZE:
+            _templates.popitem(last=False)
+    return template
+
+
+def clear_template_cache() -> None:
+    with _templates_lock:
+        _templates.clear()
@@ -1,6 +1,8 @@
 from django.test import SimpleTestCase
 
-from ..json_logic import JsonLogicTest
+from json_logic import jsonLogic
+
+from ..json_logic import JsonLogicTest, compile_expression
 
 
 class JSONLogicUtilsTests(SimpleTestCase):
@@ -41,3 +43,50 @@ class JSONLogicUtilsTests(SimpleTestCase):
         self.assertEqual(nested_2_operand_1.operator, "var")
         self.assertEqual(nested_2_operand_1.values, ["foo"])
         self.assertEqual(nested_2_operand_2, 1)
+
+
+class CompileExpressionTests(SimpleTestCase):
+    def test_compiled_expressions_match_interpreter(self):
+        cases = [
+            ({"==": [{"var": "foo"}, 12]}, {"foo": 12}),
+            ({"==": [{"var": "foo"}, 12]}, {"foo": "13"}),
+            ({"and": [{"==": [1, 1]}, {">": [{"var": "foo"}, 1]}]}, {"foo": 3}),
+            ({"+": [{"var": "a"}, {"var": "b.c"}]}, {"a": 1, "b": {"c": "2"}}),
+            ({"in": ["x", ["x", "y"]]}, {}),
+            ({"missing": ["a", "b"]}, {"a": 1}),
+            ({"if": [{"var": "x"}, "yes", "no"]}, {"x": 0}),
+            ({"cat": ["a", {"var": "x"}]}, None),
+            (
+                {"<": [{"date": {"var": "dateOfBirth"}}, {"date": "2021-01-01"}]},
+                {"dateOfBirth": "2020-05-05"},
+            ),
+            (
+                {
+                    "reduce": [
+                        {"var": "items"},
+                        {"+": [{"var": "accumulator"}, {"var": "current"}]},
+                        0,
+                    ]
+                },
+                {"items": [1, 2, 3]},
+            ),
+            (42, {}),
+        ]
+
+        for expression, data in cases:
+            with self.subTest(expression=expression, data=data):
+                compiled = compile_expression(expression)
+
+                self.assertEqual(compiled(data), jsonLogic(expression, data))
+
+    def test_compiled_expression_is_reusable(self):
+        compiled = compile_expression({">": [{"var": "age"}, 17]})
+
+        self.assertTrue(compiled({"age": 18}))
+        self.assertFalse(compiled({"age": 16}))
+
+    def test_unknown_operator_raises_on_evaluation(self):
+        compiled = compile_expression({"unknown": [1, 2]})
+
+        with self.assertRaises(ValueError):
+            compiled({})
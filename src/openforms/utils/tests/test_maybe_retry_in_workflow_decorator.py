@@ -94,6 +94,31 @@ class DecoratorTests(SimpleTestCase):
             self.assertEqual(call_kwargs["retries"], 1)
             mock_signature_from_request.return_value.apply_async.assert_called_once_with()
 
+    def test_task_retried_outside_timeout_is_detached_from_workflow(self):
+        task_exceeds_timeout.push_request(
+            args=(),
+            kwargs={},
+            id="some-id",
+            task=f"{__name__}.task_exceeds_timeout",
+            called_directly=False,
+            chord={"task": "some.chord.body"},
+            group="some-group-id",
+            group_index=0,
+            chain=[{"task": "some.next.task"}],
+            errbacks=[{"task": "some.errback"}],
+        )
+        self.addCleanup(task_exceeds_timeout.pop_request)
+
+        with patch.object(task_exceeds_timeout, "apply_async") as mock_apply_async:
+            task_exceeds_timeout.run()
+
+        mock_apply_async.assert_called_once()
+        options = mock_apply_async.call_args.kwargs
+        self.assertEqual(options["task_id"], "some-id")
+        for option in ("chord", "group_id", "group_index", "chain", "link_error"):
+            with self.subTest(option=option):
+                self.assertIsNone(options[option])
+
     def test_conditional_retry_based_on_specific_exception(self):
         try:
             with self.assertRaisesMessage(Exception, "I should not be retried"):
@@ -0,0 +1,49 @@
+from unittest.mock import patch
+
+from django.template import TemplateSyntaxError
+from django.test import SimpleTestCase
+
+from ..templates import clear_template_cache, get_template_from_string
+
+
+class TemplateCacheTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+
+        clear_template_cache()
+        self.addCleanup(clear_template_cache)
+
+    def test_template_is_compiled_once(self):
+        first = get_template_from_string("Hello {{ name }}", scope=("form", 1))
+        second = get_template_from_string("Hello {{ name }}", scope=("form", 1))
+
+        self.assertIs(first, second)
+
+    def test_changed_content_is_compiled_again(self):
+        first = get_template_from_string("Hello {{ name }}", scope=("form", 1))
+        second = get_template_from_string("Bye {{ name }}", scope=("form", 1))
+
+        self.assertIsNot(first, second)
+        self.assertEqual(second.source, "Bye {{ name }}")
+
+    def test_scopes_are_separate(self):
+        first = get_template_from_string("Hello {{ name }}", scope=("form", 1))
+        second = get_template_from_string("Bye {{ name }}", scope=("form", 2))
+
+        self.assertIs(get_template_from_string("Hello {{ name }}", ("form", 1)), first)
+        self.assertIs(get_template_from_string("Bye {{ name }}", ("form", 2)), second)
+
+    @patch("openforms.utils.templates.MAX_SIZE", 2)
+    def test_least_recently_used_scope_is_evicted(self):
+        first = get_template_from_string("first", scope=1)
+        second = get_template_from_string("second", scope=2)
+        get_template_from_string("first", scope=1)
+
+        get_template_from_string("third", scope=3)
+
+        self.assertIs(get_template_from_string("first", scope=1), first)
+        self.assertIsNot(get_template_from_string("second", scope=2), second)
+
+    def test_syntax_error(self):
+        with self.assertRaises(TemplateSyntaxError):
+            get_template_from_string("{% bad %}", scope=1)
@@ -53,6 +53,8 @@ class StufServiceAdmin(PrivateMediaMixin, admin.ModelAdmin):
                     "endpoint_beantwoord_vraag",
                     "endpoint_vrije_berichten",
                     "endpoint_ontvang_asynchroon",
+                    "timeout_connect",
+                    "timeout_read",
                 ]
             },
         ),
@@ -5,3 +5,7 @@ from django.utils.translation import gettext_lazy as _
 class StufAppConfig(AppConfig):
     name = "stuf"
     verbose_name = _("StUF Settings & Services")
+
+    def ready(self):
+        # load the signal receivers
+        from . import signals  # noqa
@@ -0,0 +1,105 @@
+import timeit
+import uuid
+from datetime import timedelta
+
+from django.core.management import BaseCommand
+from django.template import loader
+from django.utils import timezone
+from django.utils.safestring import mark_safe
+
+from stuf.constants import STUF_ZDS_EXPIRY_MINUTES, EndpointSecurity
+from stuf.models import SoapService, StufService
+from stuf.stuf_zds.client import (
+    PaymentStatus,
+    StufZDSClient,
+    fmt_soap_date,
+    fmt_soap_datetime,
+)
+
+TEMPLATE_NAME = "stuf_zds/soap/creeerZaak.xml"
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the number of StUF-ZDS messages (creeerZaak) rendered per second, "
+        "with per-message template rendering and with the message builder."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "-n",
+            "--number",
+            type=int,
+            default=1000,
+            help="Number of messages to render per measurement.",
+        )
+
+    def handle(self, **options):
+        service = StufService(
+            soap_service=SoapService(url="http://zaken/soap/"),
+            endpoint_security=EndpointSecurity.wss,
+            user="user",
+            password="password",
+            zender_organisatie="ZenOrg",
+            zender_applicatie="ZenApp",
+            ontvanger_organisatie="OntOrg",
+            ontvanger_applicatie="OntApp",
+        )
+        client = StufZDSClient(
+            service,
+            {
+                "gemeentecode": "1234",
+                "omschrijving": "my-form",
+                "zds_zaaktype_code": "zt-code",
+                "zds_zaaktype_omschrijving": "zt-omschrijving",
+                "zds_zaaktype_status_code": "zt-st-code",
+                "zds_zaaktype_status_omschrijving": "zt-st-omschrijving",
+                "zds_documenttype_omschrijving": "dt-omschrijving",
+                "referentienummer": str(uuid.uuid4()),
+            },
+        )
+        zaak_context = {
+            "zaak_identificatie": "ZAAK-1",
+            "extra": {"foo": "bar"},
+            "betalings_indicatie": PaymentStatus.NVT,
+            "bsn": "111222333",
+        }
+
+        def render_per_message():
+            # the rendering as it was done before the message builder
+            context = {**client._base_context, **zaak_context}
+            context.update(
+                {
+                    "tijdstip_bericht": fmt_soap_datetime(timezone.now()),
+                    "tijdstip_registratie": fmt_soap_datetime(timezone.now()),
+                    "datum_vandaag": fmt_soap_date(timezone.now()),
+                }
+            )
+            content = loader.render_to_string(TEMPLATE_NAME, context)
+            return loader.render_to_string(
+                "stuf_zds/soap/includes/envelope.xml",
+                {
+                    "soap_version": service.soap_version,
+                    "soap_use_wss": True,
+                    "wss_username": service.user,
+                    "wss_password": service.password,
+                    "wss_created": fmt_soap_date(timezone.now()),
+                    "wss_expires": fmt_soap_date(
+                        timezone.now() + timedelta(minutes=STUF_ZDS_EXPIRY_MINUTES)
+                    ),
+                    "content": mark_safe(content),
+                },
+            )
+
+        def build_message():
+            context = {**client._get_request_base_context(), **zaak_context}
+            return client.build_message(TEMPLATE_NAME, context)
+
+        number = options["number"]
+        for label, func in (
+            ("per-message rendering", render_per_message),
+            ("message builder", build_message),
+        ):
+            func()  # warm up
+            duration = timeit.timeit(func, number=number)
+            self.stdout.write(f"{label}: {number / duration:.0f} messages/s")
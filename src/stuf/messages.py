@@ -0,0 +1,39 @@
+"""
+Render StUF SOAP messages from templates.
+
+Registering a submission sends several StUF messages. Rather than going through the
+project template loaders for every message, the templates are rendered with a
+dedicated template engine that parses each template (and its includes) only once per
+process, regardless of whether the cached template loader is enabled.
+"""
+from functools import lru_cache
+
+from django.conf import settings
+from django.template import Context, Engine, Template
+
+__all__ = ["get_template", "render_message"]
+
+
+@lru_cache(maxsize=None)
+def _get_engine() -> Engine:
+    return Engine(
+        # honour template overrides in the project templates directory
+        dirs=settings.TEMPLATES[0]["DIRS"],
+        loaders=[
+            (
+                "django.template.loaders.cached.Loader",
+                [
+                    "django.template.loaders.filesystem.Loader",
+                    "django.template.loaders.app_directories.Loader",
+                ],
+            )
+        ],
+    )
+
+
+def get_template(template_name: str) -> Template:
+    return _get_engine().get_template(template_name)
+
+
+def render_message(template_name: str, context: dict) -> str:
+    return get_template(template_name).render(Context(context))
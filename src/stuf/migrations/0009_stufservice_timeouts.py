@@ -0,0 +1,29 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("stuf", "0008_auto_20210927_1555"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="stufservice",
+            name="timeout_connect",
+            field=models.PositiveSmallIntegerField(
+                default=10,
+                help_text="Time (in seconds) to wait for a connection to the service to be established.",
+                verbose_name="connect timeout",
+            ),
+        ),
+        migrations.AddField(
+            model_name="stufservice",
+            name="timeout_read",
+            field=models.PositiveSmallIntegerField(
+                default=60,
+                help_text="Time (in seconds) to wait for the service to respond.",
+                verbose_name="read timeout",
+            ),
+        ),
+    ]
@@ -1,3 +1,5 @@
+from typing import Tuple
+
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
@@ -151,6 +153,20 @@ class StufService(models.Model):
         null=True,
     )
 
+    timeout_connect = models.PositiveSmallIntegerField(
+        _("connect timeout"),
+        default=10,
+        help_text=_(
+            "Time (in seconds) to wait for a connection to the service to be "
+            "established."
+        ),
+    )
+    timeout_read = models.PositiveSmallIntegerField(
+        _("read timeout"),
+        default=60,
+        help_text=_("Time (in seconds) to wait for the service to respond."),
+    )
+
     class Meta:
         verbose_name = _("StUF service")
         verbose_name_plural = _("StUF services")
@@ -173,6 +189,9 @@ class StufService(models.Model):
         val = getattr(self, attr, None)
         return val or self.soap_service.url
 
+    def get_timeout(self) -> Tuple[int, int]:
+        return (self.timeout_connect, self.timeout_read)
+
     def get_auth(self):
         if (
             self.endpoint_security
@@ -0,0 +1,62 @@
+"""
+Pooled HTTP sessions for StUF services.
+
+Every StUF message is a separate HTTP request. Using a fresh connection for each of
+them means a new TCP connection and TLS handshake (with client certificate) per
+message. Instead, the StUF clients share a :class:`requests.Session` per service, which
+keeps the connections to the service alive and re-uses them.
+
+Sessions are discarded when the service configuration changes (see
+:mod:`stuf.signals`), or when the client certificate of the service changed in another
+process.
+"""
+import threading
+from typing import Dict, Tuple
+
+from django.conf import settings
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .models import StufService
+
+__all__ = ["get_session", "close_session"]
+
+_sessions: Dict[int, Tuple[tuple, requests.Session]] = {}
+_sessions_lock = threading.Lock()
+
+
+def _create_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_maxsize=settings.STUF_POOL_MAXSIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session(service: StufService) -> requests.Session:
+    """
+    Return the (shared) session to use for requests to the service.
+    """
+    # connections are set up with the client certificate, they can't be re-used
+    # once it changes
+    fingerprint = service.get_cert()
+
+    with _sessions_lock:
+        existing = _sessions.get(service.pk)
+        if existing is not None and existing[0] == fingerprint:
+            return existing[1]
+
+        session = _create_session()
+        _sessions[service.pk] = (fingerprint, session)
+
+    if existing is not None:
+        existing[1].close()
+    return session
+
+
+def close_session(service_pk: int) -> None:
+    with _sessions_lock:
+        existing = _sessions.pop(service_pk, None)
+    if existing is not None:
+        existing[1].close()
@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import StufService
+from .sessions import close_session
+
+
+@receiver(post_save, sender=StufService)
+@receiver(post_delete, sender=StufService)
+def close_stuf_service_session(sender, instance: StufService, **kwargs) -> None:
+    # the connections may have been set up with an outdated configuration
+    close_session(instance.pk)
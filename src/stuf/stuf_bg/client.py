@@ -2,14 +2,14 @@ import logging
 import uuid
 from datetime import timedelta
 
-from django.template import loader
 from django.utils import dateformat, timezone
-
-import requests
+from django.utils.functional import cached_property
 
 from openforms.logging.logevent import stuf_bg_request, stuf_bg_response
 from stuf.constants import SOAP_VERSION_CONTENT_TYPES, EndpointType
+from stuf.messages import render_message
 from stuf.models import StufService
+from stuf.sessions import get_session
 
 from .constants import STUF_BG_EXPIRY_MINUTES
 
@@ -20,14 +20,10 @@ class StufBGClient:
     def __init__(self, service: StufService):
         self.service = service
 
-    def _get_request_base_context(self):
-        referentienummer = uuid.uuid4()
-
-        logger.debug(f"Making StUF-BG request with referentienummer {referentienummer}")
-
+    @cached_property
+    def _base_context(self) -> dict:
+        # the part of the context that is the same for every message
         return {
-            "created": timezone.now(),
-            "expires": timezone.now() + timedelta(minutes=STUF_BG_EXPIRY_MINUTES),
             "username": self.service.user,
             "password": self.service.password,
             "zender_organisatie": self.service.zender_organisatie,
@@ -38,8 +34,20 @@ class StufBGClient:
             "ontvanger_applicatie": self.service.ontvanger_applicatie,
             "ontvanger_administratie": self.service.ontvanger_administratie,
             "ontvanger_gebruiker": self.service.ontvanger_gebruiker,
+        }
+
+    def _get_request_base_context(self):
+        referentienummer = uuid.uuid4()
+
+        logger.debug(f"Making StUF-BG request with referentienummer {referentienummer}")
+
+        now = timezone.now()
+        return {
+            **self._base_context,
+            "created": now,
+            "expires": now + timedelta(minutes=STUF_BG_EXPIRY_MINUTES),
             "referentienummer": referentienummer,
-            "tijdstip_bericht": dateformat.format(timezone.now(), "YmdHis"),
+            "tijdstip_bericht": dateformat.format(now, "YmdHis"),
         }
 
     def _make_request(self, data):
@@ -48,7 +56,7 @@ class StufBGClient:
         logger.debug("StUF BG client request.\nurl: %s\ndata: %s", url, data)
         stuf_bg_request(self.service, url)
 
-        response = requests.post(
+        response = get_session(self.service).post(
             url,
             data=data,
             headers={
@@ -58,6 +66,7 @@ class StufBGClient:
             },
             cert=self.service.get_cert(),
             auth=self.service.get_auth(),
+            timeout=self.service.get_timeout(),
         )
 
         logger.debug(
@@ -75,7 +84,7 @@ class StufBGClient:
             context.update({attribute: attribute})
         context.update({"bsn": bsn})
 
-        return loader.render_to_string("stuf_bg/StufBgRequest.xml", context)
+        return render_message("stuf_bg/StufBgRequest.xml", context)
 
     def get_values_for_attributes(self, bsn, attributes):
 
@@ -1,15 +1,17 @@
 import base64
 import logging
+import math
 import os
+import uuid
 from collections import OrderedDict
 from datetime import timedelta
-from typing import Tuple
+from functools import lru_cache
+from typing import Iterator, Optional, Tuple
 
-from django.template import loader
+from django.core.files import File
 from django.utils import timezone
-from django.utils.safestring import mark_safe
+from django.utils.functional import cached_property
 
-import requests
 from defusedxml.lxml import fromstring as df_fromstring
 from lxml import etree
 from lxml.etree import Element
@@ -30,7 +32,9 @@ from stuf.constants import (
     EndpointType,
     SOAPVersion,
 )
+from stuf.messages import render_message
 from stuf.models import StufService
+from stuf.sessions import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +56,9 @@ DATE_FORMAT = "%Y%m%d"
 TIME_FORMAT = "%H%M%S"
 DATETIME_FORMAT = "%Y%m%d%H%M%S"
 
+# marks the position of the message in the rendered SOAP envelope
+ENVELOPE_CONTENT_MARKER = "__soap_envelope_content__"
+
 
 class PaymentStatus:
     """
@@ -89,6 +96,77 @@ def xml_value(xml, xpath, namespaces=nsmap):
         raise ValueError(f"xpath not found {xpath}")
 
 
+@lru_cache(maxsize=64)
+def _get_envelope(
+    soap_version: str,
+    use_wss: bool,
+    username: str,
+    password: str,
+    created: str,
+    expires: str,
+) -> Tuple[str, str]:
+    """
+    Return the rendered SOAP envelope, split at the position of the message.
+
+    The envelope only depends on the service configuration and the (date of the)
+    timestamps, so it is rendered once rather than for every message.
+    """
+    envelope = render_message(
+        "stuf_zds/soap/includes/envelope.xml",
+        {
+            "soap_version": soap_version,
+            "soap_use_wss": use_wss,
+            "wss_username": username,
+            "wss_password": password,
+            "wss_created": created,
+            "wss_expires": expires,
+            "content": ENVELOPE_CONTENT_MARKER,
+        },
+    )
+    prefix, _, suffix = envelope.rpartition(ENVELOPE_CONTENT_MARKER)
+    return prefix, suffix
+
+
+class StreamingSOAPBody:
+    """
+    SOAP request body with base64 encoded file content, generated while sending.
+
+    The file is read and encoded in chunks, so that only a single chunk of the
+    (potentially large) file is in memory at any time. The body can be iterated over
+    more than once - every iteration reads the file from the start.
+    """
+
+    # a multiple of 3, so that the encoded chunks can be concatenated (no padding)
+    chunk_size = 3 * 64 * 1024
+
+    def __init__(self, prefix: str, content: File, suffix: str):
+        self.prefix = prefix.encode("utf-8")
+        self.content = content
+        self.suffix = suffix.encode("utf-8")
+
+    def __len__(self):
+        # known upfront, so the body is sent with a Content-Length header
+        encoded_size = 4 * math.ceil(self.content.size / 3)
+        return len(self.prefix) + encoded_size + len(self.suffix)
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield self.prefix
+
+        self.content.seek(0)
+        remainder = b""
+        while chunk := self.content.read(self.chunk_size):
+            # the file may return less than requested, keep the bytes that can't be
+            # encoded without padding for the next chunk
+            chunk = remainder + chunk
+            cutoff = len(chunk) - len(chunk) % 3
+            chunk, remainder = chunk[:cutoff], chunk[cutoff:]
+            yield base64.b64encode(chunk)
+        if remainder:
+            yield base64.b64encode(remainder)
+
+        yield self.suffix
+
+
 class StufZDSClient:
     def __init__(self, service: StufService, options):
         """
@@ -99,7 +177,9 @@ class StufZDSClient:
 
         self._global_config = GlobalConfiguration.get_solo()
 
-    def _get_request_base_context(self):
+    @cached_property
+    def _base_context(self) -> dict:
+        # the part of the context that is the same for every message
         return {
             "zender_organisatie": self.service.zender_organisatie,
             "zender_applicatie": self.service.zender_applicatie,
@@ -109,9 +189,6 @@ class StufZDSClient:
             "ontvanger_applicatie": self.service.ontvanger_applicatie,
             "ontvanger_gebruiker": self.service.ontvanger_gebruiker,
             "ontvanger_administratie": self.service.ontvanger_administratie,
-            "tijdstip_bericht": fmt_soap_datetime(timezone.now()),
-            "tijdstip_registratie": fmt_soap_datetime(timezone.now()),
-            "datum_vandaag": fmt_soap_date(timezone.now()),
             "gemeentecode": self.options["gemeentecode"],
             "zds_zaaktype_code": self.options["zds_zaaktype_code"],
             "zds_zaaktype_omschrijving": self.options["zds_zaaktype_omschrijving"],
@@ -127,24 +204,35 @@ class StufZDSClient:
             "global_config": self._global_config,
         }
 
+    def _get_request_base_context(self):
+        now = timezone.now()
+        return {
+            **self._base_context,
+            "tijdstip_bericht": fmt_soap_datetime(now),
+            "tijdstip_registratie": fmt_soap_datetime(now),
+            "datum_vandaag": fmt_soap_date(now),
+        }
+
     def _wrap_soap_envelope(self, xml_str: str) -> str:
-        return loader.render_to_string(
-            "stuf_zds/soap/includes/envelope.xml",
-            {
-                "soap_version": self.service.soap_version,
-                "soap_use_wss": (
-                    self.service.endpoint_security
-                    in [EndpointSecurity.wss, EndpointSecurity.wss_basicauth]
-                ),
-                "wss_username": self.service.user,
-                "wss_password": self.service.password,
-                "wss_created": fmt_soap_date(timezone.now()),
-                "wss_expires": fmt_soap_date(
-                    timezone.now() + timedelta(minutes=STUF_ZDS_EXPIRY_MINUTES)
-                ),
-                "content": mark_safe(xml_str),
-            },
+        now = timezone.now()
+        prefix, suffix = _get_envelope(
+            soap_version=self.service.soap_version,
+            use_wss=(
+                self.service.endpoint_security
+                in [EndpointSecurity.wss, EndpointSecurity.wss_basicauth]
+            ),
+            username=self.service.user,
+            password=self.service.password,
+            created=fmt_soap_date(now),
+            expires=fmt_soap_date(now + timedelta(minutes=STUF_ZDS_EXPIRY_MINUTES)),
         )
+        return f"{prefix}{xml_str}{suffix}"
+
+    def build_message(self, template_name: str, context: dict) -> str:
+        """
+        Render the message and wrap it in the SOAP envelope.
+        """
+        return self._wrap_soap_envelope(render_message(template_name, context))
 
     def _make_request(
         self,
@@ -152,18 +240,31 @@ class StufZDSClient:
         context: dict,
         endpoint_type,
         soap_action: str = "",
+        content: Optional[File] = None,
     ) -> Tuple[Response, Element]:
+        """
+        Make the SOAP request.
 
-        request_body = loader.render_to_string(template_name, context)
-        request_data = self._wrap_soap_envelope(request_body)
+        :param content: a file to send base64 encoded as the ``inhoud`` of the
+          message. It is streamed rather than rendered into the request body.
+        """
+        if content is not None:
+            placeholder = f"__inhoud_{uuid.uuid4().hex}__"
+            context = {**context, "inhoud": placeholder}
+
+        request_data = self.build_message(template_name, context)
 
         url = self.service.get_endpoint(endpoint_type)
 
         logger.debug("SOAP-request:\n%s\n%s", url, request_data)
 
+        if content is not None:
+            prefix, suffix = request_data.split(placeholder)
+            request_data = StreamingSOAPBody(prefix, content, suffix)
+
         try:
             stuf_zds_request(self.service, url)
-            response = requests.post(
+            response = get_session(self.service).post(
                 url,
                 data=request_data,
                 headers={
@@ -174,6 +275,7 @@ class StufZDSClient:
                 },
                 auth=self.service.get_auth(),
                 cert=self.service.get_cert(),
+                timeout=self.service.get_timeout(),
             )
             if response.status_code < 200 or response.status_code >= 400:
                 logger.debug("SOAP-response:\n%s", response.content)
@@ -311,10 +413,6 @@ class StufZDSClient:
         """
         template = "stuf_zds/soap/voegZaakdocumentToe.xml"
 
-        submission_report.content.seek(0)
-
-        base64_body = base64.b64encode(submission_report.content.read()).decode()
-
         context = self._get_request_base_context()
         context.update(
             {
@@ -325,7 +423,6 @@ class StufZDSClient:
                 "titel": "inzending",
                 "auteur": "open-forms",
                 "taal": "nld",
-                "inhoud": base64_body,
                 "status": "definitief",
                 "bestandsnaam": f"open-forms-inzending.pdf",
                 # TODO: Use name in filename
@@ -342,6 +439,7 @@ class StufZDSClient:
             context,
             endpoint_type=EndpointType.ontvang_asynchroon,
             soap_action="voegZaakdocumentToe_Lk01",
+            content=submission_report.content,
         )
 
         return None
@@ -354,10 +452,6 @@ class StufZDSClient:
         """
         template = "stuf_zds/soap/voegZaakdocumentToe.xml"
 
-        submission_attachment.content.seek(0)
-
-        base64_body = base64.b64encode(submission_attachment.content.read()).decode()
-
         context = self._get_request_base_context()
         context.update(
             {
@@ -366,7 +460,6 @@ class StufZDSClient:
                 "titel": "bijlage",
                 "auteur": "open-forms",
                 "taal": "nld",
-                "inhoud": base64_body,
                 "status": "definitief",
                 "bestandsnaam": submission_attachment.get_display_name(),
                 "formaat": submission_attachment.content_type,
@@ -379,6 +472,7 @@ class StufZDSClient:
             context,
             endpoint_type=EndpointType.ontvang_asynchroon,
             soap_action="voegZaakdocumentToe_Lk01",
+            content=submission_attachment.content,
         )
 
         return None
@@ -1,7 +1,9 @@
+import base64
 import uuid
 
+from django.core.files.base import ContentFile
 from django.template import loader
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 
 import requests_mock
 from freezegun import freeze_time
@@ -19,7 +21,13 @@ from openforms.submissions.tests.factories import (
 from stuf.constants import SOAPVersion
 from stuf.tests.factories import StufServiceFactory
 
-from ..client import PaymentStatus, StufZDSClient, nsmap
+from ..client import (
+    PaymentStatus,
+    StreamingSOAPBody,
+    StufZDSClient,
+    _get_envelope,
+    nsmap,
+)
 
 
 def load_mock(name, context=None):
@@ -28,17 +36,24 @@ def load_mock(name, context=None):
     ).encode("utf8")
 
 
+def get_request_text(request) -> str:
+    # documents are sent as a streamed request body
+    if isinstance(request.body, StreamingSOAPBody):
+        return b"".join(request.body).decode("utf8")
+    return request.text or ""
+
+
 def match_text(text):
     # requests_mock matcher for SOAP requests
     def _matcher(request):
-        return text in (request.text or "")
+        return text in get_request_text(request)
 
     return _matcher
 
 
 def xml_from_request_history(m, index) -> ElementTree:
     request = m.request_history[index]
-    xml = etree.fromstring(bytes(request.text, encoding="utf8"))
+    xml = etree.fromstring(bytes(get_request_text(request), encoding="utf8"))
     return xml
 
 
@@ -239,6 +254,7 @@ class StufZDSClientTests(StufTestBase):
         identificatie = self.client.create_zaak_identificatie()
 
         self.assertEqual(identificatie, "foo")
+        self.assertEqual(m.last_request.timeout, (10, 60))
 
         xml_doc = xml_from_request_history(m, 0)
         self.assertSoapXMLCommon(xml_doc)
@@ -265,6 +281,27 @@ class StufZDSClientTests(StufTestBase):
             1,
         )
 
+    def test_soap_envelope_is_rendered_once(self, m):
+        m.post(
+            self.service.soap_service.url,
+            content=load_mock(
+                "genereerZaakIdentificatie.xml",
+                {
+                    "zaak_identificatie": "foo",
+                },
+            ),
+        )
+        _get_envelope.cache_clear()
+
+        self.client.create_zaak_identificatie()
+        self.client.create_zaak_identificatie()
+
+        self.assertEqual(_get_envelope.cache_info().misses, 1)
+        self.assertEqual(m.request_history[0].text, m.request_history[1].text)
+        xml_doc = xml_from_request_history(m, 1)
+        self.assertSoapXMLCommon(xml_doc)
+        self.assertXPathExists(xml_doc, "//zkn:genereerZaakIdentificatie_Di02")
+
     def test_create_zaak(self, m):
         m.post(
             self.service.soap_service.url,
@@ -432,6 +469,7 @@ class StufZDSClientTests(StufTestBase):
         submission_attachment = SubmissionFileAttachmentFactory.create(
             file_name="my-attachment.doc",
             content_type="application/msword",
+            content__data=b"some attachment content",
         )
 
         self.client.create_zaak_attachment(
@@ -450,6 +488,7 @@ class StufZDSClientTests(StufTestBase):
                 "//zkn:object/zkn:identificatie": "bar",
                 "//zkn:object/zkn:dct.omschrijving": "dt-omschrijving",
                 "//zkn:object/zkn:inhoud/@stuf:bestandsnaam": "my-attachment.doc",
+                "//zkn:object/zkn:inhoud": "c29tZSBhdHRhY2htZW50IGNvbnRlbnQ=",
                 "//zkn:object/zkn:formaat": "application/msword",
                 "//zkn:object/zkn:isRelevantVoor/zkn:gerelateerde/zkn:identificatie": "foo",
                 "//zkn:object/zkn:isRelevantVoor/zkn:gerelateerde/zkn:omschrijving": "my-form",
@@ -586,3 +625,34 @@ class StufZDSClientTests(StufTestBase):
             ).count(),
             1,
         )
+
+
+class StreamingSOAPBodyTests(SimpleTestCase):
+    def test_content_is_encoded_in_chunks(self):
+        data = bytes(range(256)) * 10 + b"tail"
+        body = StreamingSOAPBody("<inhoud>", ContentFile(data), "</inhoud>")
+        body.chunk_size = 30
+
+        chunks = list(body)
+
+        self.assertGreater(len(chunks), 3)
+        self.assertEqual(
+            b"".join(chunks),
+            b"<inhoud>" + base64.b64encode(data) + b"</inhoud>",
+        )
+        self.assertEqual(len(body), len(b"".join(chunks)))
+
+    def test_short_reads(self):
+        class ShortReadFile(ContentFile):
+            def read(self, size=-1):
+                return super().read(min(size, 7))
+
+        data = b"x" * 100
+        body = StreamingSOAPBody("", ShortReadFile(data), "")
+
+        self.assertEqual(b"".join(body), base64.b64encode(data))
+
+    def test_body_can_be_iterated_again(self):
+        body = StreamingSOAPBody("<a>", ContentFile(b"content"), "</a>")
+
+        self.assertEqual(b"".join(body), b"".join(body))
@@ -0,0 +1,40 @@
+from unittest.mock import patch
+
+from django.test import TestCase
+
+from ..sessions import close_session, get_session
+from .factories import StufServiceFactory
+
+
+class StufSessionTests(TestCase):
+    def setUp(self):
+        super().setUp()
+
+        self.service = StufServiceFactory.create()
+        self.addCleanup(close_session, self.service.pk)
+
+    def test_session_is_shared(self):
+        session = get_session(self.service)
+
+        self.assertIs(get_session(self.service), session)
+        self.assertIsNot(get_session(StufServiceFactory.create()), session)
+
+    def test_session_closed_on_configuration_change(self):
+        session = get_session(self.service)
+
+        with patch.object(session, "close") as mock_close:
+            self.service.timeout_read = 10
+            self.service.save()
+
+        mock_close.assert_called_once_with()
+        self.assertIsNot(get_session(self.service), session)
+
+    def test_new_session_for_other_certificate(self):
+        session = get_session(self.service)
+
+        with patch.object(
+            type(self.service), "get_cert", return_value=("cert.pem", "key.pem")
+        ):
+            other_session = get_session(self.service)
+
+        self.assertIsNot(other_session, session)